@@ -16,6 +16,12 @@ class Settings(BaseSettings):
     auto_approve_threshold: float = 0.8  # 자동 승인 점수 기준 (이 점수 이상이면 자동 통과)
     enable_pm_review: bool = False  # PM(기획자) 검토 단계를 켤지 끌지 결정
     enable_conflict_detection: bool = False  # 요구사항 간의 충돌을 감지하는 기능을 켤지 결정
+    conflict_result_cache: bool = False  # 요구사항 목록이 같으면 이전 충돌 감지 결과를 파일 캐시에서 재사용할지 결정
+    parser_claude_concurrency: int = 4  # 파서들이 동시에 보낼 수 있는 최대 Claude 분석 요청 수
+    parser_result_cache: bool = False  # 파서의 Claude 분석 결과를 파일 캐시에 보관해 재실행 시 같은 내용의 분석 호출을 생략할지 결정
+    normalizer_max_concurrency: int = 10  # 정규화 단계에서 동시에 처리할 최대 문서 수
+    normalizer_batch_mode: bool = False  # 정규화 요청을 Message Batches API로 모아 보낼지 결정 (API 키 필요, 비용 절반, 응답 지연)
+    normalizer_result_cache: bool = False  # 정규화 추출 결과를 파일 캐시에 보관해 재실행 시 같은 문서의 Claude 호출을 생략할지 결정
 
     # 입력 유효성 검증 설정
     max_file_size_mb: int = 50
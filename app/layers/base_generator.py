@@ -11,6 +11,7 @@
 """
 
 import logging
+import time
 import uuid
 from abc import ABC, abstractmethod
 from datetime import datetime
@@ -112,18 +113,18 @@ class BaseGenerator(ABC, Generic[InputT, OutputT, ContextT]):
         """
         doc_title = getattr(input_doc, 'title', 'Unknown')
         logger.info(f"[{self._generator_name}] 생성 시작: {doc_title}")
-        start_time = datetime.now()
+        start_time = time.perf_counter()
 
         try:
             result = await self._do_generate(input_doc, context)
 
-            elapsed = (datetime.now() - start_time).total_seconds()
+            elapsed = time.perf_counter() - start_time
             logger.info(f"[{self._generator_name}] 생성 완료: {elapsed:.1f}초")
 
             return result
 
         except Exception as e:
-            elapsed = (datetime.now() - start_time).total_seconds()
+            elapsed = time.perf_counter() - start_time
             logger.error(f"[{self._generator_name}] 생성 실패 ({elapsed:.1f}초): {e}")
             raise
 
@@ -172,13 +173,13 @@ class BaseGenerator(ABC, Generic[InputT, OutputT, ContextT]):
             log_prefix = f"[{self._generator_name}:{section_name}]"
 
         try:
-            start = datetime.now()
+            start = time.perf_counter()
             result = await self.claude_client.complete_json(
                 system_prompt=system_prompt,
                 user_prompt=user_prompt,
                 temperature=temperature,
             )
-            elapsed = (datetime.now() - start).total_seconds()
+            elapsed = time.perf_counter() - start
             logger.debug(f"{log_prefix} Claude JSON 호출 완료: {elapsed:.1f}초")
             return result
 
@@ -213,13 +214,13 @@ class BaseGenerator(ABC, Generic[InputT, OutputT, ContextT]):
             log_prefix = f"[{self._generator_name}:{section_name}]"
 
         try:
-            start = datetime.now()
+            start = time.perf_counter()
             result = await self.claude_client.complete(
                 system_prompt=system_prompt,
                 user_prompt=user_prompt,
                 temperature=temperature,
             )
-            elapsed = (datetime.now() - start).total_seconds()
+            elapsed = time.perf_counter() - start
             logger.debug(f"{log_prefix} Claude 텍스트 호출 완료: {elapsed:.1f}초")
             return result.strip()
 
@@ -12,7 +12,17 @@ from typing import Optional, BinaryIO
 from pathlib import Path
 
 from app.models import InputType, ParsedContent, InputMetadata
-from .mixins import ClaudeAnalysisMixin, MetadataExtractionMixin, StructureDetectionMixin
+from .mixins import (
+    ClaudeAnalysisMixin,
+    MetadataExtractionMixin,
+    StructureDetectionMixin,
+    ANALYSIS_MAX_TOKENS,
+    MIN_ANALYSIS_CHARS,
+    claude_call_limit,
+)
+
+# 이 크기를 넘는 파일은 비싼 전처리(표 렌더링, 통계, 노트/HTML 추출 등)를 건너뜀
+LARGE_FILE_BYTES = 5 * 1024 * 1024
 
 
 class BaseParser(ABC, ClaudeAnalysisMixin, MetadataExtractionMixin, StructureDetectionMixin):
@@ -90,16 +100,9 @@ class BaseParser(ABC, ClaudeAnalysisMixin, MetadataExtractionMixin, StructureDet
     ) -> InputMetadata:
         """
         파일에서 기본적인 메타데이터(파일명, 생성일, 수정일)를 추출하는 함수.
+        MetadataExtractionMixin.extract_file_metadata와 같은 구현을 공유합니다.
         """
-        import os
-        from datetime import datetime
-
-        stat = file_path.stat()
-        return InputMetadata(
-            filename=file_path.name,
-            created_at=datetime.fromtimestamp(stat.st_ctime),
-            modified_at=datetime.fromtimestamp(stat.st_mtime),
-        )
+        return self.extract_file_metadata(file_path)
 
     async def detect_structure(self, content: str) -> dict:
         """
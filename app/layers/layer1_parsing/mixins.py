@@ -9,16 +9,55 @@ Mixin 클래스들을 정의합니다.
 - StructureDetectionMixin: 문서 구조 감지 기능
 """
 
+import asyncio
 import logging
 import hashlib
+import time
+import weakref
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, List, Dict, Any
 
+from app.config import get_settings
 from app.models import InputMetadata
+from app.services.cache import get_file_cache
+from app.utils.tokens import truncate_to_tokens
 
 logger = logging.getLogger(__name__)
 
+# 파서가 Claude 분석 요청에 넣는 문서 내용의 최대 토큰 수
+ANALYSIS_MAX_TOKENS = 6000
+
+# 공백을 뺀 내용이 이보다 짧으면 (제목 슬라이드뿐인 PPT 등) Claude 분석을 생략
+MIN_ANALYSIS_CHARS = 200
+
+# 파서마다 기억해 두는 Claude 분석 결과 수 (같은 내용 재업로드 시 재사용)
+ANALYSIS_CACHE_MAX_ENTRIES = 128
+
+# 분석 결과를 파일 캐시에 보관하는 시간 (parser_result_cache 설정을 켠 경우)
+ANALYSIS_RESULT_CACHE_TTL_HOURS = 7 * 24
+
+# 이벤트 루프별 Claude 호출 제한 세마포어 (asyncio 세마포어는 한 루프에서만 사용 가능)
+_claude_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def claude_call_limit() -> asyncio.Semaphore:
+    """
+    모든 파서가 공유하는 Claude 동시 호출 제한 세마포어를 반환합니다.
+
+    슬라이드/파일 단위 병렬 처리가 겹쳐도 파서 전체의 동시 Claude 요청 수가
+    설정값(parser_claude_concurrency)을 넘지 않게 합니다.
+    """
+    loop = asyncio.get_running_loop()
+    semaphore = _claude_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(get_settings().parser_claude_concurrency)
+        _claude_semaphores[loop] = semaphore
+    return semaphore
+
 
 class ClaudeAnalysisMixin:
     """
@@ -31,13 +70,78 @@ class ClaudeAnalysisMixin:
         - self.claude_client: ClaudeClient 인스턴스
     """
 
+    def should_analyze_with_claude(self, raw_text: str) -> bool:
+        """
+        Claude 분석을 요청할 가치가 있는지 판단합니다.
+
+        클라이언트가 없거나, 공백을 뺀 내용이 MIN_ANALYSIS_CHARS보다 짧으면
+        분석해도 얻을 것이 없으므로 False를 반환합니다.
+        """
+        if not getattr(self, 'claude_client', None):
+            return False
+        return len(raw_text) >= MIN_ANALYSIS_CHARS and len(raw_text.strip()) >= MIN_ANALYSIS_CHARS
+
+    async def request_claude_json(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        temperature: float = 0.2,
+    ) -> dict:
+        """
+        Claude JSON 요청을 파서 공용 동시 호출 제한 안에서 실행합니다.
+
+        같은 프롬프트로 이미 성공한 분석이 있으면 (같은 파일 재업로드 등)
+        Claude를 다시 호출하지 않고 저장된 결과를 반환합니다.
+        parser_result_cache 설정을 켜면 서버를 다시 시작해도 파일 캐시에서 찾습니다.
+
+        Args:
+            system_prompt: 시스템 프롬프트
+            user_prompt: 사용자 프롬프트
+            temperature: 샘플링 온도
+
+        Returns:
+            Claude 응답 (파싱된 JSON)
+        """
+        cache = self.__dict__.setdefault("_analysis_cache", OrderedDict())
+        hasher = hashlib.blake2b(digest_size=16)
+        hasher.update(f"{temperature}\0{system_prompt}\0".encode())
+        hasher.update(user_prompt.encode())
+        key = hasher.digest()
+
+        if key in cache:
+            cache.move_to_end(key)
+            logger.debug("[ClaudeAnalysisMixin] 캐시된 분석 결과 사용")
+            return cache[key]
+
+        file_cache = get_file_cache() if get_settings().parser_result_cache else None
+        file_key = f"analysis_{key.hex()}"
+        result = file_cache.get(file_key) if file_cache is not None else None
+        if result is not None:
+            logger.debug("[ClaudeAnalysisMixin] 파일 캐시된 분석 결과 사용")
+        else:
+            async with claude_call_limit():
+                result = await self.claude_client.complete_json(
+                    system_prompt=system_prompt,
+                    user_prompt=user_prompt,
+                    temperature=temperature,
+                )
+            if result and file_cache is not None:
+                file_cache.set(file_key, result, ttl_hours=ANALYSIS_RESULT_CACHE_TTL_HOURS)
+
+        # 실패(빈 결과)는 저장하지 않아 다음 요청에서 다시 시도
+        if result:
+            cache[key] = result
+            if len(cache) > ANALYSIS_CACHE_MAX_ENTRIES:
+                cache.popitem(last=False)
+        return result
+
     async def analyze_with_claude(
         self,
         content: str,
         analysis_prompt: str,
         system_prompt: str = "문서 분석 전문가로서 응답하세요.",
         temperature: float = 0.2,
-        max_content_length: int = 6000,
+        max_content_tokens: int = ANALYSIS_MAX_TOKENS,
     ) -> dict:
         """
         Claude를 사용하여 문서 내용 분석.
@@ -47,7 +151,7 @@ class ClaudeAnalysisMixin:
             analysis_prompt: 분석 프롬프트 템플릿 ({content} 플레이스홀더 사용)
             system_prompt: 시스템 프롬프트
             temperature: 샘플링 온도
-            max_content_length: 최대 내용 길이 (초과 시 잘림)
+            max_content_tokens: 최대 내용 토큰 수 (초과 시 잘림)
 
         Returns:
             분석 결과 딕셔너리. 실패 시 빈 딕셔너리.
@@ -56,22 +160,22 @@ class ClaudeAnalysisMixin:
             logger.warning("[ClaudeAnalysisMixin] claude_client가 설정되지 않음")
             return {}
 
-        # 내용 길이 제한
-        truncated_content = content[:max_content_length]
-        if len(content) > max_content_length:
-            logger.debug(f"[ClaudeAnalysisMixin] 내용 잘림: {len(content)} -> {max_content_length}")
+        # 내용 길이 제한 (토큰 기준)
+        truncated_content = truncate_to_tokens(content, max_content_tokens)
+        if len(truncated_content) < len(content):
+            logger.debug(f"[ClaudeAnalysisMixin] 내용 잘림: {len(content)} -> {len(truncated_content)}자")
 
         # 프롬프트 생성
         formatted_prompt = analysis_prompt.format(content=truncated_content)
 
         try:
-            start = datetime.now()
-            result = await self.claude_client.complete_json(
+            start = time.perf_counter()
+            result = await self.request_claude_json(
                 system_prompt=system_prompt,
                 user_prompt=formatted_prompt,
                 temperature=temperature,
             )
-            elapsed = (datetime.now() - start).total_seconds()
+            elapsed = time.perf_counter() - start
             logger.debug(f"[ClaudeAnalysisMixin] 분석 완료: {elapsed:.1f}초")
             return result
 
@@ -106,14 +210,15 @@ JSON 배열로 반환:
 
 요구사항 없으면 []반환. JSON만 출력."""
 
-        formatted_prompt = prompt.format(
-            content=content[:5000],
-            context=f"추가 컨텍스트: {additional_context}" if additional_context else ""
+        # {content}는 analyze_with_claude에서 토큰 예산에 맞게 채워지므로 컨텍스트만 미리 채움
+        context = f"추가 컨텍스트: {additional_context}" if additional_context else ""
+        analysis_prompt = prompt.replace(
+            "{context}", context.replace("{", "{{").replace("}", "}}")
         )
 
         result = await self.analyze_with_claude(
             content=content,
-            analysis_prompt=formatted_prompt,
+            analysis_prompt=analysis_prompt,
             system_prompt="소프트웨어 요구사항 분석 전문가로서 응답하세요.",
         )
 
@@ -3,13 +3,17 @@
 입력된 파일의 종류에 맞는 적절한 파서를 찾아서 생성해주는 역할을 합니다.
 """
 
-from typing import Dict, Type, Optional
+import asyncio
+from typing import Dict, List, Type, Optional, Union
 from pathlib import Path
 
-from app.models import InputType
+from app.models import InputType, ParsedContent
 from app.services.claude_client import ClaudeClient, get_claude_client
 from .base_parser import BaseParser
 
+# 여러 파일을 한 번에 파싱할 때 동시에 처리할 최대 파일 수
+PARSE_CONCURRENCY = 4
+
 
 class ParserFactory:
     """
@@ -132,6 +136,40 @@ class ParserFactory:
         parser = self.get_parser(input_type)
         return await parser.parse(file_path)
 
+    async def parse_files(
+        self,
+        file_paths: List[Path],
+        input_types: Optional[List[InputType]] = None,
+        max_concurrency: int = PARSE_CONCURRENCY,
+    ) -> List[Union[ParsedContent, Exception]]:
+        """
+        여러 파일을 동시에 파싱합니다.
+
+        파서마다 기다리는 Claude 분석 호출이 파일 수만큼 차례로 쌓이지 않도록
+        최대 max_concurrency개씩 겹쳐서 실행합니다.
+
+        Returns:
+            입력 순서와 같은 결과 목록. 실패한 파일 자리에는 발생한 예외가 들어갑니다.
+            취소(CancelledError)처럼 Exception이 아닌 예외는 결과에 넣지 않고 다시 발생시킵니다.
+        """
+        if input_types is None:
+            input_types = [self.detect_type(path.name) for path in file_paths]
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def parse_one(file_path: Path, input_type: InputType) -> ParsedContent:
+            async with semaphore:
+                return await self.parse_file(file_path, input_type)
+
+        results = await asyncio.gather(
+            *[parse_one(path, itype) for path, itype in zip(file_paths, input_types)],
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException) and not isinstance(result, Exception):
+                raise result
+        return results
+
     async def parse_bytes(
         self,
         content: bytes,
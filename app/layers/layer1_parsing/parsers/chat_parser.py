@@ -1,14 +1,18 @@
 """Chat/Messenger log parser."""
 
 import json
+import logging
 from pathlib import Path
 from typing import Optional
 from datetime import datetime
 
 from app.models import InputType, ParsedContent, InputMetadata
-from ..base_parser import BaseParser
+from app.utils.tokens import truncate_to_tokens
+from ..base_parser import BaseParser, ANALYSIS_MAX_TOKENS
 from ..prompts.parsing_prompts import CHAT_PARSING_PROMPT
 
+logger = logging.getLogger(__name__)
+
 
 class ChatParser(BaseParser):
     """Parser for chat/messenger conversation logs."""
@@ -57,12 +61,12 @@ class ChatParser(BaseParser):
         }
 
         # Use Claude for intelligent analysis
-        if self.claude_client:
+        if self.should_analyze_with_claude(raw_text):
             try:
                 analysis = await self._analyze_with_claude(raw_text)
                 structured_data["ai_analysis"] = analysis
             except Exception as e:
-                print(f"Claude chat analysis failed: {e}")
+                logger.warning("Claude chat analysis failed: %s", e)
 
         # Build sections
         sections = self._build_sections(messages)
@@ -221,9 +225,9 @@ class ChatParser(BaseParser):
 
     async def _analyze_with_claude(self, raw_text: str) -> dict:
         """Use Claude to analyze chat for requirements."""
-        result = await self.claude_client.complete_json(
+        result = await self.request_claude_json(
             system_prompt=CHAT_PARSING_PROMPT,
-            user_prompt=f"다음 대화 내용을 분석해주세요:\n\n{raw_text[:8000]}",
+            user_prompt=f"다음 대화 내용을 분석해주세요:\n\n{truncate_to_tokens(raw_text, ANALYSIS_MAX_TOKENS)}",
             temperature=0.2,
         )
         return result
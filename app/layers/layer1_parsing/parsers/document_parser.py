@@ -3,13 +3,17 @@
 외부 라이브러리(PyPDF2, python-docx)를 사용하여 텍스트를 추출합니다.
 """
 
+import logging
 from pathlib import Path
 from typing import Optional
 
 from app.models import InputType, ParsedContent, InputMetadata
-from ..base_parser import BaseParser
+from app.utils.tokens import truncate_to_tokens
+from ..base_parser import BaseParser, ANALYSIS_MAX_TOKENS
 from ..prompts.parsing_prompts import DOCUMENT_PARSING_PROMPT
 
+logger = logging.getLogger(__name__)
+
 
 class DocumentParser(BaseParser):
     """Word(.docx) 및 PDF(.pdf) 파일을 처리하는 파서입니다."""
@@ -58,12 +62,12 @@ class DocumentParser(BaseParser):
         }
 
         # AI(Claude) 분석 (가능한 경우)
-        if self.claude_client:
+        if self.should_analyze_with_claude(raw_text):
             try:
                 analysis = await self._analyze_with_claude(raw_text)
                 structured_data["ai_analysis"] = analysis
             except Exception as e:
-                print(f"Claude 문서 분석 실패: {e}")
+                logger.warning("Claude 문서 분석 실패: %s", e)
 
         return ParsedContent(
             raw_text=raw_text,
@@ -118,9 +122,9 @@ class DocumentParser(BaseParser):
 
     async def _analyze_with_claude(self, raw_text: str) -> dict:
         """Claude에게 문서 내용 요약 및 분석을 요청합니다."""
-        result = await self.claude_client.complete_json(
+        result = await self.request_claude_json(
             system_prompt=DOCUMENT_PARSING_PROMPT,
-            user_prompt=f"다음 문서를 분석해주세요:\n\n{raw_text[:8000]}",
+            user_prompt=f"다음 문서를 분석해주세요:\n\n{truncate_to_tokens(raw_text, ANALYSIS_MAX_TOKENS)}",
             temperature=0.2,
         )
         return result
\ No newline at end of file
@@ -2,14 +2,26 @@
 외부 라이브러리(mailparser)를 사용하여 이메일 헤더, 본문, 첨부파일 정보를 추출합니다.
 """
 
+import logging
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 from datetime import datetime
 
 from app.models import InputType, ParsedContent, InputMetadata
-from ..base_parser import BaseParser
+from app.utils.tokens import truncate_to_tokens
+from ..base_parser import BaseParser, ANALYSIS_MAX_TOKENS, LARGE_FILE_BYTES
 from ..prompts.parsing_prompts import EMAIL_PARSING_PROMPT
 
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=None)
+def _get_mailparser():
+    """mailparser 모듈을 처음 사용할 때 한 번만 import 합니다."""
+    import mailparser
+    return mailparser
+
 
 class EmailParser(BaseParser):
     """이메일 및 스레드를 처리하는 파서입니다."""
@@ -28,13 +40,15 @@ class EmailParser(BaseParser):
         metadata: Optional[dict] = None
     ) -> ParsedContent:
         """이메일 파일을 읽어서 내용을 추출합니다."""
-        import mailparser
-
         # 이메일 파싱
-        mail = mailparser.parse_from_file(str(file_path))
+        mail = _get_mailparser().parse_from_file(str(file_path))
+
+        # 큰 메일은 HTML 파트를 건너뛰고 일반 텍스트 본문만 사용
+        is_large = file_path.stat().st_size > LARGE_FILE_BYTES
+        body = self._extract_body(mail, is_large)
 
         # 텍스트 형태의 통합 본문 생성
-        raw_text = self._build_raw_text(mail)
+        raw_text = self._build_raw_text(mail, body)
 
         # 메타데이터 생성
         email_metadata = InputMetadata(
@@ -45,12 +59,12 @@ class EmailParser(BaseParser):
         )
 
         # AI(Claude) 분석 (가능한 경우)
-        structured_data = await self._analyze_email(raw_text)
+        structured_data = await self._analyze_email(mail, raw_text)
 
         # 섹션 구성 (헤더, 본문, 첨부파일)
         sections = [
             {"title": "헤더 정보", "content": self._format_headers(mail)},
-            {"title": "본문", "content": mail.body or ""},
+            {"title": "본문", "content": body},
         ]
 
         if mail.attachments:
@@ -66,7 +80,13 @@ class EmailParser(BaseParser):
             sections=sections,
         )
 
-    def _build_raw_text(self, mail) -> str:
+    def _extract_body(self, mail, is_large: bool) -> str:
+        """본문을 추출합니다. 큰 메일은 HTML 파트 없이 일반 텍스트 파트만 사용합니다."""
+        if is_large and mail.text_plain:
+            return "\n".join(mail.text_plain)
+        return mail.body or ""
+
+    def _build_raw_text(self, mail, body: str) -> str:
         """전체 이메일 내용을 하나의 텍스트로 합칩니다."""
         parts = []
 
@@ -81,7 +101,7 @@ class EmailParser(BaseParser):
 
         # 본문
         parts.append("=== 본문 ===")
-        parts.append(mail.body or "(본문 없음)")
+        parts.append(body or "(본문 없음)")
 
         return "\n".join(parts)
 
@@ -96,34 +116,27 @@ class EmailParser(BaseParser):
         headers.append(f"날짜: {mail.date}")
         return "\n".join(headers)
 
-    async def _analyze_email(self, raw_text: str) -> dict:
+    async def _analyze_email(self, mail, raw_text: str) -> dict:
         """Claude에게 이메일 내용 분석을 요청합니다 (요구사항 추출 용도)."""
-        if not self.claude_client:
-            return self._basic_analysis(raw_text)
+        if not self.should_analyze_with_claude(raw_text):
+            return self._basic_analysis(mail)
 
         try:
-            result = await self.claude_client.complete_json(
+            result = await self.request_claude_json(
                 system_prompt=EMAIL_PARSING_PROMPT,
-                user_prompt=f"다음 이메일을 분석해주세요:\n\n{raw_text[:8000]}",  # 길이 제한
+                user_prompt=f"다음 이메일을 분석해주세요:\n\n{truncate_to_tokens(raw_text, ANALYSIS_MAX_TOKENS)}",
                 temperature=0.2,
             )
             return result
         except Exception as e:
-            print(f"Claude 이메일 분석 실패: {e}")
-            return self._basic_analysis(raw_text)
+            logger.warning("Claude 이메일 분석 실패: %s", e)
+            return self._basic_analysis(mail)
 
-    def _basic_analysis(self, raw_text: str) -> dict:
+    def _basic_analysis(self, mail) -> dict:
         """AI가 없을 때 사용하는 기본 분석 함수"""
-        lines = raw_text.split("\n")
-
-        # 기본 정보 추출
-        subject = ""
-        sender = ""
-        for line in lines:
-            if line.startswith("제목:"):
-                subject = line[3:].strip()
-            elif line.startswith("발신자:"):
-                sender = line[4:].strip()
+        # raw_text를 다시 나눠 읽지 않고 mail 객체에서 바로 추출
+        subject = mail.subject or ""
+        sender = mail.from_[0][1] if mail.from_ else ""
 
         return {
             "thread_summary": subject,
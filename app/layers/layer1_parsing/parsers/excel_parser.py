@@ -3,14 +3,21 @@
 Pandas 라이브러리를 사용하여 데이터를 읽고 표 형태로 변환합니다.
 """
 
+import logging
 from pathlib import Path
 from typing import Optional
 import pandas as pd
 
 from app.models import InputType, ParsedContent, InputMetadata
-from ..base_parser import BaseParser
+from app.utils.tokens import truncate_to_tokens
+from ..base_parser import BaseParser, ANALYSIS_MAX_TOKENS, LARGE_FILE_BYTES
 from ..prompts.parsing_prompts import EXCEL_PARSING_PROMPT
 
+logger = logging.getLogger(__name__)
+
+# 큰 파일에서 시트별로 읽어들일 최대 행 수
+LARGE_FILE_MAX_ROWS = 500
+
 
 class ExcelParser(BaseParser):
     """Excel 및 CSV 데이터를 처리하는 파서입니다."""
@@ -31,21 +38,33 @@ class ExcelParser(BaseParser):
         """파일 내용을 읽어서 구조화된 데이터로 변환합니다."""
         ext = file_path.suffix.lower()
 
+        # 큰 파일은 앞부분 행만 읽고 비싼 전처리(마크다운 변환, 컬럼 통계)를 건너뜀
+        is_large = file_path.stat().st_size > LARGE_FILE_BYTES
+        nrows = LARGE_FILE_MAX_ROWS if is_large else None
+
         # 파일 형식에 따라 Pandas로 읽기
         if ext == ".csv":
-            df_dict = {"Sheet1": pd.read_csv(file_path)}
+            df_dict = {"Sheet1": pd.read_csv(file_path, nrows=nrows)}
             sheet_names = ["Sheet1"]
         else:
             # 엑셀 파일은 모든 시트를 읽음
             xlsx = pd.ExcelFile(file_path)
             sheet_names = xlsx.sheet_names
-            df_dict = {name: pd.read_excel(xlsx, sheet_name=name) for name in sheet_names}
+            df_dict = {
+                name: pd.read_excel(xlsx, sheet_name=name, nrows=nrows)
+                for name in sheet_names
+            }
+
+        # 시트별 표를 한 번만 렌더링하여 본문과 섹션에서 함께 사용
+        rendered = self._render_sheets(df_dict, compact=is_large)
 
         # 텍스트 형태의 통합 본문 생성 (마크다운 표 형식)
-        raw_text = self._build_raw_text(df_dict)
+        raw_text = self._build_raw_text(df_dict, rendered)
 
         # 구조 정보 추출 (컬럼명, 데이터 타입 등)
-        structured_data = self._extract_structured_data(df_dict)
+        structured_data = self._extract_structured_data(df_dict, include_stats=not is_large)
+        if is_large:
+            structured_data["truncated_rows"] = LARGE_FILE_MAX_ROWS
 
         # 메타데이터 생성
         file_metadata = await self.extract_metadata(file_path)
@@ -56,18 +75,18 @@ class ExcelParser(BaseParser):
         for sheet_name, df in df_dict.items():
             sections.append({
                 "title": sheet_name,
-                "content": df.to_string(),
+                "content": rendered[sheet_name],
                 "columns": list(df.columns),
                 "row_count": len(df),
             })
 
         # AI(Claude) 분석 (가능한 경우)
-        if self.claude_client:
+        if self.should_analyze_with_claude(raw_text):
             try:
                 analysis = await self._analyze_with_claude(raw_text)
                 structured_data["ai_analysis"] = analysis
             except Exception as e:
-                print(f"Claude 엑셀 분석 실패: {e}")
+                logger.warning("Claude 엑셀 분석 실패: %s", e)
 
         return ParsedContent(
             raw_text=raw_text,
@@ -76,7 +95,23 @@ class ExcelParser(BaseParser):
             sections=sections,
         )
 
-    def _build_raw_text(self, df_dict: dict) -> str:
+    def _render_sheets(self, df_dict: dict, compact: bool = False) -> dict:
+        """
+        시트별 표를 텍스트로 렌더링합니다.
+        compact가 True면 마크다운 표 대신 CSV 형식으로 빠르게 변환합니다.
+        """
+        rendered = {}
+
+        for sheet_name, df in df_dict.items():
+            if compact:
+                rendered[sheet_name] = df.to_csv(index=False)
+            else:
+                # 마크다운 표 형식으로 변환 (읽기 좋게)
+                rendered[sheet_name] = df.to_markdown(index=False) if hasattr(df, 'to_markdown') else df.to_string()
+
+        return rendered
+
+    def _build_raw_text(self, df_dict: dict, rendered: dict) -> str:
         """모든 시트의 데이터를 하나의 텍스트로 합칩니다."""
         parts = []
 
@@ -85,15 +120,16 @@ class ExcelParser(BaseParser):
             parts.append(f"컬럼: {', '.join(df.columns.astype(str))}")
             parts.append(f"행 수: {len(df)}")
             parts.append("")
-
-            # 마크다운 표 형식으로 변환 (읽기 좋게)
-            parts.append(df.to_markdown(index=False) if hasattr(df, 'to_markdown') else df.to_string())
+            parts.append(rendered[sheet_name])
             parts.append("")
 
         return "\n".join(parts)
 
-    def _extract_structured_data(self, df_dict: dict) -> dict:
-        """데이터의 통계 정보를 추출합니다."""
+    def _extract_structured_data(self, df_dict: dict, include_stats: bool = True) -> dict:
+        """
+        데이터의 통계 정보를 추출합니다.
+        include_stats가 False면 컬럼별 집계(고유값 수, 샘플)를 건너뜁니다.
+        """
         sheets_info = {}
 
         for sheet_name, df in df_dict.items():
@@ -104,13 +140,15 @@ class ExcelParser(BaseParser):
                 col_info = {
                     "name": str(col),
                     "dtype": str(col_data.dtype),
-                    "non_null_count": int(col_data.notna().sum()),
-                    "unique_count": int(col_data.nunique()),
                 }
 
-                # 샘플 데이터 5개 추출
-                sample = col_data.dropna().head(5).tolist()
-                col_info["sample_values"] = [str(v) for v in sample]
+                if include_stats:
+                    col_info["non_null_count"] = int(col_data.notna().sum())
+                    col_info["unique_count"] = int(col_data.nunique())
+
+                    # 샘플 데이터 5개 추출
+                    sample = col_data.dropna().head(5).tolist()
+                    col_info["sample_values"] = [str(v) for v in sample]
 
                 # 요구사항 관련 컬럼인지 추측 (키워드 매칭)
                 col_lower = str(col).lower()
@@ -133,9 +171,9 @@ class ExcelParser(BaseParser):
 
     async def _analyze_with_claude(self, raw_text: str) -> dict:
         """Claude에게 엑셀 데이터 분석을 요청합니다 (요구사항 추출 용도)."""
-        result = await self.claude_client.complete_json(
+        result = await self.request_claude_json(
             system_prompt=EXCEL_PARSING_PROMPT,
-            user_prompt=f"다음 엑셀 데이터를 분석해주세요:\n\n{raw_text[:8000]}",
+            user_prompt=f"다음 엑셀 데이터를 분석해주세요:\n\n{truncate_to_tokens(raw_text, ANALYSIS_MAX_TOKENS)}",
             temperature=0.2,
         )
         return result
\ No newline at end of file
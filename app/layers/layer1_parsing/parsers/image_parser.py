@@ -1,12 +1,34 @@
 """Image file parser with OCR using Claude Vision."""
 
+import asyncio
+import io
+import re
 from pathlib import Path
 from typing import Optional
 
+from app.exceptions import ClaudeClientError
 from app.models import InputType, ParsedContent, InputMetadata
-from ..base_parser import BaseParser
+from app.services.claude_client import parse_json_response
+from ..base_parser import BaseParser, claude_call_limit
 from ..prompts.parsing_prompts import IMAGE_PARSING_PROMPT
 
+# Claude Vision resizes images to roughly this long-edge size server-side
+VISION_MAX_DIMENSION = 1568
+
+# Start of a JSON object in a Vision answer: "{" followed by a key string or "}"
+# (descriptive text such as "{주석}" is not handed to the JSON parser)
+_JSON_OBJECT_START_RE = re.compile(r'\{\s*["}]')
+
+# File extension -> media type sent to Claude Vision
+_MEDIA_TYPE_MAP = {
+    ".png": "image/png",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".gif": "image/gif",
+    ".bmp": "image/bmp",
+    ".webp": "image/webp",
+}
+
 
 class ImageParser(BaseParser):
     """Parser for image files using Claude Vision for OCR and analysis."""
@@ -31,15 +53,7 @@ class ImageParser(BaseParser):
 
         # Determine media type
         ext = file_path.suffix.lower()
-        media_type_map = {
-            ".png": "image/png",
-            ".jpg": "image/jpeg",
-            ".jpeg": "image/jpeg",
-            ".gif": "image/gif",
-            ".bmp": "image/bmp",
-            ".webp": "image/webp",
-        }
-        media_type = media_type_map.get(ext, "image/png")
+        media_type = _MEDIA_TYPE_MAP.get(ext, "image/png")
 
         # Get image dimensions
         dimensions = self._get_image_dimensions(image_data)
@@ -112,24 +126,33 @@ class ImageParser(BaseParser):
     async def _analyze_with_vision(self, image_data: bytes, media_type: str, file_path: Path = None) -> dict:
         """Analyze image using Claude Vision API."""
         try:
-            response = await self.claude_client.analyze_image(
-                system_prompt=IMAGE_PARSING_PROMPT,
-                image_data=image_data,
-                media_type=media_type,
-                additional_context="이 이미지에서 요구사항 관련 정보를 추출해주세요.",
-                image_path=str(file_path) if file_path else None,
+            # Send a downscaled copy instead of the original file when it is larger
+            # than what Vision actually uses
+            downscaled = await asyncio.to_thread(
+                self._downscale_for_vision, image_data, media_type
             )
+            if downscaled:
+                image_data, media_type = downscaled
+                file_path = None
+
+            async with claude_call_limit():
+                response = await self.claude_client.analyze_image(
+                    system_prompt=IMAGE_PARSING_PROMPT,
+                    image_data=image_data,
+                    media_type=media_type,
+                    additional_context="이 이미지에서 요구사항 관련 정보를 추출해주세요.",
+                    image_path=str(file_path) if file_path else None,
+                )
 
-            # Try to parse as JSON
-            try:
-                import json
-                # Find JSON in response
-                start = response.find("{")
-                end = response.rfind("}") + 1
-                if start >= 0 and end > start:
-                    return json.loads(response[start:end])
-            except (json.JSONDecodeError, ValueError, KeyError):
-                pass
+            # Parse JSON answers with the shared Claude response parser
+            # (orjson, skips text before the object and ignores text after it)
+            if _JSON_OBJECT_START_RE.search(response):
+                try:
+                    result = parse_json_response(response)
+                except ClaudeClientError:
+                    result = None
+                if isinstance(result, dict) and result:
+                    return result
 
             # Return as text analysis
             return {
@@ -149,6 +172,45 @@ class ImageParser(BaseParser):
                 "inferred_requirements": [],
             }
 
+    def _downscale_for_vision(
+        self,
+        image_data: bytes,
+        media_type: str,
+    ) -> Optional[tuple[bytes, str]]:
+        """
+        Shrink the image to VISION_MAX_DIMENSION on the long edge.
+
+        WebP is always re-encoded as PNG. GIFs are left untouched to keep animation.
+
+        Returns:
+            (image bytes, media type) of the re-encoded image, or None to use the original.
+        """
+        if media_type == "image/gif":
+            return None
+
+        try:
+            from PIL import Image
+        except ImportError:
+            return None
+
+        try:
+            img = Image.open(io.BytesIO(image_data))
+            if max(img.size) <= VISION_MAX_DIMENSION and media_type != "image/webp":
+                return None
+
+            img.thumbnail((VISION_MAX_DIMENSION, VISION_MAX_DIMENSION), Image.LANCZOS)
+            buf = io.BytesIO()
+            if media_type == "image/jpeg":
+                if img.mode not in ("RGB", "L"):
+                    img = img.convert("RGB")
+                img.save(buf, format="JPEG", quality=85, optimize=True)
+            else:
+                img.save(buf, format="PNG", optimize=True)
+                media_type = "image/png"
+            return buf.getvalue(), media_type
+        except Exception:
+            return None
+
     def _build_raw_text(self, analysis: dict) -> str:
         """Build raw text from analysis results."""
         parts = []
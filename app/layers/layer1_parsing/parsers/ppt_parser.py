@@ -3,13 +3,116 @@
 python-pptx 라이브러리를 사용하여 슬라이드 텍스트, 표, 노트 내용을 추출합니다.
 """
 
+import asyncio
+import logging
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
 from app.models import InputType, ParsedContent, InputMetadata
-from ..base_parser import BaseParser
+from app.utils.tokens import truncate_to_tokens
+from ..base_parser import BaseParser, ANALYSIS_MAX_TOKENS, LARGE_FILE_BYTES
 from ..prompts.parsing_prompts import PPT_PARSING_PROMPT
 
+logger = logging.getLogger(__name__)
+
+# 슬라이드 XML을 python-pptx 도형 객체 없이 직접 읽을 때 쓰는 네임스페이스/태그
+_A = "{http://schemas.openxmlformats.org/drawingml/2006/main}"
+_P = "{http://schemas.openxmlformats.org/presentationml/2006/main}"
+
+_SHAPE_TREE_PATH = f"{_P}cSld/{_P}spTree"
+_P_SP_TAG = f"{_P}sp"
+_P_PIC_TAG = f"{_P}pic"
+_P_GRAPHIC_FRAME_TAG = f"{_P}graphicFrame"
+_P_TXBODY_TAG = f"{_P}txBody"
+_A_P_TAG = f"{_A}p"
+_A_BR_TAG = f"{_A}br"
+_A_T_TAG = f"{_A}t"
+
+# 도형의 플레이스홀더 요소 (nvSpPr/nvPicPr 등 첫 자식 아래)
+_PLACEHOLDER_PATH = f"*/{_P}nvPr/{_P}ph"
+
+# 동영상 도형은 p:pic이지만 그림이 아님
+_VIDEO_FILE_PATH = f"{_P}nvPicPr/{_P}nvPr/{_A}videoFile"
+
+# 표를 담은 graphicFrame의 graphicData
+_GRAPHIC_DATA_PATH = f"{_A}graphic/{_A}graphicData"
+_TABLE_URI = "http://schemas.openxmlformats.org/drawingml/2006/table"
+_A_TBL_TAG = f"{_A}tbl"
+_A_TR_TAG = f"{_A}tr"
+_A_TC_TAG = f"{_A}tc"
+
+# 제목 플레이스홀더 타입: TITLE, CENTER_TITLE (플레이스홀더 type 속성 기본값은 "obj")
+_TITLE_PH_TYPES = frozenset({"title", "ctrTitle"})
+
+# 폴백 분석에서 사용하는 키워드 → 주제 매핑
+_KEYWORD_TOPICS = {
+    "시스템": "시스템 구축",
+    "플랫폼": "플랫폼 개발",
+    "데이터": "데이터 관리",
+    "사용자": "사용자 경험",
+    "보안": "보안 요구사항",
+    "성능": "성능 최적화",
+    "통합": "시스템 통합",
+    "API": "API 개발",
+    "모바일": "모바일 앱",
+    "웹": "웹 서비스",
+    "관리": "관리 시스템",
+    "자동화": "프로세스 자동화",
+    "계량": "계량 시스템",
+    "IoT": "IoT 연동",
+    "스마트": "스마트 시스템",
+}
+
+
+@lru_cache(maxsize=None)
+def _get_presentation_class():
+    """python-pptx의 Presentation 클래스를 처음 사용할 때 한 번만 import 합니다."""
+    from pptx import Presentation
+    return Presentation
+
+
+def warm_up_presentation_loader() -> None:
+    """
+    python-pptx import와 기본 템플릿 로딩을 미리 수행합니다.
+
+    python-pptx는 모듈 전역 lxml 파서를 모든 파일에 재사용하므로 파일마다 다시 만들
+    파서는 없고, 비용은 처음 한 번의 import/초기화에 몰려 있습니다. 서버 시작 시
+    백그라운드에서 호출해 첫 PPT 업로드가 이 지연을 떠안지 않게 합니다.
+    """
+    _get_presentation_class()()
+
+
+def _paragraph_text(p) -> str:
+    """
+    문단(a:p) 텍스트. python-pptx와 같이 줄바꿈(a:br)은 세로 탭으로 표시합니다.
+
+    문단 안의 a:t는 텍스트 런(a:r)과 필드(a:fld)에만 있으므로, 런 요소를 거치지 않고
+    a:t / a:br만 문서 순서대로 훑습니다.
+    """
+    return "".join([
+        "\v" if elm.tag == _A_BR_TAG else (elm.text or "")
+        for elm in p.iter(_A_T_TAG, _A_BR_TAG)
+    ])
+
+
+def _text_body_text(tx_body) -> str:
+    """텍스트 본문(txBody)의 전체 텍스트 (문단은 줄바꿈으로 구분)."""
+    return "\n".join(_paragraph_text(p) for p in tx_body.iterchildren(_A_P_TAG))
+
+
+def _cell_text(tc) -> str:
+    """표 셀(a:tc) 텍스트. 셀의 문단은 모두 텍스트 본문 안에 있으므로 바로 훑습니다."""
+    return "\n".join([_paragraph_text(p) for p in tc.iter(_A_P_TAG)]).strip()
+
+
+def _table_text(tbl) -> str:
+    """표(a:tbl) 요소 내용을 텍스트(파이프 | 구분)로 변환합니다."""
+    return "\n".join(
+        " | ".join([_cell_text(tc) for tc in tr.iterchildren(_A_TC_TAG)])
+        for tr in tbl.iterchildren(_A_TR_TAG)
+    )
+
 
 class PPTParser(BaseParser):
     """프레젠테이션 파일을 처리하는 파서입니다."""
@@ -28,23 +131,36 @@ class PPTParser(BaseParser):
         metadata: Optional[dict] = None
     ) -> ParsedContent:
         """PPT 파일을 파싱하여 내용을 추출합니다."""
-        from pptx import Presentation
+        # 파일 로드 (이벤트 루프를 막지 않도록 별도 스레드에서)
+        prs = await asyncio.to_thread(_get_presentation_class(), str(file_path))
+
+        # 큰 파일은 발표자 노트 추출을 건너뜀
+        include_notes = file_path.stat().st_size <= LARGE_FILE_BYTES
 
-        # 파일 로드
-        prs = Presentation(str(file_path))
+        # 슬라이드별 데이터 추출 (CPU 작업이므로 이벤트 루프 밖에서 실행)
+        slides_data = await asyncio.to_thread(
+            self._extract_all_slides, prs.slides, include_notes
+        )
 
-        # 슬라이드별 데이터 추출
-        slides_data = []
-        for i, slide in enumerate(prs.slides, 1):
-            slide_info = self._extract_slide_content(slide, i)
-            slides_data.append(slide_info)
+        slide_count = len(slides_data)
 
         # 텍스트 형태의 통합 본문 생성
         raw_text = self._build_raw_text(slides_data)
 
-        # 메타데이터 생성
-        file_metadata = await self.extract_metadata(file_path)
-        file_metadata.slide_count = len(prs.slides)
+        # AI(Claude) 분석은 본문만 있으면 되므로 먼저 시작하고, 나머지 조립과 겹쳐 실행
+        analysis_task = (
+            asyncio.create_task(self._analyze_with_claude(raw_text))
+            if self.should_analyze_with_claude(raw_text) else None
+        )
+
+        try:
+            # 메타데이터 생성
+            file_metadata = await self.extract_metadata(file_path)
+        except BaseException:
+            if analysis_task:
+                analysis_task.cancel()
+            raise
+        file_metadata.slide_count = slide_count
 
         # 슬라이드별 섹션 생성
         sections = [
@@ -57,22 +173,25 @@ class PPTParser(BaseParser):
 
         # 구조 데이터 생성
         structured_data = {
-            "slide_count": len(prs.slides),
+            "slide_count": slide_count,
             "slides": slides_data,
         }
 
-        # AI(Claude) 분석 (가능한 경우)
-        if self.claude_client:
+        # AI(Claude) 분석 결과 수집 (가능한 경우)
+        if analysis_task:
             try:
-                analysis = await self._analyze_with_claude(raw_text)
+                analysis = await analysis_task
                 if analysis and isinstance(analysis, dict) and analysis:
                     structured_data["ai_analysis"] = analysis
                 else:
                     # AI 분석 실패 시 슬라이드 내용에서 직접 분석 데이터 생성
                     structured_data["ai_analysis"] = self._create_fallback_analysis(slides_data)
             except Exception as e:
-                print(f"Claude PPT 분석 실패: {e}")
+                logger.warning("Claude PPT 분석 실패: %s", e)
                 structured_data["ai_analysis"] = self._create_fallback_analysis(slides_data)
+        elif self.claude_client:
+            # 내용이 너무 적어 AI 분석을 생략한 경우에도 슬라이드 기반 분석은 제공
+            structured_data["ai_analysis"] = self._create_fallback_analysis(slides_data)
 
         return ParsedContent(
             raw_text=raw_text,
@@ -81,34 +200,73 @@ class PPTParser(BaseParser):
             sections=sections,
         )
 
-    def _extract_slide_content(self, slide, slide_number: int) -> dict:
-        """단일 슬라이드에서 텍스트와 표 내용을 추출합니다."""
+    def _extract_all_slides(self, slides, include_notes: bool = True) -> list:
+        """모든 슬라이드 내용을 슬라이드 순서대로 추출합니다."""
+        return [
+            self._extract_slide_content(slide, i, include_notes)
+            for i, slide in enumerate(slides, 1)
+        ]
+
+    def _extract_slide_content(
+        self,
+        slide,
+        slide_number: int,
+        include_notes: bool = True,
+    ) -> dict:
+        """
+        단일 슬라이드에서 텍스트와 표 내용을 추출합니다.
+
+        도형마다 python-pptx 도형 객체와 속성을 거치지 않고 슬라이드 XML(spTree)의
+        최상위 도형 요소를 직접 읽습니다. 그룹 도형 안의 내용은 기존과 같이 제외됩니다.
+        """
         title = ""
         content_parts = []
         notes = ""
+        has_images = False
+
+        shape_tree = slide.element.find(_SHAPE_TREE_PATH)
+        shape_elements = (
+            shape_tree.iterchildren(_P_SP_TAG, _P_PIC_TAG, _P_GRAPHIC_FRAME_TAG)
+            if shape_tree is not None else ()
+        )
+
+        for elm in shape_elements:
+            tag = elm.tag
 
-        for shape in slide.shapes:
             # 텍스트 상자 처리
-            if shape.has_text_frame:
-                text = shape.text_frame.text.strip()
+            if tag == _P_SP_TAG:
+                tx_body = elm.find(_P_TXBODY_TAG)
+                if tx_body is None:
+                    continue
+                text = _text_body_text(tx_body).strip()
                 if text:
                     # 제목 추정: 플레이스홀더 타입이 제목인 경우
-                    if not title and shape.is_placeholder:
-                        if hasattr(shape, 'placeholder_format'):
-                            ph_type = shape.placeholder_format.type
-                            # TITLE(1), CENTER_TITLE(3) 타입
-                            if ph_type in [1, 3]:
-                                title = text
-                                continue
+                    if not title:
+                        ph = elm.find(_PLACEHOLDER_PATH)
+                        if ph is not None and ph.get("type", "obj") in _TITLE_PH_TYPES:
+                            title = text
+                            continue
                     content_parts.append(text)
 
+            # 그림 포함 여부 (플레이스홀더 그림과 동영상은 제외)
+            elif tag == _P_PIC_TAG:
+                if (
+                    not has_images
+                    and elm.find(_PLACEHOLDER_PATH) is None
+                    and elm.find(_VIDEO_FILE_PATH) is None
+                ):
+                    has_images = True
+
             # 표 처리
-            if shape.has_table:
-                table_text = self._extract_table(shape.table)
-                content_parts.append(table_text)
+            else:
+                graphic_data = elm.find(_GRAPHIC_DATA_PATH)
+                if graphic_data is not None and graphic_data.get("uri") == _TABLE_URI:
+                    tbl = graphic_data.find(_A_TBL_TAG)
+                    if tbl is not None:
+                        content_parts.append(_table_text(tbl))
 
         # 발표자 노트 추출
-        if slide.has_notes_slide:
+        if include_notes and slide.has_notes_slide:
             notes_frame = slide.notes_slide.notes_text_frame
             if notes_frame:
                 notes = notes_frame.text.strip()
@@ -118,23 +276,14 @@ class PPTParser(BaseParser):
             "title": title or f"슬라이드 {slide_number}",
             "content": "\n".join(content_parts),
             "notes": notes,
-            "has_images": any(
-                shape.shape_type == 13  # 그림 타입
-                for shape in slide.shapes
-                if hasattr(shape, 'shape_type')
-            ),
+            "has_images": has_images,
         }
 
-    def _extract_table(self, table) -> str:
-        """표 내용을 텍스트(파이프 | 구분)로 변환합니다."""
-        rows = []
-        for row in table.rows:
-            cells = [cell.text.strip() for cell in row.cells]
-            rows.append(" | ".join(cells))
-        return "\n".join(rows)
-
     def _build_raw_text(self, slides_data: list) -> str:
-        """모든 슬라이드 내용을 하나의 텍스트로 합칩니다."""
+        """
+        모든 슬라이드 내용을 하나의 텍스트로 합칩니다.
+        슬라이드 본문/노트 문자열을 복사하지 않고 참조만 모아서 마지막에 한 번만 합칩니다.
+        """
         parts = []
 
         for slide in slides_data:
@@ -142,16 +291,17 @@ class PPTParser(BaseParser):
             if slide['content']:
                 parts.append(slide['content'])
             if slide['notes']:
-                parts.append(f"\n[발표자 노트]\n{slide['notes']}")
+                parts.append("\n[발표자 노트]")
+                parts.append(slide['notes'])
             parts.append("")
 
         return "\n".join(parts)
 
     async def _analyze_with_claude(self, raw_text: str) -> dict:
         """Claude에게 PPT 내용 분석을 요청합니다."""
-        result = await self.claude_client.complete_json(
+        result = await self.request_claude_json(
             system_prompt=PPT_PARSING_PROMPT,
-            user_prompt=f"다음 PPT 내용을 분석해주세요:\n\n{raw_text[:8000]}",
+            user_prompt=f"다음 PPT 내용을 분석해주세요:\n\n{truncate_to_tokens(raw_text, ANALYSIS_MAX_TOKENS)}",
             temperature=0.2,
         )
         return result
@@ -166,25 +316,7 @@ class PPTParser(BaseParser):
 
         # 키워드 기반 주제 감지
         topics = []
-        keyword_topics = {
-            "시스템": "시스템 구축",
-            "플랫폼": "플랫폼 개발",
-            "데이터": "데이터 관리",
-            "사용자": "사용자 경험",
-            "보안": "보안 요구사항",
-            "성능": "성능 최적화",
-            "통합": "시스템 통합",
-            "API": "API 개발",
-            "모바일": "모바일 앱",
-            "웹": "웹 서비스",
-            "관리": "관리 시스템",
-            "자동화": "프로세스 자동화",
-            "계량": "계량 시스템",
-            "IoT": "IoT 연동",
-            "스마트": "스마트 시스템",
-        }
-
-        for keyword, topic in keyword_topics.items():
+        for keyword, topic in _KEYWORD_TOPICS.items():
             if keyword in all_content or any(keyword in t for t in titles):
                 topics.append(topic)
 
@@ -2,11 +2,48 @@
 텍스트 파일(.txt)과 마크다운 파일(.md) 파서입니다.
 """
 
+import asyncio
+import mmap
+import re
 from pathlib import Path
 from typing import Optional
 
+import aiofiles
+
 from app.models import InputType, ParsedContent, InputMetadata
-from ..base_parser import BaseParser
+from ..base_parser import BaseParser, LARGE_FILE_BYTES
+
+# 구조에 영향을 주는 줄(코드 블록 ```, # 헤더, === / --- 밑줄)만 찾는 패턴.
+# 문서 전체를 한 번에 훑어 나머지 줄은 파이썬에서 하나씩 보지 않습니다.
+# 헤더는 '#' 기호들(레벨)과 제목을 그룹으로 바로 얻습니다.
+_STRUCTURE_RE = re.compile(
+    r"^[^\S\n]*(?:"
+    r"(?P<fence>```)"
+    r"|(?P<header>#+)[^\S\n]*(?P<title>[^\n]*)"
+    r"|(?P<setext>=+|-+)[^\S\n]*$"
+    r")",
+    re.MULTILINE,
+)
+
+# 공백이 아닌 문자 (첫 헤더 전의 'Introduction' 본문 시작 위치 탐색용)
+_NON_BLANK_RE = re.compile(r"\S")
+
+
+def _read_text_mmap(file_path: Path) -> str:
+    """
+    큰 텍스트 파일을 메모리 맵으로 읽어 문자열로 디코딩합니다.
+
+    파일 전체를 bytes로 한 번 더 복사하지 않고 매핑된 페이지에서 바로 디코딩하므로
+    최대 메모리 사용량이 줄어듭니다. 줄바꿈은 텍스트 모드 읽기와 같이 '\n'으로 통일합니다.
+    """
+    with open(file_path, "rb") as f:
+        if f.seek(0, 2) == 0:
+            return ""
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            text = str(mm, "utf-8", "ignore")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
 
 
 class TextParser(BaseParser):
@@ -26,9 +63,13 @@ class TextParser(BaseParser):
         metadata: Optional[dict] = None
     ) -> ParsedContent:
         """텍스트 파일을 읽어서 내용을 추출합니다."""
-        # 파일 읽기 (UTF-8 인코딩)
-        with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-            raw_text = f.read()
+        # 파일 읽기 (UTF-8 인코딩, 이벤트 루프를 막지 않도록 비동기로)
+        if file_path.stat().st_size > LARGE_FILE_BYTES:
+            # 큰 파일은 메모리 맵으로 읽어 중간 bytes 복사본을 만들지 않음
+            raw_text = await asyncio.to_thread(_read_text_mmap, file_path)
+        else:
+            async with aiofiles.open(file_path, "r", encoding="utf-8", errors="ignore") as f:
+                raw_text = await f.read()
 
         # 메타데이터 추출
         file_metadata = await self.extract_metadata(file_path)
@@ -40,13 +81,11 @@ class TextParser(BaseParser):
         # 문서 구조 감지 (헤더 등)
         structure = await self.detect_structure(raw_text)
 
-        # 구조 정보를 바탕으로 섹션 나누기
-        sections = []
-        for sec in structure.get("sections", []):
-            sections.append({
-                "title": sec["title"],
-                "content": "\n".join(sec.get("content", [])),
-            })
+        # 구조 정보를 바탕으로 섹션 나누기 (본문은 이미 원문에서 잘라낸 문자열)
+        sections = [
+            {"title": sec["title"], "content": sec["content"]}
+            for sec in structure.get("sections", [])
+        ]
 
         return ParsedContent(
             raw_text=raw_text,
@@ -63,69 +102,125 @@ class TextParser(BaseParser):
         """
         마크다운 문법을 고려하여 문서 구조를 파악합니다.
         (예: # 헤더, 코드 블록 ``` 등)
+
+        문서를 줄 단위로 나누지 않고 정규식으로 구조 줄만 찾은 뒤,
+        섹션 본문은 구조 줄 사이의 원문 구간을 잘라 이어 붙입니다.
         """
-        lines = content.split("\n")
         sections = []
         current_section = None
+        body_start = 0  # 현재 섹션 본문이 시작하는 위치
+        scan_from = 0  # 섹션이 없을 때 'Introduction' 본문을 찾기 시작할 위치
         in_code_block = False # 코드 블록 안인지 여부 체크
 
-        for i, line in enumerate(lines):
-            stripped = line.strip()
+        # 위치 -> 줄 번호 변환 (위치는 항상 증가하는 순서로 요청됨)
+        counted_pos = counted_line = 0
+
+        def line_number(pos: int) -> int:
+            nonlocal counted_pos, counted_line
+            counted_line += content.count("\n", counted_pos, pos)
+            counted_pos = pos
+            return counted_line
+
+        # 본문에 넣지 않는 줄: 코드 블록 표시(```) 줄과 제목이 없어 헤더로 인정되지 않은 밑줄(===, ---) 줄
+        dropped_lines = []  # 현재 섹션 본문 안의 (줄 시작, 줄 끝) 목록
+
+        def close_section(body_end: int, drop_last_line: bool = False) -> None:
+            # 제외할 줄 사이의 연속된 줄 묶음들을 줄바꿈으로 이어 붙임
+            # drop_last_line: 밑줄 헤더의 제목 줄로 쓰인, 본문에 남은 마지막 줄을 제외
+            runs = []
+            start = body_start
+            for dropped_start, dropped_end in dropped_lines:
+                if dropped_start > start:
+                    runs.append(content[start:dropped_start - 1])
+                start = dropped_end + 1
+            if start <= body_end:
+                runs.append(content[start:body_end])
+            if drop_last_line and runs:
+                cut = runs[-1].rfind("\n")
+                if cut == -1:
+                    runs.pop()
+                else:
+                    runs[-1] = runs[-1][:cut]
+            current_section["content"] = "\n".join(runs)
+            sections.append(current_section)
+
+        def open_introduction(until: int) -> None:
+            # 첫 헤더가 나오기 전의 내용은 'Introduction' 섹션으로 간주
+            nonlocal current_section, body_start
+            text = _NON_BLANK_RE.search(content, scan_from, until)
+            if text:
+                body_start = content.rfind("\n", 0, text.start()) + 1
+                current_section = {
+                    "title": "Introduction",
+                    "level": 1,
+                    "start_line": line_number(body_start),
+                }
+
+        for match in _STRUCTURE_RE.finditer(content):
+            line_start = match.start()
+            line_end = content.find("\n", line_start)
+            if line_end == -1:
+                line_end = len(content)
 
             # 코드 블록 감지 (```)
-            if stripped.startswith("```"):
+            if match.group("fence"):
+                if not current_section and not in_code_block:
+                    open_introduction(line_start)
                 in_code_block = not in_code_block
+                if current_section:
+                    dropped_lines.append((line_start, line_end))
+                else:
+                    scan_from = line_end
                 continue
 
             # 코드 블록 안 내용은 헤더로 인식하지 않음
             if in_code_block:
-                if current_section:
-                    current_section["content"].append(line)
                 continue
 
+            if not current_section:
+                open_introduction(line_start)
+
             # 마크다운 헤더 감지 (#, ##, ...)
-            if stripped.startswith("#"):
-                level = len(stripped) - len(stripped.lstrip("#"))
-                title = stripped.lstrip("#").strip()
+            if match.group("header"):
                 if current_section:
-                    sections.append(current_section)
+                    close_section(line_start - 1)
                 current_section = {
-                    "title": title,
-                    "level": level,
-                    "start_line": i,
-                    "content": []
+                    "title": match.group("title").strip(),
+                    "level": len(match.group("header")),
+                    "start_line": line_number(line_start),
                 }
-            # 밑줄 스타일 헤더 감지 (===, ---)
-            elif i > 0 and stripped and set(stripped) in [{"="}, {"-"}]:
-                prev_line = lines[i-1].strip()
-                if prev_line and len(prev_line) < 100:
-                    if current_section:
-                        # 이전 줄은 내용이 아니라 제목이었으므로 내용에서 제거
-                        if current_section["content"]:
-                            current_section["content"].pop()
-                        sections.append(current_section)
-                    current_section = {
-                        "title": prev_line,
-                        "level": 1 if "=" in stripped else 2,
-                        "start_line": i - 1,
-                        "content": []
-                    }
-            elif current_section:
-                current_section["content"].append(line)
-            elif stripped:
-                # 첫 헤더가 나오기 전의 내용은 'Introduction' 섹션으로 간주
+                body_start = line_end + 1
+                dropped_lines = []
+                continue
+
+            # 밑줄 스타일 헤더 감지 (===, ---): 바로 윗줄이 제목 (첫 줄은 일반 내용)
+            if line_start == 0:
+                continue
+            prev_start = content.rfind("\n", 0, line_start - 1) + 1
+            prev_line = content[prev_start:line_start - 1].strip()
+            if prev_line and len(prev_line) < 100:
+                if current_section:
+                    # 이전 줄은 내용이 아니라 제목이었으므로 본문에서 제외
+                    close_section(line_start - 1, drop_last_line=True)
                 current_section = {
-                    "title": "Introduction",
-                    "level": 1,
-                    "start_line": i,
-                    "content": [line]
+                    "title": prev_line,
+                    "level": 1 if match.group("setext")[0] == "=" else 2,
+                    "start_line": line_number(prev_start),
                 }
+                body_start = line_end + 1
+                dropped_lines = []
+            elif current_section:
+                dropped_lines.append((line_start, line_end))
+            else:
+                scan_from = line_end
 
+        if not current_section and not in_code_block:
+            open_introduction(len(content))
         if current_section:
-            sections.append(current_section)
+            close_section(len(content))
 
         return {
             "sections": sections,
-            "line_count": len(lines),
+            "line_count": content.count("\n") + 1,
             "char_count": len(content),
-        }
\ No newline at end of file
+        }
@@ -8,27 +8,328 @@
 """
 
 import asyncio
-from typing import List, Optional
-import uuid
+import functools
+import hashlib
+import itertools
+from collections import OrderedDict
+from typing import Iterator, List, Optional, Tuple
 import logging
-from datetime import datetime
+import re
+import time
 
+from app.config import get_settings
 from app.models import (
     ParsedContent,
     NormalizedRequirement,
     RequirementType,
     Priority,
-    SourceReference,
 )
-from app.services import ClaudeClient, get_claude_client
+from app.services import (
+    ClaudeBatchClient,
+    ClaudeClient,
+    FileCache,
+    JSON_RESPONSE_RULES,
+    build_prompt,
+    get_claude_client,
+    get_file_cache,
+)
+from app.utils.tokens import estimate_tokens, truncate_to_tokens
 from .prompts.normalization_prompts import (
     REQUIREMENT_EXTRACTION_PROMPT,
-    USER_STORY_CONVERSION_PROMPT,
+    REQUIREMENT_EXTRACTION_FORMAT,
+    REQUIREMENT_BATCH_EXTRACTION_FORMAT,
     CONFIDENCE_SCORING_PROMPT,
 )
 
 logger = logging.getLogger(__name__)
 
+# 요구사항 추출 호출마다 동일한 지침(역할 + 응답 형식)을 한 번만 합쳐 둠
+# 문서별로 바뀌는 내용은 모두 이 고정 지침 뒤에 붙음
+EXTRACTION_SYSTEM_PROMPT = f"{REQUIREMENT_EXTRACTION_PROMPT}\n\n{REQUIREMENT_EXTRACTION_FORMAT}"
+BATCH_EXTRACTION_SYSTEM_PROMPT = (
+    f"{REQUIREMENT_EXTRACTION_PROMPT}\n\n{REQUIREMENT_BATCH_EXTRACTION_FORMAT}"
+)
+
+# 문서별 입력 구분자 - 섹션이 없어도 항상 넣어서 입력 구조가 문서마다 같게 유지
+_DOCUMENT_DELIMITER = "===DOCUMENT===\n"
+_SECTIONS_DELIMITER = "\n\n===SECTIONS===\n"
+
+# 이 개수 이상의 요구사항은 별도 스레드에서 변환 (다른 문서의 AI 호출 대기를 막지 않도록)
+CONVERT_IN_THREAD_MIN_ITEMS = 50
+
+# 같은 문서를 다시 정규화할 때 재사용할 Claude 추출 결과 수
+EXTRACTION_CACHE_MAX_ENTRIES = 128
+
+# 파일 캐시에 저장한 추출 결과의 버전과 유지 시간
+# 버전 = 응답 해석 방식 개정 번호(바꾸면 직접 올림) + 고정 프롬프트 전체의 해시
+# (지침, 응답 형식, CLI 공통 문구 중 하나라도 바뀌면 이전 결과를 자동으로 무효화)
+_EXTRACTION_RESULT_REVISION = "v1"
+
+
+def _extraction_prompt_version(system_prompts: Tuple[str, ...]) -> str:
+    """추출 요청의 고정 부분(지침, CLI 공통 문구, 문서 구분자)으로 캐시 버전을 만듭니다."""
+    parts = [build_prompt(prompt, "", JSON_RESPONSE_RULES) for prompt in system_prompts]
+    parts += [_DOCUMENT_DELIMITER, _SECTIONS_DELIMITER]
+    digest = hashlib.blake2b("\0".join(parts).encode(), digest_size=8).hexdigest()
+    return f"{_EXTRACTION_RESULT_REVISION}-{digest}"
+
+
+EXTRACTION_PROMPT_VERSION = _extraction_prompt_version(
+    (EXTRACTION_SYSTEM_PROMPT, BATCH_EXTRACTION_SYSTEM_PROMPT)
+)
+EXTRACTION_RESULT_CACHE_TTL_HOURS = 7 * 24
+
+
+def _message_batch_cache_prompt(model: str) -> str:
+    """
+    Message Batches 추출 결과의 캐시 키에 쓸 지침 부분입니다.
+    배치 요청은 CLI 공통 문구 없이 응답 형식을 user 메시지 뒤에 붙이고 모델을 직접 지정하므로,
+    전송 방식과 모델을 넣어 CLI 결과와 캐시 항목을 나눕니다.
+    """
+    return "\0".join(("message_batch", model, EXTRACTION_SYSTEM_PROMPT, JSON_RESPONSE_RULES))
+
+
+# 문서 하나의 AI 입력 토큰 예산 (본문 / 섹션 요약)
+EXTRACTION_CONTENT_MAX_TOKENS = 3500
+EXTRACTION_SECTIONS_MAX_TOKENS = 800
+
+# 본문과 섹션 내용이 모두 이 글자 수(앞뒤 공백 제외) 이하인 문서는 AI를 호출하지 않고 건너뜀
+# (직접 추출 폴백이 섹션을 요구사항으로 보는 최소 길이와 같음)
+EXTRACTION_MIN_CONTENT_CHARS = 10
+
+# 섹션 요약에 넣을 최대 섹션 수와 섹션별 최대 글자 수
+EXTRACTION_MAX_SECTIONS = 8
+EXTRACTION_SECTION_PREVIEW_CHARS = 300
+
+# 내용이 거의 같은 섹션(반복 머리말, 목차 중복 등)은 섹션 요약에서 한 번만 보냄
+# 앞쪽 섹션부터 최대 이만큼 살펴보고, 단어 묶음 SimHash(64비트)가 이 비트 수 이하로 다르면 중복
+EXTRACTION_SECTION_SCAN_LIMIT = EXTRACTION_MAX_SECTIONS * 4
+SECTION_DUPLICATE_MAX_DISTANCE = 4
+_SIMHASH_SHINGLE_WORDS = 5
+# 재시도/재정규화 때 같은 섹션의 SimHash를 다시 계산하지 않도록 기억할 미리보기 수
+# (미리보기는 EXTRACTION_SECTION_PREVIEW_CHARS자 이하라 메모리 부담이 작음)
+_SIMHASH_CACHE_SIZE = 512
+
+# 작은 문서 묶음 처리: 한 번의 AI 호출에 담을 입력 토큰 예산과 최대 문서 수
+# (문서 하나의 입력이 위 예산으로 제한되므로 짧은 문서끼리만 묶임)
+BATCH_TOKEN_BUDGET = 6000
+BATCH_MAX_DOCUMENTS = 5
+
+# AI 응답이 없을 때 원문에서 제목 줄(앞 공백 뒤 ===, ---, # 로 시작)을 찾는 패턴
+# 줄바꿈 문자로 시작해야 정규식 엔진이 줄 시작만 빠르게 건너뛰며 검사함
+_FALLBACK_HEADER_RE = re.compile(r"\n[^\S\n]*(?====|---|#)")
+# 제목 줄에서 떼어 낼 표식/공백 문자
+_FALLBACK_TITLE_STRIP_CHARS = "=- #"
+# 제목별 설명(최대 500자)을 만들 때 먼저 정리해 보는 본문 앞부분 길이
+_FALLBACK_BODY_SCAN_CHARS = 4096
+
+
+def _find_fallback_headers(text: str) -> List[int]:
+    """원문에서 제목 줄 표식(===, ---, #)이 시작하는 위치를 순서대로 찾습니다."""
+    # 첫 줄도 같은 패턴으로 찾도록 앞에 줄바꿈을 붙이고 위치를 1씩 보정
+    return [m.end() - 1 for m in _FALLBACK_HEADER_RE.finditer("\n" + text)]
+
+
+# 출력 토큰을 줄이려고 추출 응답 형식에서 쓰는 짧은 키 -> 요구사항 필드 이름
+_LONG_KEYS = {
+    "t": "title",
+    "d": "description",
+    "ty": "type",
+    "p": "priority",
+    "cs": "confidence_score",
+    "cr": "confidence_reason",
+    "us": "user_story",
+    "ac": "acceptance_criteria",
+    "as": "assumptions",
+    "mi": "missing_info",
+    "sn": "section_name",
+}
+
+# AI 응답의 type/priority 값 중 그대로 쓰면 되는 값 (대부분의 응답이 여기에 해당)
+_TYPE_MAP = {
+    "FR": RequirementType.FUNCTIONAL,
+    "FUNCTIONAL": RequirementType.FUNCTIONAL,
+    "NFR": RequirementType.NON_FUNCTIONAL,
+    "NON_FUNCTIONAL": RequirementType.NON_FUNCTIONAL,
+    "NON-FUNCTIONAL": RequirementType.NON_FUNCTIONAL,
+    "CONSTRAINT": RequirementType.CONSTRAINT,
+}
+_PRIORITY_MAP = {
+    "HIGH": Priority.HIGH,
+    "MEDIUM": Priority.MEDIUM,
+    "LOW": Priority.LOW,
+}
+
+
+# AI 응답 값 종류는 몇 가지뿐이므로 표에 없는 값의 판단 결과도 기억해 둠
+_PARSE_CACHE_SIZE = 64
+
+
+@functools.lru_cache(maxsize=_PARSE_CACHE_SIZE)
+def _parse_requirement_type(value: str) -> RequirementType:
+    """type 값을 RequirementType으로 변환합니다 (표에 없으면 포함된 단어로 판단)."""
+    req_type = _TYPE_MAP.get(value)
+    if req_type is not None:
+        return req_type
+
+    # 대소문자/공백만 다른 값은 표에서 찾음
+    type_str = value.strip().upper()
+    req_type = _TYPE_MAP.get(type_str)
+    if req_type is not None:
+        return req_type
+
+    logger.debug("[convert] 표에 없는 type 값: %r", value)
+    if "NFR" in type_str or "NON" in type_str:
+        return RequirementType.NON_FUNCTIONAL
+    if "CONSTRAINT" in type_str:
+        return RequirementType.CONSTRAINT
+    return RequirementType.FUNCTIONAL
+
+
+@functools.lru_cache(maxsize=_PARSE_CACHE_SIZE)
+def _parse_priority(value: str) -> Priority:
+    """priority 값을 Priority로 변환합니다 (표에 없으면 포함된 단어로 판단)."""
+    priority = _PRIORITY_MAP.get(value)
+    if priority is not None:
+        return priority
+
+    # 대소문자/공백만 다른 값은 표에서 찾음
+    priority_str = value.strip().upper()
+    priority = _PRIORITY_MAP.get(priority_str)
+    if priority is not None:
+        return priority
+
+    logger.debug("[convert] 표에 없는 priority 값: %r", value)
+    if "HIGH" in priority_str:
+        return Priority.HIGH
+    if "LOW" in priority_str:
+        return Priority.LOW
+    return Priority.MEDIUM
+
+
+# 재시도/재정규화 때 본문 자르기를 다시 하지 않도록 기억할 문서 수
+# (원문 문자열을 붙잡아 두므로 작게 유지)
+_CONTENT_TRUNCATE_CACHE_SIZE = 16
+
+
+@functools.lru_cache(maxsize=_CONTENT_TRUNCATE_CACHE_SIZE)
+def _truncate_content(raw_text: str) -> str:
+    """
+    문서 본문을 추출 입력 토큰 예산만큼 자릅니다.
+    문자열은 해시값을 스스로 기억하므로 같은 본문의 두 번째 조회부터는 비용이 거의 없습니다.
+    """
+    return truncate_to_tokens(raw_text, EXTRACTION_CONTENT_MAX_TOKENS)
+
+
+def _expand_short_keys(raw: dict) -> dict:
+    """짧은 키로 온 요구사항 딕셔너리를 긴 필드 이름으로 바꿉니다 (긴 키만 있으면 그대로)."""
+    if _LONG_KEYS.keys().isdisjoint(raw):
+        return raw
+    return {_LONG_KEYS.get(key, key): value for key, value in raw.items()}
+
+
+def _section_text(content) -> str:
+    """
+    섹션 내용을 문자열로 돌려줍니다.
+    Layer 1 파서들은 항상 문자열을 넣으므로 문자열을 먼저 확인하고,
+    줄 목록(예전 구조 감지 형식)이나 다른 값일 때만 변환합니다.
+    """
+    if isinstance(content, str):
+        return content
+    if isinstance(content, list):
+        return "\n".join(map(str, content))
+    return str(content)
+
+
+def _section_preview(content) -> str:
+    """섹션 내용(문자열 또는 목록)의 앞부분을 문자열로 돌려줍니다."""
+    return _section_text(content)[:EXTRACTION_SECTION_PREVIEW_CHARS]
+
+
+@functools.lru_cache(maxsize=_SIMHASH_CACHE_SIZE)
+def _simhash(text: str) -> int:
+    """
+    텍스트의 64비트 SimHash를 계산합니다.
+    연속 단어 묶음(shingle)마다 해시를 구하고, 비트 위치별로 1이 과반인 비트만 1로 둡니다.
+    섹션 입력 문자열을 만드는 비용의 대부분이므로 미리보기 문자열 기준으로 결과를 기억합니다.
+    """
+    words = text.split()
+    if len(words) <= _SIMHASH_SHINGLE_WORDS:
+        shingles = [" ".join(words)]
+    else:
+        shingles = [
+            " ".join(words[i:i + _SIMHASH_SHINGLE_WORDS])
+            for i in range(len(words) - _SIMHASH_SHINGLE_WORDS + 1)
+        ]
+
+    rows = [
+        format(int.from_bytes(
+            hashlib.blake2b(shingle.encode(), digest_size=8).digest(), "big"
+        ), "064b")
+        for shingle in shingles
+    ]
+    half = len(rows) / 2
+    signature = 0
+    for column in zip(*rows):
+        signature = (signature << 1) | (column.count("1") > half)
+    return signature
+
+
+def _iter_distinct_sections(sections: list) -> Iterator[Tuple[str, str]]:
+    """
+    앞쪽 섹션부터 (제목, 내용 앞부분)을 최대 EXTRACTION_MAX_SECTIONS개 돌려줍니다.
+    앞에서 보낸 섹션과 내용이 거의 같은 섹션은 건너뜁니다 (내용 없는 섹션은 제목만이라도 보냄).
+    """
+    kept_signatures = []
+    count = 0
+    for section in sections[:EXTRACTION_SECTION_SCAN_LIMIT]:
+        preview = _section_preview(section.get("content", ""))
+        if preview.strip():
+            signature = _simhash(preview)
+            if any(
+                bin(signature ^ kept).count("1") <= SECTION_DUPLICATE_MAX_DISTANCE
+                for kept in kept_signatures
+            ):
+                continue
+            kept_signatures.append(signature)
+
+        yield section.get("title", "Section"), preview
+        count += 1
+        if count >= EXTRACTION_MAX_SECTIONS:
+            return
+
+
+def _join_stripped_lines(text: str) -> str:
+    """각 줄의 앞뒤 공백을 정리하고 빈 줄을 뺀 뒤 다시 줄바꿈으로 잇습니다."""
+    return "\n".join(filter(None, map(str.strip, text.split("\n"))))
+
+
+def _iter_fallback_sections(text: str) -> Iterator[Tuple[str, str]]:
+    """
+    원문을 제목 줄 기준으로 나눠 (제목, 설명)을 순서대로 돌려줍니다.
+    제목이나 본문이 비어 있는 부분은 건너뜁니다.
+    """
+    # 제목 줄 위치만 먼저 찾고, 본문은 다음 제목 줄 전까지 잘라서 사용
+    headers = _find_fallback_headers(text)
+    body_ends = headers[1:] + [len(text)]
+
+    for header, body_end in zip(headers, body_ends):
+        title_end = text.find("\n", header, body_end)
+        if title_end == -1:
+            title_end = body_end
+        title = text[header:title_end].strip().strip(_FALLBACK_TITLE_STRIP_CHARS)
+        if not title:
+            continue
+
+        # 설명은 500자까지만 쓰므로 본문 앞부분만 정리해 보고 부족할 때만 전체 정리
+        body = text[title_end:body_end]
+        description = _join_stripped_lines(body[:_FALLBACK_BODY_SCAN_CHARS])
+        if len(description) < 500 and len(body) > _FALLBACK_BODY_SCAN_CHARS:
+            description = _join_stripped_lines(body)
+
+        if description:
+            yield title, description
+
 
 class Normalizer:
     """
@@ -36,94 +337,406 @@ class Normalizer:
     최적화된 방식(한 번의 AI 호출로 모든 정보 추출)을 사용합니다.
     """
 
-    def __init__(self, claude_client: Optional[ClaudeClient] = None):
-        """AI 클라이언트 초기화"""
+    def __init__(
+        self,
+        claude_client: Optional[ClaudeClient] = None,
+        max_concurrency: Optional[int] = None,
+        batch_client: Optional[ClaudeBatchClient] = None,
+        result_cache: Optional[FileCache] = None,
+    ):
+        """
+        AI 클라이언트 초기화
+
+        Args:
+            claude_client: 사용할 Claude 클라이언트 (없으면 공용 클라이언트)
+            max_concurrency: 동시에 처리할 최대 문서 수 (없으면 설정값 사용)
+            batch_client: 배치 모드에서 쓸 클라이언트 (없으면 처음 필요할 때 생성)
+            result_cache: 추출 결과를 재실행 간에도 보관할 파일 캐시
+                (없으면 설정에 따라 공용 파일 캐시 사용 또는 사용 안 함)
+        """
         self.claude_client = claude_client or get_claude_client()
+        self.max_concurrency = max_concurrency or get_settings().normalizer_max_concurrency
+        self.batch_mode = get_settings().normalizer_batch_mode
+        self._batch_client = batch_client
+        # 프롬프트 해시 -> Claude 추출 결과 (LRU, 재시도/재정규화 시 API 호출 생략)
+        self._extraction_cache: "OrderedDict[bytes, object]" = OrderedDict()
+        if result_cache is None and get_settings().normalizer_result_cache:
+            result_cache = get_file_cache()
+        self._result_cache = result_cache
 
     async def normalize(
         self,
         parsed_contents: List[ParsedContent],
         context: dict = None,
-        document_ids: List[str] = None
+        document_ids: List[str] = None,
+        batch_mode: Optional[bool] = None,
     ) -> List[NormalizedRequirement]:
         """
         여러 문서를 한꺼번에 처리하여 요구사항 목록을 만듭니다.
-        문서가 많을 경우 3개씩 동시에 처리하여 시간을 단축합니다.
+        작은 문서들은 한 번의 AI 호출로 묶고, 묶음들을 최대 max_concurrency개씩
+        동시에 처리하여 시간을 단축합니다.
+        AI 입력이 같은 문서가 여러 개면 한 번만 추출하고 나머지는 결과를 복사합니다.
+
+        batch_mode(없으면 설정값)가 켜져 있으면 모든 문서를 Message Batches API
+        요청 하나로 보냅니다. 비용은 절반이지만 결과가 늦게 나오므로 대량/비대화형 작업용입니다.
+        배치 요청이 실패하면 일반 방식으로 다시 처리합니다.
         """
-        logger.info(f"[Normalizer] ===== 정규화 시작 (병렬 처리 버전) =====")
-        logger.info(f"[Normalizer] 처리할 문서 수: {len(parsed_contents)}")
-        start_time = datetime.now()
+        logger.info("[Normalizer] 정규화 시작: 문서 %d개", len(parsed_contents))
+        start_time = time.perf_counter()
 
         # 문서 ID가 없으면 임의로 생성
         if document_ids is None:
             document_ids = [f"doc-{i}" for i in range(len(parsed_contents))]
 
-        # 동시에 실행할 AI 요청 수 제한 (최대 3개)
-        # 너무 많이 동시에 요청하면 API 제한에 걸릴 수 있음
-        semaphore = asyncio.Semaphore(3)
-
-        async def process_document(
-            idx: int,
-            parsed_content: ParsedContent,
-            doc_id: str,
-            start_counter: int
-        ) -> tuple[List[NormalizedRequirement], int]:
-            """내부 함수: 하나의 문서를 처리"""
+        # 문서별 AI 입력을 만들고 토큰 예산 안에서 작은 문서들을 묶음으로 합침
+        # (추출할 내용이 없는 문서는 AI 호출 없이 제외)
+        entries = [
+            (idx, parsed_content, doc_id, self._build_extraction_input(parsed_content))
+            for idx, (parsed_content, doc_id) in enumerate(
+                zip(parsed_contents, document_ids), 1
+            )
+            if self._has_extractable_content(parsed_content)
+        ]
+        if len(entries) < len(parsed_contents):
+            logger.info(
+                "[Normalizer] 내용 없는 문서 %d개 건너뜀", len(parsed_contents) - len(entries)
+            )
+
+        # 같은 입력의 문서는 처음 나온 문서 하나만 추출 (문서 번호 -> 원본 문서 번호)
+        unique_entries = []
+        duplicate_of = {}
+        first_by_input = {}
+        for entry in entries:
+            first_idx = first_by_input.setdefault(entry[3], entry[0])
+            if first_idx == entry[0]:
+                unique_entries.append(entry)
+            else:
+                duplicate_of[entry[0]] = first_idx
+
+        if batch_mode is None:
+            batch_mode = self.batch_mode
+        extracted = None  # 문서 번호 -> 요구사항 목록 (실패한 문서는 없음)
+        if batch_mode and unique_entries:
+            try:
+                outputs = await self._extract_with_message_batch(unique_entries)
+                extracted = {
+                    entry[0]: requirements
+                    for entry, requirements in zip(unique_entries, outputs)
+                }
+            except Exception as e:
+                logger.warning("[Normalizer] 배치 모드 실패, 일반 방식으로 처리: %s: %s", type(e).__name__, e)
+
+        batches = self._pack_documents(unique_entries) if extracted is None else []
+
+        # 동시에 실행할 AI 요청 수 제한 (묶음 수와 설정값 중 작은 값)
+        # 일시적인 호출 실패는 ClaudeClient가 지수 백오프로 재시도함
+        semaphore = asyncio.Semaphore(max(1, min(len(batches), self.max_concurrency)))
+
+        async def process_batch(batch: list) -> List[List[NormalizedRequirement]]:
+            """내부 함수: 문서 묶음 하나를 처리 (문서 순서대로 요구사항 목록 반환)"""
             async with semaphore:
+                if len(batch) > 1:
+                    return await self._extract_batch(batch)
+
+                idx, parsed_content, doc_id, _ = batch[0]
                 filename = parsed_content.metadata.filename or "unknown"
-                logger.info(f"[Normalizer] [{idx}] 문서 처리 시작: {filename}")
+                logger.info("[Normalizer] [%d] 문서 처리 시작: %s", idx, filename)
 
                 # AI를 통해 요구사항 추출 실행
                 requirements = await self._extract_and_normalize_all(
                     parsed_content,
-                    start_counter,
                     filename,
                     doc_id
                 )
 
-                logger.info(f"[Normalizer] [{idx}] {len(requirements)}개 요구사항 추출 완료")
-                return requirements, len(requirements)
-
-        # 병렬 작업을 위한 태스크 목록 준비
-        estimated_reqs_per_doc = 10
-        tasks = []
+                logger.info("[Normalizer] [%d] %d개 요구사항 추출 완료", idx, len(requirements))
+                return [requirements]
 
-        for idx, (parsed_content, doc_id) in enumerate(
-            zip(parsed_contents, document_ids), 1
-        ):
-            # ID가 겹치지 않게 시작 번호를 다르게 설정
-            start_counter = 1 + (idx - 1) * estimated_reqs_per_doc
-            tasks.append(process_document(idx, parsed_content, doc_id, start_counter))
-
-        # 모든 태스크 동시 실행
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # 모든 묶음 동시 실행
+        if extracted is None:
+            results = await asyncio.gather(
+                *(process_batch(batch) for batch in batches), return_exceptions=True
+            )
+            extracted = {}
+            for batch, result in zip(batches, results):
+                if isinstance(result, BaseException):
+                    # 취소(CancelledError) 등은 실패한 문서로 넘기지 않고 그대로 다시 발생
+                    if not isinstance(result, Exception):
+                        raise result
+                    logger.error("[Normalizer] 문서 처리 실패: %s", result)
+                    continue
+                for entry, requirements in zip(batch, result):
+                    extracted[entry[0]] = requirements
 
-        # 결과 합치기
+        # 결과 합치기 (문서 순서대로)
         all_requirements = []
-        requirement_counter = 1
+        requirement_numbers = itertools.count(1)
 
-        for result in results:
-            if isinstance(result, Exception):
-                logger.error(f"[Normalizer] 문서 처리 실패: {result}")
+        for idx, parsed_content, doc_id, _ in entries:
+            if idx in duplicate_of:
+                if duplicate_of[idx] not in extracted:
+                    continue
+                requirements = self._copy_for_document(
+                    extracted[duplicate_of[idx]],
+                    parsed_content.metadata.filename or "unknown",
+                    doc_id,
+                )
+            elif idx in extracted:
+                requirements = extracted[idx]
+            else:
                 continue
 
-            requirements, _ = result
-            # ID를 깔끔하게 1번부터 다시 매김 (REQ-001, REQ-002...)
+            # 최종 ID는 문서 순서대로 여기서 한 번만 매김 (REQ-001, REQ-002...)
             for req in requirements:
-                req.id = f"REQ-{requirement_counter:03d}"
-                all_requirements.append(req)
-                requirement_counter += 1
+                req.id = f"REQ-{next(requirement_numbers):03d}"
+            all_requirements.extend(requirements)
 
-        elapsed = (datetime.now() - start_time).total_seconds()
-        logger.info(f"[Normalizer] ===== 정규화 완료 =====")
-        logger.info(f"[Normalizer] 총 요구사항: {len(all_requirements)}개, 소요시간: {elapsed:.1f}초")
+        elapsed = time.perf_counter() - start_time
+        logger.info(
+            "[Normalizer] 정규화 완료: 문서 %d개 (중복 %d개), AI 호출 묶음 %d개 (동시 최대 %d개), "
+            "총 요구사항 %d개, 소요시간 %.1f초",
+            len(parsed_contents), len(duplicate_of), len(batches),
+            min(len(batches), self.max_concurrency), len(all_requirements), elapsed,
+        )
 
         return all_requirements
 
+    @staticmethod
+    def _copy_for_document(
+        requirements: List[NormalizedRequirement],
+        source_file: str,
+        document_id: str,
+    ) -> List[NormalizedRequirement]:
+        """같은 내용의 다른 문서용으로 요구사항을 복사하고 출처만 바꿉니다."""
+        copies = []
+        for req in requirements:
+            copy = req.model_copy(deep=True)
+            section_name = None
+            if copy.source_info is not None:
+                copy.source_info.document_id = document_id
+                copy.source_info.filename = source_file
+                section_name = copy.source_info.section
+            copy.source_reference = (
+                f"{source_file} [{section_name}]" if section_name else source_file
+            )
+            copies.append(copy)
+        return copies
+
+    @staticmethod
+    def _has_extractable_content(parsed_content: ParsedContent) -> bool:
+        """본문이나 섹션 중 하나라도 EXTRACTION_MIN_CONTENT_CHARS보다 긴 내용이 있는지 확인합니다."""
+        if len(parsed_content.raw_text.strip()) > EXTRACTION_MIN_CONTENT_CHARS:
+            return True
+        return any(
+            len(_section_text(section.get("content", "")).strip()) > EXTRACTION_MIN_CONTENT_CHARS
+            for section in parsed_content.sections
+        )
+
+    @staticmethod
+    def _build_extraction_input(parsed_content: ParsedContent) -> str:
+        """
+        문서 하나의 AI 입력 텍스트를 만듭니다.
+        고정 구분자 뒤에 문서 본문과 섹션 요약을 붙입니다 (가변 내용은 항상 맨 뒤).
+        섹션 요약에는 잘린 본문에 없는 섹션 내용만 넣어 같은 글을 두 번 보내지 않습니다.
+        """
+        # 문서 내용이 너무 길면 토큰 예산만큼 앞부분만 자름 (비용 및 속도 최적화)
+        content_text = _truncate_content(parsed_content.raw_text)
+
+        # 섹션 정보 문자열로 변환 (앞쪽 섹션 몇 개의 앞부분만, 거의 같은 내용은 한 번만)
+        # 보낼 본문에 이미 들어 있는 내용은 다시 보내지 않고 제목(문서 구조)만 남김
+        sections = parsed_content.sections
+        sections_text = "\n".join(
+            f"[{title}] {'' if preview in content_text else preview}"
+            for title, preview in _iter_distinct_sections(sections)
+        ) if sections else ""
+
+        sections_text = truncate_to_tokens(sections_text, EXTRACTION_SECTIONS_MAX_TOKENS)
+        return f"{_DOCUMENT_DELIMITER}{content_text}{_SECTIONS_DELIMITER}{sections_text}"
+
+    @staticmethod
+    def _pack_documents(entries: list) -> List[list]:
+        """
+        문서들을 토큰 예산 안에서 묶습니다 (first-fit).
+        각 문서는 앞에서부터 자리가 남은 첫 묶음에 들어가므로, 큰 문서 사이에 낀 작은 문서들도
+        한 호출로 모입니다. 예산보다 큰 문서는 혼자 한 묶음이 됩니다.
+        묶음 안의 문서는 원래 순서를 유지하며, 결과는 normalize에서 문서 순서대로 다시 합칩니다.
+        """
+        batches = []
+        batch_tokens = []
+
+        for entry in entries:
+            tokens = estimate_tokens(entry[3])
+            for i, batch in enumerate(batches):
+                if (
+                    len(batch) < BATCH_MAX_DOCUMENTS
+                    and batch_tokens[i] + tokens <= BATCH_TOKEN_BUDGET
+                ):
+                    batch.append(entry)
+                    batch_tokens[i] += tokens
+                    break
+            else:
+                batches.append([entry])
+                batch_tokens.append(tokens)
+
+        return batches
+
+    async def _request_extraction(self, system_prompt: str, user_prompt: str, label: str):
+        """
+        요구사항 추출 AI 호출 (같은 입력으로 받은 결과가 있으면 재사용)
+        """
+        cache_key = self._extraction_cache_key(system_prompt, user_prompt)
+        cached = self._get_cached_extraction(cache_key)
+        if cached is not None:
+            logger.info("[extract_all] 캐시된 추출 결과 사용: %s", label)
+            return cached
+
+        start = time.perf_counter()
+        # AI 호출 (JSON 응답 요청)
+        result = await self.claude_client.complete_json(
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+            temperature=0.2,
+        )
+        elapsed = time.perf_counter() - start
+        logger.info("[extract_all] Claude 응답: %.1f초 소요", elapsed)
+
+        self._store_extraction(cache_key, result)
+        return result
+
+    @staticmethod
+    def _extraction_cache_key(system_prompt: str, user_prompt: str) -> bytes:
+        """추출 결과 캐시 키 (지침 + 입력의 해시)"""
+        hasher = hashlib.blake2b(digest_size=16)
+        hasher.update(system_prompt.encode())
+        hasher.update(b"\0")
+        hasher.update(user_prompt.encode())
+        return hasher.digest()
+
+    @staticmethod
+    def _result_cache_key(cache_key: bytes) -> str:
+        """파일 캐시 키 (추출 버전이 바뀌면 이전 결과를 찾지 않음)"""
+        return f"extract_{EXTRACTION_PROMPT_VERSION}_{cache_key.hex()}"
+
+    def _get_cached_extraction(self, cache_key: bytes):
+        """캐시된 추출 결과 (메모리 -> 파일 캐시 순서, 없으면 None)"""
+        if cache_key in self._extraction_cache:
+            self._extraction_cache.move_to_end(cache_key)
+            return self._extraction_cache[cache_key]
+
+        if self._result_cache is None:
+            return None
+        result = self._result_cache.get(self._result_cache_key(cache_key))
+        if result is not None:
+            self._remember_extraction(cache_key, result)
+        return result
+
+    def _store_extraction(self, cache_key: bytes, result) -> None:
+        """정상 응답만 저장 (빈 응답은 다음 호출에서 다시 시도)"""
+        if result and isinstance(result, (dict, list)):
+            self._remember_extraction(cache_key, result)
+            if self._result_cache is not None:
+                self._result_cache.set(
+                    self._result_cache_key(cache_key),
+                    result,
+                    ttl_hours=EXTRACTION_RESULT_CACHE_TTL_HOURS,
+                )
+
+    def _remember_extraction(self, cache_key: bytes, result) -> None:
+        """메모리 캐시에 저장 (가장 오래 안 쓴 결과부터 삭제)"""
+        self._extraction_cache[cache_key] = result
+        if len(self._extraction_cache) > EXTRACTION_CACHE_MAX_ENTRIES:
+            self._extraction_cache.popitem(last=False)
+
+    async def _extract_with_message_batch(self, entries: list) -> List[List[NormalizedRequirement]]:
+        """
+        모든 문서를 Message Batches API 요청 하나로 추출합니다.
+        캐시에 결과가 있는 문서는 배치에 넣지 않고, 결과가 빠진 문서는 문서 내용에서 직접 추출합니다.
+        """
+        model = (
+            self._batch_client.model if self._batch_client is not None
+            else get_settings().claude_model
+        )
+        cache_prompt = _message_batch_cache_prompt(model)
+
+        results = {}
+        pending = {}
+        for idx, _, _, prompt in entries:
+            cache_key = self._extraction_cache_key(cache_prompt, prompt)
+            cached = self._get_cached_extraction(cache_key)
+            if cached is not None:
+                results[idx] = cached
+            else:
+                pending[f"doc-{idx}"] = (idx, cache_key, prompt)
+
+        if pending:
+            if self._batch_client is None:
+                self._batch_client = ClaudeBatchClient()
+            batch_results = await self._batch_client.complete_json_batch(
+                {
+                    custom_id: (EXTRACTION_SYSTEM_PROMPT, prompt)
+                    for custom_id, (_, _, prompt) in pending.items()
+                },
+                temperature=0.2,
+            )
+            for custom_id, (idx, cache_key, _) in pending.items():
+                result = batch_results.get(custom_id, {})
+                self._store_extraction(cache_key, result)
+                results[idx] = result
+
+        outputs = []
+        for idx, parsed_content, doc_id, _ in entries:
+            filename = parsed_content.metadata.filename or "unknown"
+            raw_reqs = self._raw_requirements_from_result(results[idx], parsed_content)
+            requirements = await self._convert_all_async(raw_reqs, filename, doc_id)
+            logger.info("[Normalizer] [%d] %d개 요구사항 추출 완료", idx, len(requirements))
+            outputs.append(requirements)
+
+        return outputs
+
+    async def _extract_batch(self, batch: list) -> List[List[NormalizedRequirement]]:
+        """
+        작은 문서 여러 개를 한 번의 AI 호출로 추출하고 문서별로 나눕니다.
+        응답에 빠진 문서는 단독 호출로 다시 추출합니다.
+        """
+        logger.info("[extract_batch] 문서 %d개 묶음 추출 시작", len(batch))
+
+        prompt = "\n\n".join(
+            f"===DOC {number}===\n{text}"
+            for number, (_, _, _, text) in enumerate(batch, 1)
+        )
+
+        try:
+            result = await self._request_extraction(
+                BATCH_EXTRACTION_SYSTEM_PROMPT, prompt, f"문서 {len(batch)}개 묶음"
+            )
+        except Exception as e:
+            logger.warning("[extract_batch] 묶음 추출 실패, 문서별로 재시도: %s: %s", type(e).__name__, e)
+            result = {}
+
+        if not isinstance(result, dict):
+            logger.warning("[extract_batch] 예상치 못한 결과 타입: %s", type(result))
+            result = {}
+
+        outputs = []
+        for number, (idx, parsed_content, doc_id, _) in enumerate(batch, 1):
+            filename = parsed_content.metadata.filename or "unknown"
+            raw_reqs = result.get(str(number))
+
+            if isinstance(raw_reqs, list):
+                requirements = await self._convert_all_async(raw_reqs, filename, doc_id)
+            else:
+                requirements = await self._extract_and_normalize_all(
+                    parsed_content, filename, doc_id
+                )
+
+            logger.info("[Normalizer] [%d] %d개 요구사항 추출 완료", idx, len(requirements))
+            outputs.append(requirements)
+
+        return outputs
+
     async def _extract_and_normalize_all(
         self,
         parsed_content: ParsedContent,
-        start_counter: int,
         source_file: str,
         document_id: str
     ) -> List[NormalizedRequirement]:
@@ -132,80 +745,73 @@ class Normalizer:
         JSON 형식으로 결과를 받아서 프로그램에서 쓸 수 있는 객체로 변환합니다.
         """
         filename = parsed_content.metadata.filename or "unknown"
-        logger.info(f"[extract_all] 통합 추출 시작: {filename}")
-
-        # 문서 내용이 너무 길면 앞부분만 자름 (비용 및 속도 최적화)
-        content_text = parsed_content.raw_text[:6000]
-
-        # 섹션 정보 문자열로 변환
-        def get_section_content(s):
-            content = s.get('content', '')
-            if isinstance(content, list):
-                content = "\n".join(str(c) for c in content)
-            return str(content)[:300]
-
-        sections_text = "\n".join([
-            f"[{s.get('title', 'Section')}] {get_section_content(s)}"
-            for s in parsed_content.sections[:8]
-        ]) if parsed_content.sections else ""
-
-        # AI에게 보낼 프롬프트(명령어) 구성 - 간결하게
-        prompt = f"""문서에서 요구사항 추출. JSON배열만 반환:
-
-문서 내용:
-{content_text[:4000]}
-
-{f"섹션: {sections_text[:1000]}" if sections_text else ""}
+        if not self._has_extractable_content(parsed_content):
+            logger.info("[extract_all] 내용 없는 문서, AI 호출 생략: %s", filename)
+            return []
+        logger.info("[extract_all] 통합 추출 시작: %s", filename)
 
-형식: [{{"title":"제목","description":"설명","type":"FR|NFR|CONSTRAINT","priority":"HIGH|MEDIUM|LOW","confidence_score":0.8}}]
-FR=기능, NFR=비기능, CONSTRAINT=제약. JSON만."""
+        # AI에게 보낼 프롬프트 구성 - 고정 형식 지침은 EXTRACTION_SYSTEM_PROMPT에 있고
+        # 여기에는 고정 구분자와 문서별 내용만 담음
+        prompt = self._build_extraction_input(parsed_content)
 
         try:
-            start = datetime.now()
-            # AI 호출 (JSON 응답 요청)
-            result = await self.claude_client.complete_json(
-                system_prompt=REQUIREMENT_EXTRACTION_PROMPT,
-                user_prompt=prompt,
-                temperature=0.2,
-            )
-            elapsed = (datetime.now() - start).total_seconds()
-            logger.info(f"[extract_all] Claude 응답: {elapsed:.1f}초 소요")
+            # 같은 입력으로 이미 받은 결과가 있으면 AI 호출 생략
+            result = await self._request_extraction(EXTRACTION_SYSTEM_PROMPT, prompt, filename)
 
             # 응답 결과 파싱
-            if isinstance(result, dict) and "requirements" in result:
-                raw_reqs = result["requirements"]
-            elif isinstance(result, list):
-                raw_reqs = result
-            elif isinstance(result, dict) and not result:
-                # 빈 딕셔너리인 경우 - AI가 JSON을 반환하지 않음
-                logger.warning(f"[extract_all] AI 응답 없음, 문서에서 직접 추출 시도")
-                raw_reqs = self._extract_from_content(parsed_content)
-            else:
-                logger.warning(f"[extract_all] 예상치 못한 결과 타입: {type(result)}")
-                raw_reqs = self._extract_from_content(parsed_content)
+            raw_reqs = self._raw_requirements_from_result(result, parsed_content)
 
             # 추출된 데이터를 정규화된 객체로 변환
-            requirements = []
-            for idx, raw in enumerate(raw_reqs):
-                try:
-                    req = self._convert_to_requirement(
-                        raw,
-                        start_counter + idx,
-                        source_file,
-                        document_id
-                    )
-                    if req:
-                        requirements.append(req)
-                except Exception as e:
-                    logger.warning(f"[extract_all] 요구사항 변환 실패: {e}")
-                    continue
-
-            return requirements
+            return await self._convert_all_async(raw_reqs, source_file, document_id)
 
         except Exception as e:
-            logger.error(f"[extract_all] 추출 실패: {type(e).__name__}: {e}", exc_info=True)
+            logger.exception("[extract_all] 추출 실패: %s: %s", type(e).__name__, e)
             # 예외 발생 시에도 문서 내용에서 직접 추출 시도
-            return self._extract_from_parsed_content(parsed_content, start_counter, source_file, document_id)
+            return self._extract_from_parsed_content(parsed_content, source_file, document_id)
+
+    def _raw_requirements_from_result(self, result, parsed_content: ParsedContent) -> List[dict]:
+        """AI 응답에서 요구사항 딕셔너리 목록을 꺼냅니다 (없으면 문서 내용에서 직접 추출)."""
+        if isinstance(result, dict) and "requirements" in result:
+            return result["requirements"]
+        if isinstance(result, list):
+            return result
+        if isinstance(result, dict) and not result:
+            # 빈 딕셔너리인 경우 - AI가 JSON을 반환하지 않음
+            logger.warning("[extract_all] AI 응답 없음, 문서에서 직접 추출 시도")
+        else:
+            logger.warning("[extract_all] 예상치 못한 결과 타입: %s", type(result))
+        return self._extract_from_content(parsed_content)
+
+    async def _convert_all_async(
+        self,
+        raw_reqs: List[dict],
+        source_file: str,
+        document_id: str
+    ) -> List[NormalizedRequirement]:
+        """
+        _convert_all과 같지만, 요구사항이 많으면 스레드에서 실행해
+        변환(모델 검증)하는 동안에도 이벤트 루프가 다른 문서를 처리할 수 있게 합니다.
+        """
+        if len(raw_reqs) < CONVERT_IN_THREAD_MIN_ITEMS:
+            return self._convert_all(raw_reqs, source_file, document_id)
+        return await asyncio.to_thread(self._convert_all, raw_reqs, source_file, document_id)
+
+    def _convert_all(
+        self,
+        raw_reqs: List[dict],
+        source_file: str,
+        document_id: str
+    ) -> List[NormalizedRequirement]:
+        """
+        AI가 준 요구사항 딕셔너리 목록을 NormalizedRequirement 목록으로 변환합니다.
+        변환 실패는 _convert_to_requirement가 None으로 돌려주므로 여기서는 걸러내기만 합니다.
+        """
+        convert = self._convert_to_requirement
+        converted = [
+            convert(raw, idx, source_file, document_id)
+            for idx, raw in enumerate(raw_reqs, 1)
+        ]
+        return [req for req in converted if req is not None]
 
     def _convert_to_requirement(
         self,
@@ -217,50 +823,45 @@ FR=기능, NFR=비기능, CONSTRAINT=제약. JSON만."""
         """
         AI가 준 딕셔너리 데이터를 NormalizedRequirement 객체로 변환하는 함수입니다.
         데이터 타입을 맞추고 기본값을 채워넣습니다.
+        counter는 문서 안에서의 순번으로, 제목이 없을 때 기본 제목에 씁니다.
+        최종 ID(REQ-001...)는 normalize에서 모든 문서를 합칠 때 한 번에 매깁니다.
         """
         try:
+            # 짧은 키 응답(t, d, ty...)은 필드 이름으로 변환 (이전 형식/직접 추출 결과는 그대로)
+            raw = _expand_short_keys(raw)
+
             # 요구사항 타입 결정 (FR/NFR/CONSTRAINT)
-            type_str = raw.get("type", "FR").upper()
-            if "NFR" in type_str or "NON" in type_str:
-                req_type = RequirementType.NON_FUNCTIONAL
-            elif "CONSTRAINT" in type_str:
-                req_type = RequirementType.CONSTRAINT
-            else:
-                req_type = RequirementType.FUNCTIONAL
+            req_type = _parse_requirement_type(raw.get("type", "FR"))
 
             # 우선순위 결정
-            priority_str = raw.get("priority", "MEDIUM").upper()
-            if "HIGH" in priority_str:
-                priority = Priority.HIGH
-            elif "LOW" in priority_str:
-                priority = Priority.LOW
-            else:
-                priority = Priority.MEDIUM
+            priority = _parse_priority(raw.get("priority", "MEDIUM"))
 
             # 신뢰도 점수 변환 (0~1 사이 값)
             score = raw.get("confidence_score", 0.7)
-            try:
-                score = max(0.0, min(1.0, float(score)))
-            except (ValueError, TypeError):
-                score = 0.7
-
-            # 출처 정보 생성
-            source_info = SourceReference(
-                document_id=document_id,
-                filename=source_file,
-                section=raw.get("section_name"),
-                excerpt=raw.get("original_text", "")[:200]
-            )
+            if isinstance(score, (int, float)):
+                # 대부분 숫자로 오므로 float() 변환 없이 비교만 함 (NaN은 1.0)
+                score = 0.0 if score < 0.0 else 1.0 if not score <= 1.0 else float(score)
+            else:
+                try:
+                    score = max(0.0, min(1.0, float(score)))
+                except (ValueError, TypeError):
+                    score = 0.7
+
+            # 출처 정보 (딕셔너리로 넘겨 요구사항 생성 시 한 번에 검증/생성)
+            section_name = raw.get("section_name")
+            source_info = {
+                "document_id": document_id,
+                "filename": source_file,
+                "section": section_name,
+                "excerpt": raw.get("original_text", "")[:200],
+            }
 
             # 구버전 호환용 출처 문자열
-            section_name = raw.get("section_name", "")
-            legacy_source = source_file
-            if section_name:
-                legacy_source += f" [{section_name}]"
+            legacy_source = f"{source_file} [{section_name}]" if section_name else source_file
 
             # 객체 생성 및 반환
             return NormalizedRequirement(
-                id=f"REQ-{counter:03d}",
+                id="",
                 type=req_type,
                 title=raw.get("title", f"요구사항 {counter}")[:50],
                 description=raw.get("description", ""),
@@ -276,7 +877,7 @@ FR=기능, NFR=비기능, CONSTRAINT=제약. JSON만."""
             )
 
         except Exception as e:
-            logger.error(f"[convert] 변환 실패: {e}")
+            logger.error("[convert] 변환 실패: %s", e)
             return None
 
     def _extract_from_content(self, parsed_content: ParsedContent) -> List[dict]:
@@ -290,9 +891,7 @@ FR=기능, NFR=비기능, CONSTRAINT=제약. JSON만."""
         if parsed_content.sections:
             for idx, section in enumerate(parsed_content.sections[:20]):  # 최대 20개
                 title = section.get('title', f'요구사항 {idx + 1}')
-                content = section.get('content', '')
-                if isinstance(content, list):
-                    content = "\n".join(str(c) for c in content)
+                content = _section_text(section.get('content', ''))
 
                 # 제목이 슬라이드 번호만 있으면 스킵
                 if content and len(content.strip()) > 10:
@@ -311,47 +910,23 @@ FR=기능, NFR=비기능, CONSTRAINT=제약. JSON만."""
 
         # 섹션이 없으면 raw_text에서 추출
         if not raw_reqs and parsed_content.raw_text:
-            lines = parsed_content.raw_text.split('\n')
-            current_title = ""
-            current_content = []
-
-            for line in lines:
-                line = line.strip()
-                if not line:
-                    continue
-
-                # 제목 패턴 감지 (===, ---, # 등)
-                if line.startswith('===') or line.startswith('---') or line.startswith('#'):
-                    if current_title and current_content:
-                        raw_reqs.append({
-                            "title": current_title[:50],
-                            "description": "\n".join(current_content)[:500],
-                            "type": "FR",
-                            "priority": "MEDIUM",
-                            "confidence_score": 0.5,
-                        })
-                    current_title = line.strip('=- #')
-                    current_content = []
-                else:
-                    current_content.append(line)
-
-            # 마지막 섹션 처리
-            if current_title and current_content:
-                raw_reqs.append({
-                    "title": current_title[:50],
-                    "description": "\n".join(current_content)[:500],
+            raw_reqs = [
+                {
+                    "title": title[:50],
+                    "description": description[:500],
                     "type": "FR",
                     "priority": "MEDIUM",
                     "confidence_score": 0.5,
-                })
+                }
+                for title, description in _iter_fallback_sections(parsed_content.raw_text)
+            ]
 
-        logger.info(f"[extract_from_content] 직접 추출된 요구사항: {len(raw_reqs)}개")
+        logger.info("[extract_from_content] 직접 추출된 요구사항: %d개", len(raw_reqs))
         return raw_reqs
 
     def _extract_from_parsed_content(
         self,
         parsed_content: ParsedContent,
-        start_counter: int,
         source_file: str,
         document_id: str
     ) -> List[NormalizedRequirement]:
@@ -360,20 +935,4 @@ FR=기능, NFR=비기능, CONSTRAINT=제약. JSON만."""
         예외 발생 시 폴백으로 사용됩니다.
         """
         raw_reqs = self._extract_from_content(parsed_content)
-        requirements = []
-
-        for idx, raw in enumerate(raw_reqs):
-            try:
-                req = self._convert_to_requirement(
-                    raw,
-                    start_counter + idx,
-                    source_file,
-                    document_id
-                )
-                if req:
-                    requirements.append(req)
-            except Exception as e:
-                logger.warning(f"[extract_from_parsed] 변환 실패: {e}")
-                continue
-
-        return requirements
\ No newline at end of file
+        return self._convert_all(raw_reqs, source_file, document_id)
\ No newline at end of file
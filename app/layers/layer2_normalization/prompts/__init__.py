@@ -2,12 +2,14 @@
 
 from .normalization_prompts import (
     REQUIREMENT_EXTRACTION_PROMPT,
-    USER_STORY_CONVERSION_PROMPT,
+    REQUIREMENT_EXTRACTION_FORMAT,
+    REQUIREMENT_BATCH_EXTRACTION_FORMAT,
     CONFIDENCE_SCORING_PROMPT,
 )
 
 __all__ = [
     "REQUIREMENT_EXTRACTION_PROMPT",
-    "USER_STORY_CONVERSION_PROMPT",
+    "REQUIREMENT_EXTRACTION_FORMAT",
+    "REQUIREMENT_BATCH_EXTRACTION_FORMAT",
     "CONFIDENCE_SCORING_PROMPT",
 ]
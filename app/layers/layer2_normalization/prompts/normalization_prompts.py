@@ -29,27 +29,23 @@ REQUIREMENT_EXTRACTION_PROMPT = """당신은 다양한 형태의 문서에서 
 응답은 반드시 유효한 JSON 형식이어야 합니다."""
 
 
-USER_STORY_CONVERSION_PROMPT = """당신은 요구사항을 User Story 형식으로 변환하는 전문가입니다.
 
-User Story 형식:
-"As a [사용자 유형], I want [원하는 기능], so that [얻는 가치/이유]"
+# 문서와 무관하게 항상 같은 요구사항 추출 응답 형식 지침
+# (문서 내용보다 앞에 두어 매 호출의 프롬프트 앞부분이 동일하게 유지되도록 함)
+REQUIREMENT_EXTRACTION_FORMAT = """문서에서 요구사항 추출. JSON배열만 반환.
 
-예시:
-- "As a 일반 사용자, I want 소셜 로그인으로 가입할 수 있기를, so that 별도 회원가입 없이 빠르게 서비스를 이용할 수 있다"
-- "As a 관리자, I want 사용자 목록을 CSV로 내보내기를, so that 외부 시스템에서 데이터를 활용할 수 있다"
+형식: [{"t":"제목","d":"설명","ty":"FR|NFR|CONSTRAINT","p":"HIGH|MEDIUM|LOW","cs":0.8,"cr":"근거","us":"As a 사용자, I want 기능, so that 가치","ac":["조건"],"as":["가정"],"mi":["부족한 정보"],"sn":"섹션"}]
+키: t=제목, d=설명, ty=유형, p=우선순위, cs=신뢰도(0~1), cr=신뢰도 근거, us=User Story(CONSTRAINT는 생략), ac=테스트로 확인 가능한 인수 조건, as=가정사항, mi=부족한 정보, sn=출처 섹션 제목.
+FR=기능, NFR=비기능, CONSTRAINT=제약. 값이 없는 키는 생략. 공백 없는 JSON만."""
 
-Acceptance Criteria 작성 원칙:
-1. 검증 가능해야 함 (테스트로 확인 가능)
-2. 구체적이어야 함 (모호함 없이)
-3. 독립적이어야 함 (각 기준이 개별 확인 가능)
-4. Given-When-Then 형식 권장
 
-예시:
-- "사용자가 Google 계정으로 로그인하면 자동으로 회원가입된다"
-- "로그인 후 3초 이내에 대시보드가 표시된다"
-- "비밀번호는 최소 8자 이상, 영문/숫자 포함해야 한다"
+# 작은 문서 여러 개를 한 번의 호출로 묶어 보낼 때의 응답 형식 지침
+REQUIREMENT_BATCH_EXTRACTION_FORMAT = """여러 문서에서 요구사항 추출. ===DOC 번호=== 로 구분된 문서마다 따로 추출하여 JSON 객체만 반환.
 
-응답은 반드시 유효한 JSON 형식이어야 합니다."""
+형식: {"1":[{"t":"제목","d":"설명","ty":"FR|NFR|CONSTRAINT","p":"HIGH|MEDIUM|LOW","cs":0.8,"cr":"근거","us":"As a 사용자, I want 기능, so that 가치","ac":["조건"],"as":["가정"],"mi":["부족한 정보"],"sn":"섹션"}],"2":[...]}
+최상위 키는 문서 번호, 요구사항이 없는 문서는 빈 배열. t=제목, d=설명, ty=유형, p=우선순위, cs=신뢰도(0~1), cr=신뢰도 근거,
+us=User Story(CONSTRAINT는 생략), ac=테스트로 확인 가능한 인수 조건, as=가정사항, mi=부족한 정보, sn=출처 섹션 제목.
+FR=기능, NFR=비기능, CONSTRAINT=제약. 값이 없는 키는 생략. 공백 없는 JSON만."""
 
 
 CONFIDENCE_SCORING_PROMPT = """당신은 소프트웨어 요구사항의 품질을 평가하는 전문가입니다.
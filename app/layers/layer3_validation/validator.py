@@ -2,6 +2,7 @@
 추출된 요구사항의 품질을 검사하고, 문제가 있거나 AI가 확신하지 못하는 항목을 찾아냅니다.
 """
 
+import asyncio
 import logging
 from typing import List, Tuple, Optional
 
@@ -11,11 +12,17 @@ from app.models import (
     ReviewItem,
     ReviewItemType,
 )
-from app.services import ClaudeClient, get_claude_client
+from app.services import ClaudeClient, FileCache, get_claude_client, get_file_cache
 from app.config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# 충돌 감지 결과를 파일 캐시에 보관하는 시간
+CONFLICT_RESULT_CACHE_TTL_HOURS = 7 * 24
+
+# 요구사항 설명에 있으면 검토 사유가 되는 모호한 표현 (보고 순서대로)
+VAGUE_TERMS = ("등", "기타", "필요시", "적절한", "합리적인", "etc", "등등")
+
 
 class Validator:
     """
@@ -27,9 +34,22 @@ class Validator:
     3. 요구사항 간의 충돌 감지
     """
 
-    def __init__(self, claude_client: Optional[ClaudeClient] = None):
+    def __init__(
+        self,
+        claude_client: Optional[ClaudeClient] = None,
+        result_cache: Optional[FileCache] = None,
+    ):
+        """
+        Args:
+            claude_client: 사용할 Claude 클라이언트 (없으면 공용 클라이언트)
+            result_cache: 충돌 감지 결과를 재실행 간에도 보관할 파일 캐시
+                (없으면 설정에 따라 공용 파일 캐시 사용 또는 사용 안 함)
+        """
         self.claude_client = claude_client or get_claude_client()
         self.settings = get_settings()
+        if result_cache is None and self.settings.conflict_result_cache:
+            result_cache = get_file_cache()
+        self._result_cache = result_cache
 
     async def validate(
         self,
@@ -42,29 +62,40 @@ class Validator:
         Returns:
             (자동 승인된 요구사항 목록, 검토가 필요한 항목 목록)
         """
+        # 충돌 감지(AI 호출)를 먼저 시작하고, 응답을 기다리는 동안 개별 검증(로컬 계산)을 수행
+        conflicts_task = asyncio.create_task(self._detect_conflicts(requirements))
+        await asyncio.sleep(0)  # 충돌 감지 작업이 AI 호출까지 진행되도록 한 번 양보
+
         validated = []
         review_items = []
-
-        for req in requirements:
-            # 개별 요구사항 검증 수행
-            validation_result = await self._validate_requirement(req, requirements)
-
-            # 검증 결과에 따라 승인 또는 검토 대기로 분류
-            if self._needs_pm_review(req, validation_result):
-                review_item = self._create_review_item(req, validation_result, job_id)
-                review_items.append(review_item)
+        try:
+            # PM 검토가 꺼져 있으면 모두 자동 승인되므로 개별 검증(점수 계산)을 생략
+            if not self.settings.enable_pm_review:
+                validated = list(requirements)
             else:
-                validated.append(req)
-
-        # 요구사항 간의 충돌 감지 (AI 활용)
-        conflicts = await self._detect_conflicts(requirements)
+                for req in requirements:
+                    # 개별 요구사항 검증 수행
+                    validation_result = self._validate_requirement(req, requirements)
+
+                    # 검증 결과에 따라 승인 또는 검토 대기로 분류
+                    if self._needs_pm_review(req, validation_result):
+                        review_item = self._create_review_item(req, validation_result, job_id)
+                        review_items.append(review_item)
+                    else:
+                        validated.append(req)
+        except BaseException:
+            conflicts_task.cancel()
+            raise
+
+        # 요구사항 간의 충돌 감지 결과 추가
+        conflicts = await conflicts_task
         for conflict in conflicts:
             conflict.job_id = job_id
             review_items.append(conflict)
 
         return validated, review_items
 
-    async def _validate_requirement(
+    def _validate_requirement(
         self,
         requirement: NormalizedRequirement,
         all_requirements: List[NormalizedRequirement]
@@ -136,13 +167,9 @@ class Validator:
 
     def _check_consistency(self, req: NormalizedRequirement) -> List[str]:
         """표현이 모호하거나 정보가 누락되었는지 확인합니다."""
-        issues = []
-
-        # 모호한 표현 사용 여부 검사
-        vague_terms = ["등", "기타", "필요시", "적절한", "합리적인", "etc", "등등"]
-        for term in vague_terms:
-            if term in req.description.lower():
-                issues.append(f"모호한 표현 사용: '{term}'")
+        # 모호한 표현 사용 여부 검사 (소문자 변환은 한 번만)
+        description = req.description.lower()
+        issues = [f"모호한 표현 사용: '{term}'" for term in VAGUE_TERMS if term in description]
 
         # AI가 감지한 누락 정보가 있는지 확인
         if req.missing_info:
@@ -304,13 +331,27 @@ JSON 형식으로 응답:
 충돌이 없으면 {{'conflicts': []}}를 반환하세요."""
 
         try:
-            result = await self.claude_client.complete_json(
-                system_prompt="당신은 요구사항 충돌을 탐지하는 전문가입니다.",
-                user_prompt=prompt,
-                temperature=0.2,
-            )
+            # 같은 요구사항 목록이면 프롬프트도 같으므로 이전 결과를 재사용 (설정으로 켠 경우)
+            cache_key = None
+            conflicts = None
+            if self._result_cache is not None:
+                cache_key = self._result_cache.get_cache_key_from_content(prompt, prefix="conflicts")
+                conflicts = self._result_cache.get(cache_key)
+
+            if conflicts is None:
+                result = await self.claude_client.complete_json(
+                    system_prompt="당신은 요구사항 충돌을 탐지하는 전문가입니다.",
+                    user_prompt=prompt,
+                    temperature=0.2,
+                )
+                conflicts = result.get("conflicts", [])
+
+                # 정상 응답만 저장 (빈 응답은 다음 실행에서 다시 시도)
+                if cache_key is not None and "conflicts" in result:
+                    self._result_cache.set(
+                        cache_key, conflicts, ttl_hours=CONFLICT_RESULT_CACHE_TTL_HOURS
+                    )
 
-            conflicts = result.get("conflicts", [])
             review_items = []
 
             for conflict in conflicts:
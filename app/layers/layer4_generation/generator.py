@@ -6,6 +6,7 @@ Layer 4: PRD 문서 생성 서비스입니다.
 from typing import List, Optional
 from datetime import datetime
 import logging
+import time
 
 from app.models import (
     NormalizedRequirement,
@@ -117,18 +118,18 @@ class PRDGenerator(BaseGenerator[List[NormalizedRequirement], PRDDocument, PRDCo
         )
 
         logger.info(f"[{self._generator_name}] PRD 생성 시작")
-        start_time = datetime.now()
+        start_time = time.perf_counter()
 
         try:
             result = await self._do_generate(requirements, prd_context)
 
-            elapsed = (datetime.now() - start_time).total_seconds()
+            elapsed = time.perf_counter() - start_time
             logger.info(f"[{self._generator_name}] PRD 생성 완료: {elapsed:.1f}초")
 
             return result
 
         except Exception as e:
-            elapsed = (datetime.now() - start_time).total_seconds()
+            elapsed = time.perf_counter() - start_time
             logger.error(f"[{self._generator_name}] PRD 생성 실패 ({elapsed:.1f}초): {e}")
             raise
 
@@ -3,6 +3,7 @@ PRD(제품 요구사항 정의서) 생성 시스템의 메인 진입점 파일
 웹 서버 애플리케이션을 생성하고 설정하는 역할을 담당합니다.
 """
 
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 from datetime import datetime
@@ -14,6 +15,7 @@ from fastapi.responses import JSONResponse
 from app.config import get_settings
 from app.api.router import api_router
 from app.exceptions import PRDGeneratorError, InputValidationError
+from app.layers.layer1_parsing.parsers.ppt_parser import warm_up_presentation_loader
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +28,7 @@ async def lifespan(app: FastAPI):
     서버가 시작될 때:
     1. 필요한 설정들을 불러옵니다.
     2. 시작 로그를 출력합니다.
+    3. PPT 파서 라이브러리를 백그라운드에서 미리 준비합니다.
     
     서버가 종료될 때:
     1. 정리 작업이나 종료 로그를 출력합니다.
@@ -35,12 +38,25 @@ async def lifespan(app: FastAPI):
     logger.info(f"PRD 생성기가 다음 주소에서 시작됩니다: {settings.host}:{settings.port}")
     logger.info("AI 처리를 위해 Claude Code CLI를 사용합니다")
 
+    # 첫 PPT 파싱이 python-pptx 초기화 비용을 떠안지 않도록 시작을 막지 않고 미리 준비
+    warm_up_task = asyncio.create_task(_warm_up_parsers())
+
     yield
 
+    warm_up_task.cancel()
+
     # 종료 시: 리소스 정리
     logger.info("PRD 생성기가 종료됩니다")
 
 
+async def _warm_up_parsers() -> None:
+    """파서 라이브러리 초기화를 별도 스레드에서 수행합니다 (실패해도 서비스에는 영향 없음)."""
+    try:
+        await asyncio.to_thread(warm_up_presentation_loader)
+    except Exception as e:
+        logger.warning(f"PPT 파서 사전 준비 실패: {e}")
+
+
 def create_app() -> FastAPI:
     """
     FastAPI 웹 애플리케이션을 생성하고 설정하는 함수입니다.
@@ -45,7 +45,7 @@ async def main():
     validator = Validator(client)
     generator = PRDGenerator(client)
 
-    total_start = time.time()
+    total_start = time.perf_counter()
 
     # Layer 1: 파싱
     print('\n' + '-' * 70)
@@ -66,20 +66,22 @@ async def main():
         }
         return type_map.get(suffix, InputType.TEXT)
 
-    for i, file_path in enumerate(files, 1):
-        input_type = get_input_type(file_path)
+    # 여러 파일을 동시에 파싱한 뒤 입력 순서대로 결과 출력
+    input_types = [get_input_type(f) for f in files]
+    results = await factory.parse_files(files, input_types)
+
+    for i, (file_path, input_type, parsed) in enumerate(zip(files, input_types, results), 1):
         print(f'\n  [{i}/{len(files)}] {file_path.name} ({input_type.value})')
 
-        try:
-            parser = factory.get_parser(input_type)
-            parsed = await parser.parse(file_path)
-            parsed_contents.append(parsed)
-            document_ids.append(f'doc-{i:03d}')
-            text_len = len(parsed.raw_text) if parsed.raw_text else 0
-            sections = len(parsed.sections) if parsed.sections else 0
-            print(f'      완료: 텍스트 {text_len} chars, 섹션 {sections}개')
-        except Exception as e:
-            print(f'      실패: {e}')
+        if isinstance(parsed, Exception):
+            print(f'      실패: {parsed}')
+            continue
+
+        parsed_contents.append(parsed)
+        document_ids.append(f'doc-{i:03d}')
+        text_len = len(parsed.raw_text) if parsed.raw_text else 0
+        sections = len(parsed.sections) if parsed.sections else 0
+        print(f'      완료: 텍스트 {text_len} chars, 섹션 {sections}개')
 
     if not parsed_contents:
         print('\n파싱된 콘텐츠가 없어 종료합니다.')
@@ -109,7 +111,7 @@ async def main():
     source_docs = [f.name for f in files]
     prd = await generator.generate(validated or requirements, source_documents=source_docs)
 
-    total_time = time.time() - total_start
+    total_time = time.perf_counter() - total_start
 
     # 결과 요약
     print('\n' + '=' * 70)
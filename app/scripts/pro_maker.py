@@ -58,12 +58,12 @@ async def main():
     output_dir = Path('workspace/outputs/proposals')
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    total_start = time.time()
+    total_start = time.perf_counter()
 
     generator = ProposalGenerator()
     proposal = await generator.generate(prd, context)
 
-    total_time = time.time() - total_start
+    total_time = time.perf_counter() - total_start
 
     # 결과 요약
     print('\n' + '=' * 70)
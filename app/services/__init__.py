@@ -1,6 +1,7 @@
 """Services for PRD generation system."""
 
-from .claude_client import ClaudeClient, get_claude_client
+from .claude_client import JSON_RESPONSE_RULES, ClaudeClient, build_prompt, get_claude_client
+from .claude_batch_client import ClaudeBatchClient
 from .file_storage import FileStorage, get_file_storage
 from .orchestrator import PipelineOrchestrator, get_orchestrator
 from .cache import FileCache, get_file_cache
@@ -9,6 +10,9 @@ from .document_orchestrator import DocumentOrchestrator, get_document_orchestrat
 __all__ = [
     "ClaudeClient",
     "get_claude_client",
+    "JSON_RESPONSE_RULES",
+    "build_prompt",
+    "ClaudeBatchClient",
     "FileStorage",
     "get_file_storage",
     "PipelineOrchestrator",
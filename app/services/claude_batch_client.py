@@ -0,0 +1,130 @@
+"""
+Claude Message Batches API 클라이언트 서비스입니다.
+실시간 응답이 필요 없는 대량 작업을 한 번의 배치 요청으로 보내고 결과를 모아 받습니다.
+
+특징:
+- CLI 대신 Anthropic API 키(ANTHROPIC_API_KEY)로 호출합니다.
+- 배치 요청은 일반 호출보다 토큰 비용이 절반이지만, 결과가 나오기까지 수 분 이상 걸릴 수 있습니다.
+- 응답 JSON 해석은 ClaudeClient와 같은 parse_json_response를 사용합니다.
+- 요청마다 반복되는 시스템 프롬프트는 프롬프트 캐시(cache_control) 대상으로 표시합니다.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from app.config import get_settings
+from app.exceptions import ClaudeClientError
+
+from .claude_client import JSON_RESPONSE_RULES, parse_json_response
+
+logger = logging.getLogger(__name__)
+
+# 배치 상태 확인 간격 (지수 백오프, 초)
+BATCH_POLL_INITIAL_DELAY = 5
+BATCH_POLL_MAX_DELAY = 60
+# 배치 결과를 기다리는 최대 시간 (API가 보장하는 처리 시간 24시간)
+BATCH_MAX_WAIT_SECONDS = 24 * 60 * 60
+
+
+class ClaudeBatchClient:
+    """
+    여러 JSON 요청을 Message Batches API 한 번으로 처리하는 클라이언트입니다.
+    """
+
+    def __init__(self, client: Any = None, model: Optional[str] = None):
+        """
+        Args:
+            client: anthropic.AsyncAnthropic 호환 클라이언트 (없으면 설정의 API 키로 생성)
+            model: 사용할 모델 이름 (없으면 설정값 사용)
+        """
+        settings = get_settings()
+        if client is None:
+            if not settings.anthropic_api_key:
+                raise ClaudeClientError("배치 모드에는 ANTHROPIC_API_KEY 설정이 필요합니다")
+            from anthropic import AsyncAnthropic
+
+            client = AsyncAnthropic(api_key=settings.anthropic_api_key)
+
+        self._client = client
+        self.model = model or settings.claude_model
+
+    async def complete_json_batch(
+        self,
+        requests: Dict[str, Tuple[str, str]],
+        max_tokens: int = 4096,
+        temperature: float = 0.2,
+    ) -> Dict[str, Any]:
+        """
+        여러 요청을 하나의 배치로 보내고, 끝나면 요청별 JSON 결과를 돌려줍니다.
+
+        Args:
+            requests: custom_id -> (system_prompt, user_prompt)
+            max_tokens: 요청별 최대 응답 토큰 수
+            temperature: 창의성 조절
+
+        Returns:
+            custom_id -> 파싱된 JSON (실패하거나 해석할 수 없는 요청은 빠짐)
+        """
+        # 같은 지침은 블록 하나를 공유 (문서마다 다른 내용은 캐시 구간 밖의 user 메시지로 보냄)
+        system_blocks = {
+            system_prompt: [
+                {"type": "text", "text": system_prompt, "cache_control": {"type": "ephemeral"}}
+            ]
+            for system_prompt, _ in requests.values()
+        }
+        batch = await self._client.messages.batches.create(
+            requests=[
+                {
+                    "custom_id": custom_id,
+                    "params": {
+                        "model": self.model,
+                        "max_tokens": max_tokens,
+                        "temperature": temperature,
+                        "system": system_blocks[system_prompt],
+                        "messages": [
+                            {"role": "user", "content": user_prompt + JSON_RESPONSE_RULES}
+                        ],
+                    },
+                }
+                for custom_id, (system_prompt, user_prompt) in requests.items()
+            ]
+        )
+        logger.info("[Batch] 배치 생성: %s (요청 %d개)", batch.id, len(requests))
+
+        await self._wait_until_ended(batch.id)
+
+        results: Dict[str, Any] = {}
+        async for entry in await self._client.messages.batches.results(batch.id):
+            if entry.result.type != "succeeded":
+                logger.warning("[Batch] 요청 실패: %s (%s)", entry.custom_id, entry.result.type)
+                continue
+
+            text = "".join(
+                block.text for block in entry.result.message.content if block.type == "text"
+            )
+            try:
+                results[entry.custom_id] = parse_json_response(text)
+            except ClaudeClientError as e:
+                logger.warning("[Batch] 응답 해석 실패: %s (%s)", entry.custom_id, e)
+
+        logger.info("[Batch] 배치 완료: %s (성공 %d/%d)", batch.id, len(results), len(requests))
+        return results
+
+    async def _wait_until_ended(self, batch_id: str) -> None:
+        """배치 처리가 끝날 때까지 간격을 늘려 가며 상태를 확인합니다."""
+        delay = BATCH_POLL_INITIAL_DELAY
+        deadline = time.monotonic() + BATCH_MAX_WAIT_SECONDS
+
+        while True:
+            batch = await self._client.messages.batches.retrieve(batch_id)
+            if batch.processing_status == "ended":
+                return
+            if time.monotonic() >= deadline:
+                raise ClaudeClientError(
+                    "배치 처리 대기 시간을 초과했습니다", details={"batch_id": batch_id}
+                )
+
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, BATCH_POLL_MAX_DELAY)
@@ -15,12 +15,18 @@ import os
 import sys
 import asyncio
 import logging
+import time
 from typing import Optional
-from datetime import datetime
 from concurrent.futures import ThreadPoolExecutor
 
 from app.exceptions import ClaudeClientError
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # orjson이 없으면 표준 json 모듈로 파싱
+    _json_loads = json.loads
+
 # 로깅 설정: 시스템의 동작 상태를 기록합니다.
 logging.basicConfig(
     level=logging.INFO,
@@ -28,6 +34,41 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# 모든 텍스트/JSON 요청이 공유하는 고정 프롬프트 조각 (모듈 로드 시 한 번만 생성).
+# 바뀌지 않는 지침을 앞에, 요청마다 달라지는 입력 데이터를 뒤에 두어
+# CLI의 프롬프트 캐시가 동일한 접두사를 재사용할 수 있게 합니다.
+_PROMPT_HEADER = (
+    "[중요: 이 요청은 프로그램 API 호출입니다. 시스템 안내 메시지나 대화형 응답을 출력하지 마세요.]\n"
+    "\n"
+    "역할: 요구사항 분석 전문가\n"
+    "작업: "
+)
+_INPUT_DATA_LABEL = "\n\n입력 데이터:\n"
+_TEXT_RESPONSE_RULES = (
+    "\n\n[필수] 요청된 내용만 직접 응답하세요. 인사말이나 안내 메시지 없이 결과만 출력합니다."
+)
+# JSON 응답 규칙은 Message Batches 요청(ClaudeBatchClient)과 정규화 캐시 버전에서도 사용
+JSON_RESPONSE_RULES = (
+    "\n\n[필수 응답 형식]\n"
+    "- 반드시 유효한 JSON만 출력\n"
+    "- 설명, 인사말, 마크다운 없이 순수 JSON만 반환\n"
+    "- { 또는 [ 로 시작하여 } 또는 ] 로 끝나야 함"
+)
+
+
+# 응답 텍스트 중간에서 JSON 값 하나를 읽어 내는 디코더
+_JSON_DECODER = json.JSONDecoder()
+
+# 다시 시도해도 결과가 같은 오류 (claude CLI가 없거나 실행 권한이 없음) - 재시도 없이 바로 실패
+_NON_RETRYABLE_ERRORS = (FileNotFoundError, PermissionError)
+
+
+def build_prompt(system_prompt: str, user_prompt: str, response_rules: str) -> str:
+    """고정 조각과 요청별 지침/입력을 이어 붙여 CLI 프롬프트를 만듭니다 (정규화 캐시 버전 계산에도 사용)."""
+    return "".join(
+        (_PROMPT_HEADER, system_prompt, _INPUT_DATA_LABEL, user_prompt, response_rules)
+    )
+
 
 class ClaudeClient:
     """
@@ -77,16 +118,7 @@ class ClaudeClient:
         Returns:
             AI의 답변 텍스트
         """
-        full_prompt = f"""[중요: 이 요청은 프로그램 API 호출입니다. 시스템 안내 메시지나 대화형 응답을 출력하지 마세요.]
-
-역할: 요구사항 분석 전문가
-작업: {system_prompt}
-
-입력 데이터:
-{user_prompt}
-
-[필수] 요청된 내용만 직접 응답하세요. 인사말이나 안내 메시지 없이 결과만 출력합니다."""
-
+        full_prompt = build_prompt(system_prompt, user_prompt, _TEXT_RESPONSE_RULES)
         return await self._execute_claude_cli(full_prompt)
 
     async def complete_json(
@@ -107,21 +139,9 @@ class ClaudeClient:
         Returns:
             파싱된 데이터 (딕셔너리 형태)
         """
-        full_prompt = f"""[중요: 이 요청은 프로그램 API 호출입니다. 시스템 안내 메시지나 대화형 응답을 출력하지 마세요.]
-
-역할: 요구사항 분석 전문가
-작업: {system_prompt}
-
-입력 데이터:
-{user_prompt}
-
-[필수 응답 형식]
-- 반드시 유효한 JSON만 출력
-- 설명, 인사말, 마크다운 없이 순수 JSON만 반환
-- {{ 또는 [ 로 시작하여 }} 또는 ] 로 끝나야 함"""
-
+        full_prompt = build_prompt(system_prompt, user_prompt, JSON_RESPONSE_RULES)
         response = await self._execute_claude_cli(full_prompt)
-        return self._parse_json_response(response)
+        return parse_json_response(response)
 
     async def analyze_image(
         self,
@@ -211,7 +231,7 @@ class ClaudeClient:
         prompt_len = len(prompt)
         logger.info(f"[CLI] 프롬프트 길이: {prompt_len} chars")
 
-        start_time = datetime.now()
+        start_time = time.perf_counter()
 
         try:
             use_shell = sys.platform == "win32"
@@ -235,7 +255,7 @@ class ClaudeClient:
                 cwd=temp_dir,  # 임시 디렉토리에서 실행
             )
 
-            elapsed = (datetime.now() - start_time).total_seconds()
+            elapsed = time.perf_counter() - start_time
             logger.info(f"[CLI] 완료: {elapsed:.1f}초, 상태코드={result.returncode}")
 
             if result.returncode != 0:
@@ -247,7 +267,7 @@ class ClaudeClient:
             return result.stdout.strip()
 
         except subprocess.TimeoutExpired:
-            elapsed = (datetime.now() - start_time).total_seconds()
+            elapsed = time.perf_counter() - start_time
             logger.error(f"[CLI] 타임아웃! {elapsed:.1f}초")
             raise
 
@@ -287,6 +307,7 @@ class ClaudeClient:
         - 2차 시도: 2초 대기
         - 3차 시도: 4초 대기
         - 모두 실패하면 에러 발생
+        - CLI 실행 자체가 불가능한 오류(_NON_RETRYABLE_ERRORS)는 재시도하지 않음
         """
         last_error = None
 
@@ -303,6 +324,10 @@ class ClaudeClient:
                 logger.info(f"[CLI] 시도 {attempt + 1} 성공")
                 return result
 
+            except _NON_RETRYABLE_ERRORS as e:
+                logger.error(f"[CLI] 실행 불가, 재시도 생략: {type(e).__name__}: {e}")
+                raise
+
             except Exception as e:
                 last_error = e
                 logger.error(f"[CLI] 시도 {attempt + 1} 실패: {type(e).__name__}: {e}")
@@ -338,6 +363,10 @@ class ClaudeClient:
 
                 return result
 
+            except _NON_RETRYABLE_ERRORS as e:
+                logger.error(f"[CLI] 실행 불가, 재시도 생략: {type(e).__name__}: {e}")
+                raise
+
             except Exception as e:
                 last_error = e
                 logger.error(f"[CLI] 파일 첨부 요청 실패: {e}")
@@ -347,29 +376,43 @@ class ClaudeClient:
         raise last_error
 
     def _parse_json_response(self, response: str) -> dict:
-        """
-        AI의 응답 텍스트에서 JSON 데이터를 추출하는 함수입니다.
-        AI가 가끔 설명이나 마크다운 기호(```json 등)를 붙여서 주는데, 이를 깨끗하게 정리해서 데이터만 뽑아냅니다.
-        """
-        logger.debug(f"[JSON] 파싱 시작")
+        """AI의 응답 텍스트에서 JSON 데이터를 추출합니다 (parse_json_response 참고)."""
+        return parse_json_response(response)
 
-        # 응답이 비어있으면 빈 딕셔너리 반환
-        if not response or not response.strip():
-            logger.warning("[JSON] 응답이 비어있음, 빈 딕셔너리 반환")
-            return {}
-
-        # 1. 앞뒤 공백 및 마크다운 기호 제거
-        cleaned = response.strip()
 
-        if cleaned.startswith("```json"):
-            cleaned = cleaned[7:]
-        elif cleaned.startswith("```"):
-            cleaned = cleaned[3:]
-        if cleaned.endswith("```"):
-            cleaned = cleaned[:-3]
-        cleaned = cleaned.strip()
-
-        # 2. PRD 시스템 안내 메시지인지 확인 (Claude Code 프로젝트 컨텍스트로 인한 응답)
+def parse_json_response(response: str) -> dict:
+    """
+    AI의 응답 텍스트에서 JSON 데이터를 추출하는 함수입니다.
+    AI가 가끔 설명이나 마크다운 기호(```json 등)를 붙여서 주는데, 이를 깨끗하게 정리해서 데이터만 뽑아냅니다.
+    """
+    logger.debug(f"[JSON] 파싱 시작")
+
+    # 응답이 비어있으면 빈 딕셔너리 반환
+    if not response or not response.strip():
+        logger.warning("[JSON] 응답이 비어있음, 빈 딕셔너리 반환")
+        return {}
+
+    # 1. 앞뒤 공백 및 마크다운 기호 제거
+    cleaned = response.strip()
+
+    if cleaned.startswith("```json"):
+        cleaned = cleaned[7:]
+    elif cleaned.startswith("```"):
+        cleaned = cleaned[3:]
+    if cleaned.endswith("```"):
+        cleaned = cleaned[:-3]
+    cleaned = cleaned.strip()
+
+    # 2. JSON 변환 시도 (정상 응답은 대부분 여기서 끝남)
+    try:
+        result = _json_loads(cleaned)
+        logger.debug("[JSON] 직접 파싱 성공")
+        return result
+    except json.JSONDecodeError as e:
+        logger.warning(f"[JSON] 직접 파싱 실패: {e}")
+
+        # 3. PRD 시스템 안내 메시지인지 확인 (Claude Code 프로젝트 컨텍스트로 인한 응답)
+        #    JSON이 아닌 응답에서만 확인하여 요구사항 본문에 같은 문구가 있어도 버리지 않음
         system_indicators = [
             "안녕하세요! PRD",
             "PRD 생성 시스템",
@@ -382,49 +425,25 @@ class ClaudeClient:
             logger.warning("[JSON] Claude Code 시스템 응답 감지, 빈 결과 반환")
             return {}
 
-        # 3. JSON 변환 시도
-        try:
-            result = json.loads(cleaned)
-            logger.debug("[JSON] 직접 파싱 성공")
-            return result
-        except json.JSONDecodeError as e:
-            logger.warning(f"[JSON] 직접 파싱 실패: {e}")
-
-            # 4. 실패 시 텍스트 내에서 중괄호({})
-            # 또는 대괄호([])를 찾아서 추출 시도
-            start_idx = cleaned.find("{")
-            if start_idx == -1:
-                start_idx = cleaned.find("[")
-
-            if start_idx != -1:
-                # 괄호 짝 맞추기 로직
-                bracket = "{" if cleaned[start_idx] == "{" else "["
-                closing = "}" if bracket == "{" else "]"
-
-                depth = 0
-                end_idx = start_idx
-
-                for i, char in enumerate(cleaned[start_idx:], start_idx):
-                    if char == bracket:
-                        depth += 1
-                    elif char == closing:
-                        depth -= 1
-                        if depth == 0:
-                            end_idx = i + 1
-                            break
-
-                try:
-                    result = json.loads(cleaned[start_idx:end_idx])
-                    logger.debug("[JSON] 추출 파싱 성공")
-                    return result
-                except json.JSONDecodeError as e2:
-                    logger.error(f"[JSON] 추출 파싱 실패: {e2}")
-
-            logger.error(f"[JSON] 최종 파싱 실패")
-            raise ClaudeClientError(
-                "Claude 응답에서 유효한 JSON을 추출할 수 없습니다",
-                details={"response_preview": cleaned[:200]},
-            )
+        # 4. 실패 시 앞의 설명문을 건너뛰고 처음 나오는 { 부터 (없으면 [ 부터)
+        #    JSON 값 하나만 디코딩 (뒤에 붙은 텍스트는 무시, 문자열 안의 괄호도 안전)
+        #    호출하는 쪽 대부분이 딕셔너리를 기대하므로 객체를 배열보다 먼저 찾음
+        start_idx = cleaned.find("{")
+        if start_idx == -1:
+            start_idx = cleaned.find("[")
+        if start_idx != -1:
+            try:
+                result, _ = _JSON_DECODER.raw_decode(cleaned, start_idx)
+                logger.debug("[JSON] 추출 파싱 성공")
+                return result
+            except json.JSONDecodeError as e2:
+                logger.error(f"[JSON] 추출 파싱 실패: {e2}")
+
+        logger.error(f"[JSON] 최종 파싱 실패")
+        raise ClaudeClientError(
+            "Claude 응답에서 유효한 JSON을 추출할 수 없습니다",
+            details={"response_preview": cleaned[:200]},
+        )
 
 
 # 전역 변수로 클라이언트 인스턴스 저장 (싱글톤 패턴)
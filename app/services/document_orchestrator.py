@@ -107,7 +107,7 @@ class DocumentOrchestrator:
             생성된 문서들의 정보가 담긴 DocumentBundle 객체
         """
         bundle = DocumentBundle()
-        total_start = time.time()
+        total_start = time.perf_counter()
         
         if verbose:
             safe_print("\n" + "=" * 70)
@@ -156,7 +156,7 @@ class DocumentOrchestrator:
             logger.error(f"문서 생성 중 오류: {e}", exc_info=True)
             bundle.errors.append(str(e))
         
-        bundle.total_time_seconds = time.time() - total_start
+        bundle.total_time_seconds = time.perf_counter() - total_start
         
         if verbose:
             self._print_summary(bundle, include_proposal)
@@ -191,16 +191,16 @@ class DocumentOrchestrator:
             validator = Validator(client)
             generator = PRDGenerator(client)
             
-            # Layer 1: 파싱 (파일 읽기)
+            # Layer 1: 파싱 (파일 읽기, 여러 파일 동시 처리)
+            results = await factory.parse_files(
+                files, [self._get_input_type(f) for f in files]
+            )
             parsed_contents = []
-            for file_path in files:
-                try:
-                    input_type = self._get_input_type(file_path)
-                    parser = factory.get_parser(input_type)
-                    parsed = await parser.parse(file_path)
-                    parsed_contents.append(parsed)
-                except Exception as e:
-                    logger.warning(f"파싱 실패 ({file_path.name}): {e}")
+            for file_path, result in zip(files, results):
+                if isinstance(result, Exception):
+                    logger.warning(f"파싱 실패 ({file_path.name}): {result}")
+                else:
+                    parsed_contents.append(result)
             
             if not parsed_contents:
                 return None
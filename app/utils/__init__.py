@@ -7,6 +7,7 @@ from .validation import (
     validate_file_signature,
     validate_document_count,
 )
+from .tokens import estimate_tokens, truncate_to_tokens
 
 __all__ = [
     "validate_filename",
@@ -14,4 +15,6 @@ __all__ = [
     "validate_file_extension",
     "validate_file_signature",
     "validate_document_count",
+    "estimate_tokens",
+    "truncate_to_tokens",
 ]
@@ -0,0 +1,93 @@
+"""프롬프트 토큰 예산 유틸리티.
+
+Claude에게 보내는 문서 내용을 글자 수가 아니라 토큰 수 기준으로 자릅니다.
+Claude CLI에는 토큰 카운터가 없으므로 로컬 근사치를 사용합니다:
+- ASCII 문자: 약 4자당 1토큰 (영문, 숫자, CSV 구분자 등)
+- 그 외 문자(한글 등): 1자당 약 1토큰
+"""
+
+# ASCII 문자 기준 토큰 1개당 평균 글자 수
+ASCII_CHARS_PER_TOKEN = 4
+
+# 자르기 위치를 찾을 때 한 번에 세는 글자 수
+TRUNCATE_SCAN_CHUNK_CHARS = 1024
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    텍스트의 대략적인 토큰 수를 계산합니다.
+
+    Args:
+        text: 토큰 수를 셀 텍스트
+
+    Returns:
+        추정 토큰 수
+    """
+    if not text:
+        return 0
+    ascii_count = len(text.encode("ascii", "ignore"))
+    non_ascii_count = len(text) - ascii_count
+    return -(-ascii_count // ASCII_CHARS_PER_TOKEN) + non_ascii_count
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """
+    텍스트를 토큰 예산 안에 들어가도록 앞부분만 남기고 자릅니다.
+
+    Args:
+        text: 원본 텍스트
+        max_tokens: 최대 토큰 수
+
+    Returns:
+        예산 이내로 잘린 텍스트 (이미 예산 이내면 원본 그대로)
+    """
+    if not text or max_tokens <= 0:
+        return ""
+
+    # 문자 1개는 최대 1토큰이므로 글자 수가 예산 이하면 자를 필요가 없음
+    if len(text) <= max_tokens:
+        return text
+
+    # 문자 1개는 최소 1/4토큰이므로 이보다 뒤는 볼 필요가 없음
+    # (아주 긴 문서 전체를 세지 않도록 함)
+    limit = min(len(text), max_tokens * ASCII_CHARS_PER_TOKEN)
+    if limit == len(text) and estimate_tokens(text) <= max_tokens:
+        return text
+
+    # 앞에서부터 조각 단위로 토큰을 누적하다가 예산을 넘는 조각 안에서만 이진 탐색
+    # (접두사 전체를 반복해서 다시 세지 않음)
+    ascii_count = 0
+    non_ascii_count = 0
+    pos = 0
+    while pos < limit:
+        chunk = text[pos:min(pos + TRUNCATE_SCAN_CHUNK_CHARS, limit)]
+        chunk_ascii = len(chunk.encode("ascii", "ignore"))
+        if (
+            -(-(ascii_count + chunk_ascii) // ASCII_CHARS_PER_TOKEN)
+            + non_ascii_count + len(chunk) - chunk_ascii
+            > max_tokens
+        ):
+            return text[:pos + _fit_prefix(chunk, ascii_count, non_ascii_count, max_tokens)]
+        ascii_count += chunk_ascii
+        non_ascii_count += len(chunk) - chunk_ascii
+        pos += len(chunk)
+
+    return text[:pos]
+
+
+def _fit_prefix(chunk: str, ascii_before: int, non_ascii_before: int, max_tokens: int) -> int:
+    """앞부분 토큰 수가 주어졌을 때 예산 안에 들어가는 chunk의 가장 긴 접두사 길이"""
+    low = 0
+    high = len(chunk)
+    while low < high:
+        mid = (low + high + 1) // 2
+        part_ascii = len(chunk[:mid].encode("ascii", "ignore"))
+        tokens = (
+            -(-(ascii_before + part_ascii) // ASCII_CHARS_PER_TOKEN)
+            + non_ascii_before + mid - part_ascii
+        )
+        if tokens <= max_tokens:
+            low = mid
+        else:
+            high = mid - 1
+    return low
@@ -4,11 +4,25 @@ Tests the JSON extraction logic that handles various AI response formats:
 - Clean JSON, markdown-wrapped JSON, text with embedded JSON
 - System message detection
 - Error handling for unparseable content
+
+Also covers the CLI prompt assembly shared by complete/complete_json,
+the CLI retry policy, and ClaudeBatchClient result handling against a
+fake Message Batches API.
 """
 
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
 import pytest
 
-from app.services.claude_client import ClaudeClient
+from app.services import claude_batch_client, claude_client
+from app.services.claude_batch_client import ClaudeBatchClient
+from app.services.claude_client import (
+    JSON_RESPONSE_RULES,
+    ClaudeClient,
+    build_prompt,
+    _PROMPT_HEADER,
+)
 from app.exceptions import ClaudeClientError
 
 
@@ -75,6 +89,16 @@ class TestParseJsonResponseWithLeadingText:
         assert isinstance(result, dict)
         assert result["id"] == 1
 
+    def test_trailing_text_after_json_ignored(self, client):
+        response = 'Result: {"title": "a } b"} 이상입니다.'
+        result = client._parse_json_response(response)
+        assert result == {"title": "a } b"}
+
+    def test_object_preferred_over_earlier_bracket(self, client):
+        response = 'Note [see below]: {"key": "value"}'
+        result = client._parse_json_response(response)
+        assert result == {"key": "value"}
+
 
 class TestParseJsonResponseSystemMessage:
     def test_system_message_prd_returns_empty(self, client):
@@ -94,6 +118,19 @@ class TestParseJsonResponseSystemMessage:
         assert result == {}
 
 
+    def test_json_mentioning_indicator_phrase_is_kept(self, client):
+        """Valid JSON is returned even if a requirement mentions an indicator phrase."""
+        response = '[{"title": "PRD 생성 시스템 연동"}]'
+        result = client._parse_json_response(response)
+        assert result == [{"title": "PRD 생성 시스템 연동"}]
+
+
+class TestParseJsonResponseNonStandardValues:
+    def test_nan_value_parsed_by_fallback(self, client):
+        result = client._parse_json_response('{"confidence_score": NaN}')
+        assert list(result) == ["confidence_score"]
+
+
 class TestParseJsonResponseInvalid:
     def test_no_brackets_raises_error(self, client):
         """Response with no JSON-like content should raise ClaudeClientError."""
@@ -104,3 +141,120 @@ class TestParseJsonResponseInvalid:
         """Malformed JSON after bracket extraction should raise ClaudeClientError."""
         with pytest.raises(ClaudeClientError):
             client._parse_json_response("result: {broken json without closing")
+
+
+class TestBuildPrompt:
+    def test_fixed_instructions_precede_input(self):
+        prompt = build_prompt("PPT 분석", "슬라이드 {1}", JSON_RESPONSE_RULES)
+        assert prompt.startswith(_PROMPT_HEADER + "PPT 분석")
+        assert prompt.index("입력 데이터:\n슬라이드 {1}") < prompt.index("[필수 응답 형식]")
+        assert prompt.endswith("{ 또는 [ 로 시작하여 } 또는 ] 로 끝나야 함")
+
+
+# ===================================================================
+# ClaudeBatchClient (Message Batches API)
+# ===================================================================
+
+class _FakeBatches:
+    """messages.batches 대역: 두 번째 조회에서 처리 완료."""
+
+    def __init__(self, entries):
+        self.entries = entries
+        self.created = None
+        self.retrieve_count = 0
+
+    async def create(self, requests):
+        self.created = requests
+        return SimpleNamespace(id="batch_1")
+
+    async def retrieve(self, batch_id):
+        self.retrieve_count += 1
+        status = "ended" if self.retrieve_count > 1 else "in_progress"
+        return SimpleNamespace(processing_status=status)
+
+    async def results(self, batch_id):
+        async def iterate():
+            for entry in self.entries:
+                yield entry
+        return iterate()
+
+
+def _batch_entry(custom_id, text=None):
+    if text is None:
+        return SimpleNamespace(custom_id=custom_id, result=SimpleNamespace(type="errored"))
+    message = SimpleNamespace(content=[SimpleNamespace(type="text", text=text)])
+    return SimpleNamespace(
+        custom_id=custom_id, result=SimpleNamespace(type="succeeded", message=message)
+    )
+
+
+class TestCliRetry:
+    @pytest.fixture(autouse=True)
+    def no_sleep(self, monkeypatch):
+        monkeypatch.setattr(claude_client.asyncio, "sleep", AsyncMock())
+
+    @pytest.mark.asyncio
+    async def test_transient_failure_retried(self, client, monkeypatch):
+        calls = []
+
+        def run(prompt):
+            calls.append(prompt)
+            if len(calls) == 1:
+                raise RuntimeError("Claude CLI error: overloaded")
+            return "ok"
+
+        monkeypatch.setattr(client, "_run_claude_sync", run)
+        assert await client._execute_claude_cli("p") == "ok"
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_missing_cli_not_retried(self, client, monkeypatch):
+        calls = []
+
+        def run(prompt):
+            calls.append(prompt)
+            raise FileNotFoundError("claude")
+
+        monkeypatch.setattr(client, "_run_claude_sync", run)
+        with pytest.raises(FileNotFoundError):
+            await client._execute_claude_cli("p")
+        assert len(calls) == 1
+        claude_client.asyncio.sleep.assert_not_awaited()
+
+
+class TestClaudeBatchClient:
+    @pytest.fixture(autouse=True)
+    def no_sleep(self, monkeypatch):
+        monkeypatch.setattr(claude_batch_client.asyncio, "sleep", AsyncMock())
+
+    @pytest.mark.asyncio
+    async def test_results_parsed_by_custom_id(self):
+        batches = _FakeBatches([
+            _batch_entry("a", '```json\n[{"title": "로그인"}]\n```'),
+            _batch_entry("b"),
+            _batch_entry("c", "JSON 없음"),
+        ])
+        client = ClaudeBatchClient(
+            client=SimpleNamespace(messages=SimpleNamespace(batches=batches)), model="m"
+        )
+
+        results = await client.complete_json_batch(
+            {"a": ("지침", "입력 A"), "b": ("지침", "입력 B"), "c": ("지침", "입력 C")}
+        )
+
+        assert results == {"a": [{"title": "로그인"}]}
+        assert batches.retrieve_count == 2
+        params = batches.created[0]["params"]
+        assert params["model"] == "m"
+        assert params["system"] == [
+            {"type": "text", "text": "지침", "cache_control": {"type": "ephemeral"}}
+        ]
+        assert params["messages"][0]["content"] == "입력 A" + JSON_RESPONSE_RULES
+
+    def test_requires_api_key_without_client(self, monkeypatch):
+        monkeypatch.setattr(
+            claude_batch_client, "get_settings",
+            lambda: SimpleNamespace(anthropic_api_key="", claude_model="m"),
+        )
+        with pytest.raises(ClaudeClientError):
+            ClaudeBatchClient()
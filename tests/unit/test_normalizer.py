@@ -3,12 +3,35 @@
 Tests the pure/synchronous methods of the Normalizer without AI calls:
 - _convert_to_requirement: converts a raw dict to NormalizedRequirement
 - _extract_from_content: extracts raw requirement dicts from ParsedContent
+- _extract_and_normalize_all: prompt layout sent to the (mocked) client
+  and reuse of cached extraction results
+- normalize: concurrency limit across documents
+- normalize: packing small documents into one batched Claude call
 """
 
+import asyncio
+
 import pytest
 from unittest.mock import AsyncMock
 
-from app.layers.layer2_normalization.normalizer import Normalizer
+from app.layers.layer2_normalization import normalizer as normalizer_module
+from app.layers.layer2_normalization.normalizer import (
+    EXTRACTION_CONTENT_MAX_TOKENS,
+    EXTRACTION_SECTIONS_MAX_TOKENS,
+    EXTRACTION_MAX_SECTIONS,
+    BATCH_EXTRACTION_SYSTEM_PROMPT,
+    CONVERT_IN_THREAD_MIN_ITEMS,
+    BATCH_MAX_DOCUMENTS,
+    BATCH_TOKEN_BUDGET,
+    EXTRACTION_CACHE_MAX_ENTRIES,
+    EXTRACTION_PROMPT_VERSION,
+    EXTRACTION_SYSTEM_PROMPT,
+    Normalizer,
+)
+from app.layers.layer2_normalization.prompts import REQUIREMENT_EXTRACTION_FORMAT
+from app.services.cache import FileCache
+from app.services.claude_client import JSON_RESPONSE_RULES, build_prompt
+from app.utils.tokens import estimate_tokens
 from app.models import (
     ParsedContent,
     InputMetadata,
@@ -43,6 +66,15 @@ def _make_raw_requirement(**overrides) -> dict:
     return defaults
 
 
+def _make_parsed(raw_text: str) -> ParsedContent:
+    """Helper to build ParsedContent with raw text only."""
+    return ParsedContent(
+        raw_text=raw_text,
+        metadata=InputMetadata(filename="test.txt"),
+        sections=[],
+    )
+
+
 # ===================================================================
 # _convert_to_requirement: type mapping
 # ===================================================================
@@ -74,6 +106,29 @@ class TestConvertToRequirementTypeMapping:
         req = normalizer._convert_to_requirement(raw, 5, "test.txt", "doc-001")
         assert req.type == RequirementType.FUNCTIONAL
 
+    def test_lowercase_and_descriptive_types(self, normalizer):
+        for value, expected in [
+            ("nfr", RequirementType.NON_FUNCTIONAL),
+            ("Non-Functional Requirement", RequirementType.NON_FUNCTIONAL),
+            ("constraint (법적)", RequirementType.CONSTRAINT),
+        ]:
+            raw = _make_raw_requirement(type=value)
+            req = normalizer._convert_to_requirement(raw, 6, "test.txt", "doc-001")
+            assert req.type == expected
+
+    def test_padded_type_found_in_table(self, normalizer, caplog):
+        raw = _make_raw_requirement(type=" Constraint\n")
+        with caplog.at_level("DEBUG", logger="app.layers.layer2_normalization.normalizer"):
+            req = normalizer._convert_to_requirement(raw, 7, "test.txt", "doc-001")
+        assert req.type == RequirementType.CONSTRAINT
+        assert "표에 없는 type" not in caplog.text
+
+    def test_unknown_type_logged(self, normalizer, caplog):
+        raw = _make_raw_requirement(type="Business Rule")
+        with caplog.at_level("DEBUG", logger="app.layers.layer2_normalization.normalizer"):
+            normalizer._convert_to_requirement(raw, 8, "test.txt", "doc-001")
+        assert "표에 없는 type 값: 'Business Rule'" in caplog.text
+
 
 # ===================================================================
 # _convert_to_requirement: priority mapping
@@ -90,6 +145,17 @@ class TestConvertToRequirementPriorityMapping:
         req = normalizer._convert_to_requirement(raw, 2, "test.txt", "doc-001")
         assert req.priority == Priority.LOW
 
+    def test_lowercase_and_descriptive_priority(self, normalizer):
+        for value, expected in [("high", Priority.HIGH), ("Low (향후)", Priority.LOW)]:
+            raw = _make_raw_requirement(priority=value)
+            req = normalizer._convert_to_requirement(raw, 5, "test.txt", "doc-001")
+            assert req.priority == expected
+
+    def test_padded_priority_found_in_table(self, normalizer):
+        raw = _make_raw_requirement(priority=" low ")
+        req = normalizer._convert_to_requirement(raw, 6, "test.txt", "doc-001")
+        assert req.priority == Priority.LOW
+
     def test_unknown_priority_defaults_to_medium(self, normalizer):
         raw = _make_raw_requirement(priority="UNKNOWN")
         req = normalizer._convert_to_requirement(raw, 3, "test.txt", "doc-001")
@@ -127,6 +193,67 @@ class TestConvertToRequirementConfidenceScore:
         req = normalizer._convert_to_requirement(raw, 4, "test.txt", "doc-001")
         assert req.confidence_score == pytest.approx(0.7)
 
+    def test_numeric_string_score_parsed(self, normalizer):
+        raw = _make_raw_requirement(confidence_score="0.9")
+        req = normalizer._convert_to_requirement(raw, 5, "test.txt", "doc-001")
+        assert req.confidence_score == pytest.approx(0.9)
+
+    def test_integer_and_special_float_scores(self, normalizer):
+        for value, expected in [(1, 1.0), (0, 0.0), (float("nan"), 1.0), (float("-inf"), 0.0)]:
+            raw = _make_raw_requirement(confidence_score=value)
+            req = normalizer._convert_to_requirement(raw, 6, "test.txt", "doc-001")
+            assert req.confidence_score == expected
+            assert isinstance(req.confidence_score, float)
+
+
+# ===================================================================
+# _convert_to_requirement: short response keys
+# ===================================================================
+
+class TestConvertToRequirementShortKeys:
+    def test_short_keys_mapped_to_fields(self, normalizer):
+        raw = {"t": "로그인", "d": "이메일 로그인", "ty": "NFR", "p": "LOW", "cs": 0.9}
+        req = normalizer._convert_to_requirement(raw, 1, "test.txt", "doc-001")
+        assert req.title == "로그인"
+        assert req.description == "이메일 로그인"
+        assert req.type == RequirementType.NON_FUNCTIONAL
+        assert req.priority == Priority.LOW
+        assert req.confidence_score == pytest.approx(0.9)
+
+    def test_story_and_review_fields_mapped(self, normalizer):
+        raw = {
+            "t": "로그인", "d": "이메일 로그인", "ty": "FR", "p": "HIGH", "cs": 0.6,
+            "cr": "실패 처리 기준 없음",
+            "us": "As a 사용자, I want 이메일 로그인, so that 서비스를 이용한다",
+            "ac": ["잘못된 비밀번호는 거부된다"],
+            "as": ["이메일 인증 완료 계정"],
+            "mi": ["잠금 정책"],
+            "sn": "인증",
+        }
+        req = normalizer._convert_to_requirement(raw, 1, "test.txt", "doc-001")
+        assert req.confidence_reason == "실패 처리 기준 없음"
+        assert req.user_story.startswith("As a 사용자")
+        assert req.acceptance_criteria == ["잘못된 비밀번호는 거부된다"]
+        assert req.assumptions == ["이메일 인증 완료 계정"]
+        assert req.missing_info == ["잠금 정책"]
+        assert req.source_info.section == "인증"
+        assert req.source_reference == "test.txt [인증]"
+
+    def test_long_and_short_keys_mixed(self, normalizer):
+        raw = _make_raw_requirement(title="긴 키 제목")
+        del raw["description"]
+        raw["d"] = "짧은 키 설명"
+        req = normalizer._convert_to_requirement(raw, 2, "test.txt", "doc-001")
+        assert req.title == "긴 키 제목"
+        assert req.description == "짧은 키 설명"
+        assert req.acceptance_criteria == raw["acceptance_criteria"]
+
+    def test_extraction_format_uses_short_keys(self):
+        keys = ('"t":', '"d":', '"ty":', '"p":', '"cs":', '"cr":', '"us":', '"ac":', '"as":', '"mi":', '"sn":')
+        for key in keys:
+            assert key in REQUIREMENT_EXTRACTION_FORMAT
+        assert '"title"' not in REQUIREMENT_EXTRACTION_FORMAT
+
 
 # ===================================================================
 # _convert_to_requirement: source_info and other fields
@@ -162,10 +289,16 @@ class TestConvertToRequirementFields:
         assert req.assumptions == []
         assert req.missing_info == []
 
-    def test_id_format(self, normalizer):
+    def test_id_left_for_normalize_to_assign(self, normalizer):
         raw = _make_raw_requirement()
         req = normalizer._convert_to_requirement(raw, 42, "file.txt", "doc-001")
-        assert req.id == "REQ-042"
+        assert req.id == ""
+
+    def test_counter_used_for_default_title(self, normalizer):
+        raw = _make_raw_requirement()
+        del raw["title"]
+        req = normalizer._convert_to_requirement(raw, 3, "file.txt", "doc-001")
+        assert req.title == "요구사항 3"
 
     def test_title_truncated_to_50_chars(self, normalizer):
         long_title = "A" * 100
@@ -227,6 +360,29 @@ Admin dashboard for monitoring
         # The header-based extraction looks for lines starting with #
         assert any("Login Feature" in r.get("title", "") for r in result)
 
+    def test_raw_text_headers_with_indent_and_preamble(self, normalizer):
+        """Text before the first header is dropped; indented markers still count."""
+        parsed = ParsedContent(
+            raw_text="머리말\n  === 로그인 ===\n\n  이메일 로그인  \n\t# 결제\n카드 결제\nC# 언급\n---\n제목 없는 본문",
+            metadata=InputMetadata(filename="test.txt"),
+            sections=[],
+        )
+        result = normalizer._extract_from_content(parsed)
+        assert [(r["title"], r["description"]) for r in result] == [
+            ("로그인", "이메일 로그인"),
+            ("결제", "카드 결제\nC# 언급"),
+        ]
+
+    def test_long_raw_text_section_description_capped(self, normalizer):
+        parsed = ParsedContent(
+            raw_text="# 긴 섹션\n" + "\n".join(["   요구사항 설명 줄   "] * 2000),
+            metadata=InputMetadata(filename="test.txt"),
+            sections=[],
+        )
+        result = normalizer._extract_from_content(parsed)
+        assert len(result) == 1
+        assert result[0]["description"] == "\n".join(["요구사항 설명 줄"] * 2000)[:500]
+
     def test_empty_content_returns_empty_list(self, normalizer):
         parsed = ParsedContent(
             raw_text="",
@@ -251,3 +407,621 @@ Admin dashboard for monitoring
         result = normalizer._extract_from_content(parsed)
         assert len(result) == 1
         assert "Login feature" in result[0]["description"]
+
+    def test_section_with_non_string_content(self, normalizer):
+        """Non-string section content is converted instead of failing."""
+        parsed = ParsedContent(
+            raw_text="",
+            metadata=InputMetadata(filename="test.txt"),
+            sections=[
+                {"title": "Empty", "content": None},
+                {"title": "Code", "content": 123456789012},
+            ],
+        )
+        result = normalizer._extract_from_content(parsed)
+        assert [r["title"] for r in result] == ["Code"]
+        assert result[0]["description"] == "123456789012"
+
+
+# ===================================================================
+# _extract_and_normalize_all: prompt layout
+# ===================================================================
+
+class TestExtractionPromptLayout:
+    @pytest.mark.asyncio
+    async def test_format_spec_sent_as_static_system_prompt(self, normalizer):
+        normalizer.claude_client.complete_json.return_value = []
+        parsed = ParsedContent(
+            raw_text="로그인 기능이 필요합니다.",
+            metadata=InputMetadata(filename="a.txt"),
+            sections=[],
+        )
+        await normalizer._extract_and_normalize_all(parsed, "a.txt", "doc-1")
+
+        kwargs = normalizer.claude_client.complete_json.call_args.kwargs
+        assert kwargs["system_prompt"] is EXTRACTION_SYSTEM_PROMPT
+        assert EXTRACTION_SYSTEM_PROMPT.endswith(REQUIREMENT_EXTRACTION_FORMAT)
+        assert "형식:" not in kwargs["user_prompt"]
+        assert "로그인 기능이 필요합니다." in kwargs["user_prompt"]
+
+    @pytest.mark.asyncio
+    async def test_cli_prompt_prefix_identical_across_documents(self, normalizer):
+        """Everything before the document text must be byte-identical between documents."""
+        normalizer.claude_client.complete_json.return_value = []
+        cli_prompts = []
+        for text in ("첫 번째 요구사항 문서", "두 번째 요구사항 문서"):
+            await normalizer._extract_and_normalize_all(_make_parsed(text), "a.txt", "doc-1")
+            kwargs = normalizer.claude_client.complete_json.call_args.kwargs
+            cli_prompts.append(
+                build_prompt(kwargs["system_prompt"], kwargs["user_prompt"], JSON_RESPONSE_RULES)
+            )
+
+        static_prefix = cli_prompts[0].split("===DOCUMENT===\n", 1)[0] + "===DOCUMENT===\n"
+        assert cli_prompts[1].startswith(static_prefix)
+        assert REQUIREMENT_EXTRACTION_FORMAT in static_prefix
+
+    @pytest.mark.asyncio
+    async def test_sections_delimiter_emitted_even_without_sections(self, normalizer):
+        normalizer.claude_client.complete_json.return_value = []
+        with_sections = ParsedContent(
+            raw_text="본문 A: 로그인 기능",
+            metadata=InputMetadata(filename="a.txt"),
+            sections=[{"title": "개요", "content": "섹션 내용"}],
+        )
+        without_sections = ParsedContent(
+            raw_text="본문 B: 결제 기능 요구사항",
+            metadata=InputMetadata(filename="b.txt"),
+            sections=[],
+        )
+
+        prompts = []
+        for parsed in (with_sections, without_sections):
+            await normalizer._extract_and_normalize_all(parsed, "x", "doc-1")
+            prompts.append(normalizer.claude_client.complete_json.call_args.kwargs["user_prompt"])
+
+        assert prompts[0] == "===DOCUMENT===\n본문 A: 로그인 기능\n\n===SECTIONS===\n[개요] 섹션 내용"
+        assert prompts[1] == "===DOCUMENT===\n본문 B: 결제 기능 요구사항\n\n===SECTIONS===\n"
+
+
+class TestExtractionInputBudget:
+    def test_korean_content_cut_by_tokens(self):
+        parsed = _make_parsed("가" * 10000)
+        prompt = Normalizer._build_extraction_input(parsed)
+        document = prompt.split("===DOCUMENT===\n", 1)[1].split("\n\n===SECTIONS===\n")[0]
+        assert document == "가" * EXTRACTION_CONTENT_MAX_TOKENS
+
+    def test_ascii_content_keeps_more_chars(self):
+        parsed = _make_parsed("a" * 50000)
+        prompt = Normalizer._build_extraction_input(parsed)
+        document = prompt.split("===DOCUMENT===\n", 1)[1].split("\n\n===SECTIONS===\n")[0]
+        assert len(document) == EXTRACTION_CONTENT_MAX_TOKENS * 4
+
+    def test_sections_summary_accepts_list_and_missing_content(self):
+        parsed = ParsedContent(
+            raw_text="본문",
+            metadata=InputMetadata(filename="a.txt"),
+            sections=[
+                {"title": "기능", "content": ["로그인", "결제"]},
+                {"content": "x" * 400},
+            ],
+        )
+        prompt = Normalizer._build_extraction_input(parsed)
+        sections = prompt.split("===SECTIONS===\n", 1)[1]
+        assert sections == "[기능] 로그인\n결제\n[Section] " + "x" * 300
+
+    def test_sections_summary_cut_by_tokens(self):
+        parsed = ParsedContent(
+            raw_text="본문",
+            metadata=InputMetadata(filename="a.txt"),
+            sections=[{"title": f"섹션{i}", "content": f"{i}번 " + "나" * 300} for i in range(8)],
+        )
+        prompt = Normalizer._build_extraction_input(parsed)
+        sections = prompt.split("===SECTIONS===\n", 1)[1]
+        assert estimate_tokens(sections) <= EXTRACTION_SECTIONS_MAX_TOKENS
+        assert sections.startswith("[섹션0] ")
+
+    def test_near_duplicate_sections_sent_once(self):
+        body = (
+            "본 시스템은 사용자가 이메일과 비밀번호로 로그인할 수 있어야 하며 비밀번호는 최소 8자 "
+            "이상이어야 한다. 로그인 실패 5회 시 계정을 잠근다. 관리자는 잠긴 계정을 해제할 수 있다. "
+            "모든 로그인 시도는 감사 로그에 기록된다. 세션은 30분 동안 유지된다."
+        )
+        parsed = ParsedContent(
+            raw_text="본문",
+            metadata=InputMetadata(filename="a.txt"),
+            sections=[
+                {"title": "로그인", "content": body},
+                {"title": "목차", "content": ""},
+                {"title": "로그인 (부록)", "content": body.replace("30분", "60분")},
+                {"title": "결제", "content": "결제는 신용카드와 계좌이체를 지원한다."},
+            ],
+        )
+        prompt = Normalizer._build_extraction_input(parsed)
+        sections = prompt.split("===SECTIONS===\n", 1)[1]
+        titles = [line.split("]")[0][1:] for line in sections.split("\n")]
+        assert titles == ["로그인", "목차", "결제"]
+
+    def test_section_content_already_in_body_sent_as_title_only(self):
+        login = "사용자는 이메일과 비밀번호로 로그인할 수 있어야 한다."
+        parsed = ParsedContent(
+            raw_text=f"# 로그인\n{login}\n",
+            metadata=InputMetadata(filename="a.txt"),
+            sections=[{"title": "로그인", "content": login}],
+        )
+        prompt = Normalizer._build_extraction_input(parsed)
+        assert prompt.count(login) == 1
+        assert prompt.split("===SECTIONS===\n", 1)[1] == "[로그인] "
+
+    def test_section_beyond_truncated_body_keeps_preview(self):
+        tail = "결제는 신용카드와 계좌이체를 지원한다."
+        parsed = ParsedContent(
+            raw_text="가" * (EXTRACTION_CONTENT_MAX_TOKENS * 2) + tail,
+            metadata=InputMetadata(filename="a.txt"),
+            sections=[{"title": "결제", "content": tail}],
+        )
+        prompt = Normalizer._build_extraction_input(parsed)
+        assert prompt.split("===SECTIONS===\n", 1)[1] == f"[결제] {tail}"
+
+    def test_skipped_duplicates_free_slots_for_later_sections(self):
+        repeated = [{"title": f"머리말{i}", "content": "회사 기밀 문서 무단 배포 금지"} for i in range(10)]
+        distinct = [
+            {"title": f"기능{i}", "content": f"기능 {i} 상세 설명"}
+            for i in range(EXTRACTION_MAX_SECTIONS)
+        ]
+        parsed = ParsedContent(
+            raw_text="본문",
+            metadata=InputMetadata(filename="a.txt"),
+            sections=repeated + distinct,
+        )
+        prompt = Normalizer._build_extraction_input(parsed)
+        sections = prompt.split("===SECTIONS===\n", 1)[1].split("\n")
+        assert len(sections) == EXTRACTION_MAX_SECTIONS
+        assert sections[0].startswith("[머리말0] ")
+        assert sections[-1].startswith(f"[기능{EXTRACTION_MAX_SECTIONS - 2}] ")
+
+    def test_same_content_truncated_once(self, monkeypatch):
+        calls = []
+
+        def counting_truncate(text, max_tokens):
+            calls.append(max_tokens)
+            return text[:max_tokens]
+
+        monkeypatch.setattr(normalizer_module, "truncate_to_tokens", counting_truncate)
+        normalizer_module._truncate_content.cache_clear()
+        raw_text = "재정규화 문서 " * 1000
+
+        first = Normalizer._build_extraction_input(_make_parsed(raw_text))
+        second = Normalizer._build_extraction_input(_make_parsed(raw_text))
+        normalizer_module._truncate_content.cache_clear()
+
+        assert first == second
+        assert calls.count(EXTRACTION_CONTENT_MAX_TOKENS) == 1
+
+    def test_rebuilding_input_reuses_section_hashes(self):
+        sections = [
+            {"title": f"기능{i}", "content": f"기능 {i} 상세 설명 " * 10}
+            for i in range(3)
+        ]
+        normalizer_module._simhash.cache_clear()
+
+        first = Normalizer._build_extraction_input(ParsedContent(raw_text="본문", sections=sections))
+        second = Normalizer._build_extraction_input(ParsedContent(raw_text="본문", sections=list(sections)))
+        info = normalizer_module._simhash.cache_info()
+        normalizer_module._simhash.cache_clear()
+
+        assert first == second
+        assert (info.misses, info.hits) == (3, 3)
+
+
+class TestLargeResponseConversion:
+    @pytest.mark.asyncio
+    async def test_many_requirements_converted_in_order(self, normalizer):
+        count = CONVERT_IN_THREAD_MIN_ITEMS + 5
+        normalizer.claude_client.complete_json.return_value = [
+            _make_raw_requirement(title=f"요구사항 {i}") for i in range(count)
+        ]
+        requirements = await normalizer._extract_and_normalize_all(
+            _make_parsed("요구사항이 많은 큰 응답 문서"), "a.txt", "doc-1"
+        )
+        assert [r.title for r in requirements] == [f"요구사항 {i}" for i in range(count)]
+
+    def test_malformed_items_skipped(self, normalizer):
+        raw_reqs = [
+            "문자열 항목",
+            _make_raw_requirement(title="정상"),
+            _make_raw_requirement(acceptance_criteria="목록이 아님"),
+        ]
+        requirements = normalizer._convert_all(raw_reqs, "a.txt", "doc-1")
+        assert [r.title for r in requirements] == ["정상"]
+
+
+# ===================================================================
+# _extract_and_normalize_all: extraction result cache
+# ===================================================================
+
+class TestExtractionCache:
+    @pytest.mark.asyncio
+    async def test_same_document_reuses_cached_result(self, normalizer):
+        normalizer.claude_client.complete_json.return_value = [_make_raw_requirement()]
+        parsed = _make_parsed("로그인 기능이 필요합니다.")
+
+        first = await normalizer._extract_and_normalize_all(parsed, "a.txt", "doc-1")
+        second = await normalizer._extract_and_normalize_all(parsed, "a.txt", "doc-2")
+
+        assert normalizer.claude_client.complete_json.await_count == 1
+        assert [r.title for r in first] == [r.title for r in second]
+        assert second[0].source_info.document_id == "doc-2"
+
+    @pytest.mark.asyncio
+    async def test_different_documents_are_not_shared(self, normalizer):
+        normalizer.claude_client.complete_json.return_value = [_make_raw_requirement()]
+
+        await normalizer._extract_and_normalize_all(_make_parsed("로그인 요구사항 문서 A"), "a", "d")
+        await normalizer._extract_and_normalize_all(_make_parsed("결제 요구사항 문서 B"), "b", "d")
+
+        assert normalizer.claude_client.complete_json.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_empty_response_not_cached(self, normalizer):
+        normalizer.claude_client.complete_json.return_value = {}
+        parsed = _make_parsed("로그인 기능이 필요합니다.")
+
+        await normalizer._extract_and_normalize_all(parsed, "a.txt", "doc-1")
+        await normalizer._extract_and_normalize_all(parsed, "a.txt", "doc-1")
+
+        assert normalizer.claude_client.complete_json.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cache_is_bounded(self, normalizer):
+        normalizer.claude_client.complete_json.return_value = [_make_raw_requirement()]
+
+        for i in range(EXTRACTION_CACHE_MAX_ENTRIES + 1):
+            await normalizer._extract_and_normalize_all(_make_parsed(f"요구사항 문서 번호 {i}"), "f", "d")
+
+        assert len(normalizer._extraction_cache) == EXTRACTION_CACHE_MAX_ENTRIES
+
+
+class TestPersistentExtractionCache:
+    @staticmethod
+    def _normalizer(tmp_path):
+        client = AsyncMock()
+        client.complete_json.return_value = [_make_raw_requirement()]
+        return Normalizer(claude_client=client, result_cache=FileCache(cache_dir=tmp_path))
+
+    @pytest.mark.asyncio
+    async def test_result_reused_across_normalizer_instances(self, tmp_path):
+        parsed = _make_parsed("로그인 기능이 필요합니다.")
+        first = self._normalizer(tmp_path)
+        await first._extract_and_normalize_all(parsed, "a.txt", "doc-1")
+
+        second = self._normalizer(tmp_path)
+        requirements = await second._extract_and_normalize_all(parsed, "a.txt", "doc-1")
+
+        second.claude_client.complete_json.assert_not_awaited()
+        assert [r.title for r in requirements] == ["User Login"]
+
+    @pytest.mark.asyncio
+    async def test_entry_keyed_by_prompt_version(self, tmp_path):
+        normalizer = self._normalizer(tmp_path)
+        await normalizer._extract_and_normalize_all(_make_parsed("로그인 요구사항 문서"), "a", "d")
+
+        files = list(tmp_path.glob("*.json"))
+        assert len(files) == 1
+        assert files[0].name.startswith(f"extract_{EXTRACTION_PROMPT_VERSION}_")
+
+    def test_prompt_version_follows_prompt_text(self):
+        version = normalizer_module._extraction_prompt_version
+        prompts = (EXTRACTION_SYSTEM_PROMPT, BATCH_EXTRACTION_SYSTEM_PROMPT)
+
+        assert version(prompts) == EXTRACTION_PROMPT_VERSION
+        changed = version((EXTRACTION_SYSTEM_PROMPT + "\n- 추가 규칙", BATCH_EXTRACTION_SYSTEM_PROMPT))
+        assert changed != EXTRACTION_PROMPT_VERSION
+        assert changed.split("-")[0] == EXTRACTION_PROMPT_VERSION.split("-")[0]
+
+    @pytest.mark.asyncio
+    async def test_empty_response_not_persisted(self, tmp_path):
+        normalizer = self._normalizer(tmp_path)
+        normalizer.claude_client.complete_json.return_value = {}
+        await normalizer._extract_and_normalize_all(_make_parsed("로그인 요구사항 문서"), "a", "d")
+
+        assert list(tmp_path.glob("*.json")) == []
+
+    def test_disabled_by_default(self, normalizer):
+        assert normalizer._result_cache is None
+
+
+# ===================================================================
+# normalize: concurrency limit
+# ===================================================================
+
+class TestNormalizeConcurrency:
+    def test_default_limit_comes_from_settings(self, normalizer):
+        from app.config import get_settings
+
+        assert normalizer.max_concurrency == get_settings().normalizer_max_concurrency
+
+    @pytest.mark.asyncio
+    async def test_documents_processed_up_to_limit_at_once(self):
+        active = 0
+        peak = 0
+
+        async def fake_complete_json(**kwargs):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return [_make_raw_requirement()]
+
+        client = AsyncMock()
+        client.complete_json.side_effect = fake_complete_json
+        normalizer = Normalizer(claude_client=client, max_concurrency=4)
+
+        # 묶음 예산을 넘는 큰 문서들이라 문서마다 따로 호출됨
+        docs = [_make_parsed(f"{i}" + "가" * 5000) for i in range(6)]
+        requirements = await normalizer.normalize(docs)
+
+        assert peak == 4
+        assert [r.id for r in requirements] == [f"REQ-{i:03d}" for i in range(1, 7)]
+
+    @pytest.mark.asyncio
+    async def test_failed_document_skipped_but_cancellation_raised(self, normalizer):
+        docs = [_make_parsed(f"{i}" + "가" * 5000) for i in range(2)]
+
+        normalizer._extract_and_normalize_all = AsyncMock(side_effect=[RuntimeError("실패"), []])
+        assert await normalizer.normalize(docs) == []
+
+        normalizer._extract_and_normalize_all = AsyncMock(side_effect=asyncio.CancelledError)
+        with pytest.raises(asyncio.CancelledError):
+            await normalizer.normalize(docs)
+
+
+# ===================================================================
+# normalize: batched extraction of small documents
+# ===================================================================
+
+class TestBatchedExtraction:
+    def test_pack_respects_limits(self):
+        small = "짧은 문서"
+        large = "가" * BATCH_TOKEN_BUDGET
+        texts = [small, small, large, small] + [small] * (BATCH_MAX_DOCUMENTS + 1)
+        entries = [(i, None, f"d{i}", t) for i, t in enumerate(texts)]
+
+        batches = Normalizer._pack_documents(entries)
+
+        assert [[e[0] for e in b] for b in batches] == [[0, 1, 3, 4, 5], [2], [6, 7, 8, 9]]
+
+    def test_small_documents_around_large_one_share_batch(self):
+        small = "짧은 문서"
+        half = "가" * (BATCH_TOKEN_BUDGET // 2 + 1)
+        texts = [small, half, half, small]
+        entries = [(i, None, f"d{i}", t) for i, t in enumerate(texts)]
+
+        batches = Normalizer._pack_documents(entries)
+
+        assert [[e[0] for e in b] for b in batches] == [[0, 1, 3], [2]]
+
+    @pytest.mark.asyncio
+    async def test_small_documents_share_one_call(self, normalizer):
+        normalizer.claude_client.complete_json.return_value = {
+            "1": [_make_raw_requirement(title="로그인")],
+            "2": [_make_raw_requirement(title="결제"), _make_raw_requirement(title="환불")],
+        }
+        docs = [_make_parsed("로그인 기능 요구사항 문서"), _make_parsed("결제 기능 요구사항 문서")]
+
+        requirements = await normalizer.normalize(docs, document_ids=["a", "b"])
+
+        normalizer.claude_client.complete_json.assert_awaited_once()
+        kwargs = normalizer.claude_client.complete_json.call_args.kwargs
+        assert kwargs["system_prompt"] is BATCH_EXTRACTION_SYSTEM_PROMPT
+        assert kwargs["user_prompt"].startswith("===DOC 1===\n===DOCUMENT===\n로그인 기능 요구사항 문서")
+        assert "===DOC 2===\n===DOCUMENT===\n결제 기능 요구사항 문서" in kwargs["user_prompt"]
+        assert [r.title for r in requirements] == ["로그인", "결제", "환불"]
+        assert [r.source_info.document_id for r in requirements] == ["a", "b", "b"]
+        assert [r.id for r in requirements] == ["REQ-001", "REQ-002", "REQ-003"]
+
+    @pytest.mark.asyncio
+    async def test_document_missing_from_batch_is_extracted_alone(self, normalizer):
+        normalizer.claude_client.complete_json.side_effect = [
+            {"1": [_make_raw_requirement(title="로그인")]},
+            [_make_raw_requirement(title="결제")],
+        ]
+        docs = [_make_parsed("로그인 기능 요구사항 문서"), _make_parsed("결제 기능 요구사항 문서")]
+
+        requirements = await normalizer.normalize(docs)
+
+        assert normalizer.claude_client.complete_json.await_count == 2
+        retry_kwargs = normalizer.claude_client.complete_json.call_args.kwargs
+        assert retry_kwargs["system_prompt"] is EXTRACTION_SYSTEM_PROMPT
+        assert [r.title for r in requirements] == ["로그인", "결제"]
+
+
+# ===================================================================
+# normalize: 내용 없는 문서 건너뛰기
+# ===================================================================
+
+class TestEmptyDocuments:
+    @pytest.mark.asyncio
+    async def test_blank_documents_skip_ai_call(self, normalizer):
+        normalizer.claude_client.complete_json.return_value = [_make_raw_requirement()]
+        blank = ParsedContent(
+            raw_text="  \n ",
+            metadata=InputMetadata(filename="blank.txt"),
+            sections=[{"title": "빈 섹션", "content": ["", "  "]}],
+        )
+
+        requirements = await normalizer.normalize([_make_parsed("확인"), blank])
+
+        normalizer.claude_client.complete_json.assert_not_awaited()
+        assert requirements == []
+
+    @pytest.mark.asyncio
+    async def test_short_text_with_section_content_still_extracted(self, normalizer):
+        normalizer.claude_client.complete_json.return_value = [_make_raw_requirement()]
+        parsed = ParsedContent(
+            raw_text="표",
+            metadata=InputMetadata(filename="sheet.xlsx"),
+            sections=[{"title": "Sheet1", "content": "사용자는 이메일로 로그인할 수 있어야 한다"}],
+        )
+
+        requirements = await normalizer._extract_and_normalize_all(parsed, "sheet.xlsx", "d")
+
+        normalizer.claude_client.complete_json.assert_awaited_once()
+        assert len(requirements) == 1
+
+    @pytest.mark.asyncio
+    async def test_skipped_document_keeps_numbering_of_others(self, normalizer):
+        normalizer.claude_client.complete_json.return_value = [_make_raw_requirement()]
+        docs = [_make_parsed(""), _make_parsed("가" * 5000)]
+
+        requirements = await normalizer.normalize(docs, document_ids=["empty", "full"])
+
+        assert [r.source_info.document_id for r in requirements] == ["full"]
+        assert [r.id for r in requirements] == ["REQ-001"]
+
+
+# ===================================================================
+# normalize: 같은 문서 중복 제거
+# ===================================================================
+
+class TestDuplicateDocuments:
+    @staticmethod
+    def _named(raw_text: str, filename: str) -> ParsedContent:
+        return ParsedContent(
+            raw_text=raw_text, metadata=InputMetadata(filename=filename), sections=[]
+        )
+
+    @pytest.mark.asyncio
+    async def test_identical_documents_extracted_once(self, normalizer):
+        normalizer.claude_client.complete_json.return_value = [
+            _make_raw_requirement(section_name="인증")
+        ]
+        text = "가" * 5000  # 묶음 예산보다 커서 문서마다 따로 호출되는 크기
+
+        requirements = await normalizer.normalize(
+            [self._named(text, "a.txt"), self._named(text, "b.txt")],
+            document_ids=["doc-a", "doc-b"],
+        )
+
+        assert normalizer.claude_client.complete_json.await_count == 1
+        assert [r.id for r in requirements] == ["REQ-001", "REQ-002"]
+        assert [r.source_info.document_id for r in requirements] == ["doc-a", "doc-b"]
+        assert [r.source_info.filename for r in requirements] == ["a.txt", "b.txt"]
+        assert requirements[1].source_reference == "b.txt [인증]"
+        assert requirements[0] is not requirements[1]
+
+    @pytest.mark.asyncio
+    async def test_duplicates_keep_document_order(self, normalizer):
+        async def extract(system_prompt, user_prompt, **kwargs):
+            title = "A" if "첫 문서" in user_prompt else "B"
+            return [_make_raw_requirement(title=title)]
+
+        normalizer.claude_client.complete_json.side_effect = extract
+        first = "첫 문서" + "가" * 5000
+        second = "둘째 문서" + "가" * 5000
+
+        requirements = await normalizer.normalize([
+            self._named(first, "1"), self._named(second, "2"), self._named(first, "3"),
+        ])
+
+        assert normalizer.claude_client.complete_json.await_count == 2
+        assert [(r.title, r.source_info.filename) for r in requirements] == [
+            ("A", "1"), ("B", "2"), ("A", "3"),
+        ]
+
+
+# ===================================================================
+# normalize: Message Batches 모드
+# ===================================================================
+
+class TestMessageBatchMode:
+    @pytest.fixture
+    def batch_client(self):
+        client = AsyncMock()
+        client.model = "claude-test"
+        client.complete_json_batch.return_value = {}
+        return client
+
+    @pytest.fixture
+    def batch_normalizer(self, batch_client):
+        return Normalizer(claude_client=AsyncMock(), batch_client=batch_client)
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_default(self, batch_normalizer, batch_client):
+        batch_normalizer.claude_client.complete_json.return_value = []
+        await batch_normalizer.normalize([_make_parsed("로그인 요구사항 문서")])
+        batch_client.complete_json_batch.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_all_documents_sent_in_one_batch(self, batch_normalizer, batch_client):
+        batch_client.complete_json_batch.return_value = {
+            "doc-1": [_make_raw_requirement(title="A")],
+            "doc-2": {"requirements": [_make_raw_requirement(title="B")]},
+        }
+
+        requirements = await batch_normalizer.normalize(
+            [_make_parsed("첫 번째 요구사항 문서"), _make_parsed("두 번째 요구사항 문서")],
+            batch_mode=True,
+        )
+
+        batch_normalizer.claude_client.complete_json.assert_not_awaited()
+        requests = batch_client.complete_json_batch.await_args.args[0]
+        assert set(requests) == {"doc-1", "doc-2"}
+        assert requests["doc-1"][0] is EXTRACTION_SYSTEM_PROMPT
+        assert [r.title for r in requirements] == ["A", "B"]
+        assert [r.id for r in requirements] == ["REQ-001", "REQ-002"]
+
+    @pytest.mark.asyncio
+    async def test_missing_result_uses_content_fallback(self, batch_normalizer):
+        requirements = await batch_normalizer.normalize(
+            [_make_parsed("## 로그인\n사용자는 이메일로 로그인한다")],
+            batch_mode=True,
+        )
+        assert [r.title for r in requirements] == ["로그인"]
+
+    @pytest.mark.asyncio
+    async def test_cached_documents_not_resubmitted(self, batch_normalizer, batch_client):
+        batch_client.complete_json_batch.return_value = {
+            "doc-1": [_make_raw_requirement(title="A")],
+        }
+        await batch_normalizer.normalize([_make_parsed("로그인 요구사항 문서")], batch_mode=True)
+        requirements = await batch_normalizer.normalize([_make_parsed("로그인 요구사항 문서")], batch_mode=True)
+
+        assert batch_client.complete_json_batch.await_count == 1
+        assert [r.title for r in requirements] == ["A"]
+
+    @pytest.mark.asyncio
+    async def test_cache_not_shared_with_cli_results(self, batch_normalizer, batch_client):
+        # 배치 요청은 CLI와 프롬프트 구성이 달라 같은 문서라도 결과를 서로 재사용하지 않음
+        batch_normalizer.claude_client.complete_json.return_value = [_make_raw_requirement(title="CLI")]
+        batch_client.complete_json_batch.return_value = {"doc-1": [_make_raw_requirement(title="배치")]}
+        docs = [_make_parsed("로그인 요구사항 문서")]
+
+        cli_requirements = await batch_normalizer.normalize(docs)
+        batch_requirements = await batch_normalizer.normalize(docs, batch_mode=True)
+
+        assert batch_client.complete_json_batch.await_count == 1
+        assert [r.title for r in cli_requirements] == ["CLI"]
+        assert [r.title for r in batch_requirements] == ["배치"]
+
+    @pytest.mark.asyncio
+    async def test_cache_keyed_by_batch_model(self, batch_normalizer, batch_client):
+        batch_client.complete_json_batch.return_value = {"doc-1": [_make_raw_requirement(title="A")]}
+        docs = [_make_parsed("로그인 요구사항 문서")]
+
+        await batch_normalizer.normalize(docs, batch_mode=True)
+        batch_client.model = "claude-other"
+        await batch_normalizer.normalize(docs, batch_mode=True)
+
+        assert batch_client.complete_json_batch.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_batch_failure_falls_back_to_cli(self, batch_normalizer, batch_client):
+        batch_client.complete_json_batch.side_effect = RuntimeError("API 오류")
+        batch_normalizer.claude_client.complete_json.return_value = [
+            _make_raw_requirement(title="A")
+        ]
+
+        requirements = await batch_normalizer.normalize([_make_parsed("로그인 요구사항 문서")], batch_mode=True)
+
+        assert [r.title for r in requirements] == ["A"]
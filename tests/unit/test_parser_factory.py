@@ -6,8 +6,10 @@ ParserFactory is responsible for:
 - Detecting InputType from filenames and MIME content types
 """
 
+import asyncio
+
 import pytest
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, patch
 
 from app.models import InputType
 from app.layers.layer1_parsing.parser_factory import ParserFactory
@@ -151,3 +153,36 @@ class TestDetectTypeByContentType:
         """When content_type is provided and matches, it should override extension."""
         result = factory.detect_type("data.txt", content_type="application/pdf")
         assert result == InputType.DOCUMENT
+
+
+# ---- parse_files parses several files concurrently ----
+
+class TestParseFiles:
+    @pytest.mark.asyncio
+    async def test_results_keep_input_order(self, factory, tmp_path):
+        paths = []
+        for name in ("a.md", "b.txt", "c.md"):
+            path = tmp_path / name
+            path.write_text(f"# {name}\n내용", encoding="utf-8")
+            paths.append(path)
+
+        results = await factory.parse_files(paths)
+        assert [r.sections[0]["title"] for r in results] == ["a.md", "b.txt", "c.md"]
+
+    @pytest.mark.asyncio
+    async def test_failure_is_returned_in_place(self, factory, tmp_path):
+        ok = tmp_path / "ok.md"
+        ok.write_text("# 정상", encoding="utf-8")
+        missing = tmp_path / "missing.md"
+
+        results = await factory.parse_files([missing, ok], [InputType.TEXT, InputType.TEXT])
+        assert isinstance(results[0], Exception)
+        assert results[1].sections[0]["title"] == "정상"
+
+    @pytest.mark.asyncio
+    async def test_cancellation_is_raised_not_returned(self, factory, tmp_path):
+        path = tmp_path / "a.md"
+        path.write_text("# 제목", encoding="utf-8")
+        with patch.object(factory, "parse_file", AsyncMock(side_effect=asyncio.CancelledError)):
+            with pytest.raises(asyncio.CancelledError):
+                await factory.parse_files([path], [InputType.TEXT])
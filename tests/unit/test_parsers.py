@@ -0,0 +1,466 @@
+"""Layer 1 parser unit tests.
+
+Tests the pure/synchronous helpers of individual parsers without AI calls:
+- EmailParser._basic_analysis: fallback analysis built from the mail object
+- ExcelParser large-file path: row cap and skipped column statistics
+- ImageParser._downscale_for_vision: shrink oversized images before Vision
+- ImageParser._analyze_with_vision: JSON answer parsing and text fallback
+- PPTParser slide extraction: slide order, titles and notes
+- ppt_parser._table_text: cell text read straight from the table XML
+- TextParser.detect_structure: markdown/setext headers and code blocks
+- ClaudeAnalysisMixin: token-budgeted prompts, shared call limit, result cache
+  (in memory and, when enabled, in the file cache)
+"""
+
+import io
+
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+from app.layers.layer1_parsing.parsers.email_parser import EmailParser
+from app.layers.layer1_parsing.parsers.excel_parser import ExcelParser
+from app.layers.layer1_parsing.parsers.image_parser import ImageParser, VISION_MAX_DIMENSION
+from app.layers.layer1_parsing.parsers.ppt_parser import PPTParser, _table_text
+from app.layers.layer1_parsing.parsers.text_parser import TextParser
+from app.layers.layer1_parsing.mixins import ClaudeAnalysisMixin
+
+
+def _make_mail(**overrides) -> SimpleNamespace:
+    """Helper to build a mailparser-like object with sensible defaults."""
+    defaults = dict(
+        subject="로그인 기능 요청",
+        from_=[("홍길동", "hong@example.com")],
+        to=[("개발팀", "dev@example.com")],
+        cc=[],
+        date=None,
+        body="로그인 기능이 필요합니다.",
+        attachments=[],
+    )
+    defaults.update(overrides)
+    return SimpleNamespace(**defaults)
+
+
+# ===================================================================
+# EmailParser._basic_analysis tests
+# ===================================================================
+
+class TestEmailBasicAnalysis:
+    def test_subject_and_sender_from_mail(self):
+        result = EmailParser()._basic_analysis(_make_mail())
+        assert result["thread_summary"] == "로그인 기능 요청"
+        assert result["participants"] == [
+            {"email": "hong@example.com", "inferred_role": "unknown"}
+        ]
+
+    def test_missing_subject_and_sender(self):
+        result = EmailParser()._basic_analysis(_make_mail(subject=None, from_=[]))
+        assert result["thread_summary"] == ""
+        assert result["participants"] == []
+
+    @pytest.mark.asyncio
+    async def test_analyze_email_without_client_uses_basic_analysis(self):
+        parser = EmailParser()
+        result = await parser._analyze_email(_make_mail(), "raw text")
+        assert result["thread_summary"] == "로그인 기능 요청"
+
+
+# ===================================================================
+# ExcelParser large-file path tests
+# ===================================================================
+
+class TestExcelLargeFile:
+    @pytest.mark.asyncio
+    async def test_large_csv_reads_capped_rows_without_stats(self, tmp_path):
+        csv_path = tmp_path / "reqs.csv"
+        csv_path.write_text(
+            "기능,우선순위\n" + "".join(f"기능{i},HIGH\n" for i in range(20)),
+            encoding="utf-8",
+        )
+
+        with patch("app.layers.layer1_parsing.parsers.excel_parser.LARGE_FILE_BYTES", 0), \
+                patch("app.layers.layer1_parsing.parsers.excel_parser.LARGE_FILE_MAX_ROWS", 5):
+            result = await ExcelParser().parse(csv_path)
+
+        assert result.structured_data["truncated_rows"] == 5
+        assert result.structured_data["sheets"]["Sheet1"]["row_count"] == 5
+        column = result.structured_data["sheets"]["Sheet1"]["columns"][0]
+        assert "unique_count" not in column
+        assert "기능4" in result.raw_text
+        assert "기능5" not in result.raw_text
+        # 섹션은 본문에 쓰인 렌더링 결과를 그대로 재사용
+        assert result.sections[0]["content"] in result.raw_text
+
+
+# ===================================================================
+# ImageParser._downscale_for_vision tests
+# ===================================================================
+
+def _make_png(width: int, height: int) -> bytes:
+    from PIL import Image
+
+    buf = io.BytesIO()
+    Image.new("RGB", (width, height), "white").save(buf, format="PNG")
+    return buf.getvalue()
+
+
+class TestImageDownscale:
+    def test_small_image_is_left_alone(self):
+        assert ImageParser()._downscale_for_vision(_make_png(100, 50), "image/png") is None
+
+    def test_large_image_shrunk_to_max_dimension(self):
+        from PIL import Image
+
+        data, media_type = ImageParser()._downscale_for_vision(
+            _make_png(4000, 2000), "image/png"
+        )
+        assert media_type == "image/png"
+        assert Image.open(io.BytesIO(data)).size == (VISION_MAX_DIMENSION, VISION_MAX_DIMENSION // 2)
+
+    def test_invalid_data_returns_none(self):
+        assert ImageParser()._downscale_for_vision(b"not an image", "image/png") is None
+
+
+class TestImageVisionResponse:
+    async def _analyze(self, response: str) -> dict:
+        client = SimpleNamespace(analyze_image=AsyncMock(return_value=response))
+        return await ImageParser(claude_client=client)._analyze_with_vision(
+            _make_png(10, 10), "image/png"
+        )
+
+    @pytest.mark.asyncio
+    async def test_json_with_surrounding_text_is_parsed(self):
+        response = '분석 결과입니다.\n```json\n{"image_type": "wireframe", "ui_elements": []}\n```\n참고: {주석}'
+        result = await self._analyze(response)
+        assert result == {"image_type": "wireframe", "ui_elements": []}
+
+    @pytest.mark.asyncio
+    async def test_plain_text_answer_kept_as_extracted_text(self):
+        result = await self._analyze("로그인 화면 스케치입니다.")
+        assert result["image_type"] == "unknown"
+        assert result["extracted_text"] == "로그인 화면 스케치입니다."
+
+    @pytest.mark.asyncio
+    async def test_text_with_braces_skips_json_parser(self, caplog):
+        response = "설정 화면에 {사용자 이름} 자리표시자가 있습니다."
+        with caplog.at_level("DEBUG", logger="app.services.claude_client"):
+            result = await self._analyze(response)
+        assert result["extracted_text"] == response
+        assert "[JSON]" not in caplog.text
+
+
+# ===================================================================
+# PPTParser slide extraction tests
+# ===================================================================
+
+@pytest.fixture
+def pptx_file(tmp_path):
+    """Build a small deck with a titled slide per requirement."""
+    from pptx import Presentation
+
+    prs = Presentation()
+    for i in range(12):
+        slide = prs.slides.add_slide(prs.slide_layouts[1])
+        slide.shapes.title.text = f"요구사항 {i + 1}"
+        slide.placeholders[1].text = f"슬라이드 {i + 1} 본문 내용"
+        slide.notes_slide.notes_text_frame.text = f"노트 {i + 1}"
+
+    path = tmp_path / "deck.pptx"
+    prs.save(str(path))
+    return path
+
+
+class TestPPTSlideExtraction:
+    @pytest.mark.asyncio
+    async def test_extraction_preserves_order(self, pptx_file):
+        result = await PPTParser().parse(pptx_file)
+        slides = result.structured_data["slides"]
+        assert [s["number"] for s in slides] == list(range(1, 13))
+        assert [s["title"] for s in slides] == [f"요구사항 {i}" for i in range(1, 13)]
+        assert slides[0]["notes"] == "노트 1"
+        assert not any(s["has_images"] for s in slides)
+
+    @pytest.mark.asyncio
+    async def test_claude_analysis_attached(self, pptx_file):
+        client = SimpleNamespace(complete_json=AsyncMock(return_value={"topics": ["로그인"]}))
+        result = await PPTParser(claude_client=client).parse(pptx_file)
+        assert result.structured_data["ai_analysis"] == {"topics": ["로그인"]}
+        assert "요구사항 1" in client.complete_json.call_args.kwargs["user_prompt"]
+
+    @pytest.mark.asyncio
+    async def test_claude_failure_falls_back(self, pptx_file):
+        client = SimpleNamespace(complete_json=AsyncMock(side_effect=RuntimeError("timeout")))
+        result = await PPTParser(claude_client=client).parse(pptx_file)
+        assert result.structured_data["ai_analysis"]["analysis_source"] == "슬라이드 내용 직접 분석"
+
+    def test_has_images_detected(self, tmp_path):
+        from pptx import Presentation
+        from pptx.util import Inches
+
+        image_path = tmp_path / "logo.png"
+        image_path.write_bytes(_make_png(10, 10))
+
+        prs = Presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[1])
+        slide.shapes.title.text = "화면 설계"
+        slide.shapes.add_picture(str(image_path), Inches(1), Inches(1))
+
+        info = PPTParser()._extract_slide_content(slide, 1)
+        assert info["has_images"] is True
+        assert info["title"] == "화면 설계"
+
+    def test_slide_text_read_from_xml_matches_python_pptx(self):
+        from pptx import Presentation
+        from pptx.util import Inches
+
+        prs = Presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[1])
+        slide.shapes.title.text = "제목\v둘째 줄"
+        box = slide.shapes.add_textbox(Inches(1), Inches(1), Inches(2), Inches(1))
+        box.text_frame.text = "  상자 본문\n두 번째 문단  "
+        group = slide.shapes.add_group_shape()
+        group.shapes.add_textbox(0, 0, 10, 10).text_frame.text = "그룹 안 텍스트"
+
+        info = PPTParser()._extract_slide_content(slide, 1)
+        assert info["title"] == slide.shapes.title.text_frame.text
+        assert info["content"] == box.text_frame.text.strip()
+        assert "그룹 안" not in info["content"]
+
+    def test_table_text_matches_cell_text(self):
+        from pptx import Presentation
+        from pptx.util import Inches
+
+        prs = Presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        table = slide.shapes.add_table(2, 2, Inches(1), Inches(1), Inches(4), Inches(1)).table
+        table.cell(0, 0).text = "기능"
+        table.cell(0, 1).text = "우선\v 순위"
+        table.cell(1, 0).text = " 로그인\n소셜 로그인 "
+        cell = table.cell(1, 1)
+        cell.text = "HI"
+        cell.text_frame.paragraphs[0].add_run().text = "GH"
+
+        expected = "\n".join(
+            " | ".join(c.text.strip() for c in row.cells) for row in table.rows
+        )
+        assert _table_text(table._tbl) == expected
+        assert "HIGH" in expected
+
+
+# ===================================================================
+# TextParser.detect_structure tests
+# ===================================================================
+
+class TestTextDetectStructure:
+    @pytest.mark.asyncio
+    async def test_markdown_headers_and_levels(self):
+        content = "# 개요\n설명\n## 기능\n로그인\n### 세부\n내용"
+        result = await TextParser().detect_structure(content)
+        sections = result["sections"]
+        assert [(s["title"], s["level"]) for s in sections] == [
+            ("개요", 1), ("기능", 2), ("세부", 3),
+        ]
+        assert sections[1]["content"] == "로그인"
+        assert result["line_count"] == 6
+        assert result["char_count"] == len(content)
+
+    @pytest.mark.asyncio
+    async def test_setext_headers_take_previous_line_as_title(self):
+        content = "# 문서\n제목\n====\n본문\n\n부제목\n----\n상세"
+        sections = (await TextParser().detect_structure(content))["sections"]
+        assert [(s["title"], s["level"], s["start_line"]) for s in sections] == [
+            ("문서", 1, 0), ("제목", 1, 1), ("부제목", 2, 5),
+        ]
+        assert sections[0]["content"] == ""
+        assert sections[1]["content"] == "본문\n"
+        assert sections[2]["content"] == "상세"
+
+    @pytest.mark.asyncio
+    async def test_headers_inside_code_block_are_content(self):
+        content = "# 설정\n```\n# 주석\n```\n끝"
+        sections = (await TextParser().detect_structure(content))["sections"]
+        assert len(sections) == 1
+        # 코드 블록 구분자(```) 줄은 본문에 넣지 않음
+        assert sections[0]["content"] == "# 주석\n끝"
+
+    @pytest.mark.asyncio
+    async def test_code_block_before_first_header_is_skipped(self):
+        content = "```\n# 주석\n```\n\n서문\n# 본론"
+        sections = (await TextParser().detect_structure(content))["sections"]
+        assert [(s["title"], s["start_line"], s["content"]) for s in sections] == [
+            ("Introduction", 4, "서문"), ("본론", 5, ""),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_leading_text_becomes_introduction(self):
+        content = "서문\n# 본론\n내용"
+        sections = (await TextParser().detect_structure(content))["sections"]
+        assert sections[0]["title"] == "Introduction"
+        assert sections[0]["content"] == "서문"
+        assert sections[1]["title"] == "본론"
+
+    @pytest.mark.asyncio
+    async def test_underline_without_title_is_not_header(self):
+        content = "---\n서문\n\n---\n# 본론\n```\n제목\n---\n```"
+        result = await TextParser().detect_structure(content)
+        assert [(s["title"], s["start_line"], s["content"]) for s in result["sections"]] == [
+            ("Introduction", 0, "---\n서문\n"),
+            ("본론", 4, "제목\n---"),
+        ]
+        assert result["line_count"] == 9
+
+    @pytest.mark.parametrize("content, expected", [
+        # 본문 중간, 헤더 직전, 문서 끝(줄바꿈 있음/없음) 모두 밑줄 줄만 빠짐
+        ("# A\nfoo\n\n---\nmore\n# B\nbar", "foo\n\nmore"),
+        ("# A\nfoo\n\n---\n# B", "foo\n"),
+        ("# A\nfoo\n\n---\n", "foo\n\n"),
+        ("# A\nfoo\n\n---", "foo\n"),
+        ("# A\n\n===\nfoo\n\n---\nbar", "\nfoo\n\nbar"),
+    ])
+    @pytest.mark.asyncio
+    async def test_rejected_underline_lines_always_dropped(self, content, expected):
+        """Underlines that are not headers are cut from the body wherever they appear."""
+        sections = (await TextParser().detect_structure(content))["sections"]
+        assert sections[0]["content"] == expected
+
+    @pytest.mark.asyncio
+    async def test_parse_reads_file_into_sections(self, tmp_path):
+        path = tmp_path / "spec.md"
+        path.write_text("# 로그인\n이메일 로그인 지원\n", encoding="utf-8")
+        result = await TextParser().parse(path)
+        assert result.raw_text == "# 로그인\n이메일 로그인 지원\n"
+        assert result.sections[0] == {"title": "로그인", "content": "이메일 로그인 지원\n"}
+        assert result.structured_data["is_markdown"] is True
+
+    @pytest.mark.asyncio
+    async def test_large_file_read_matches_text_mode(self, tmp_path):
+        path = tmp_path / "spec.md"
+        path.write_bytes("# 로그인\r\n이메일\r로그인\n".encode("utf-8") + b"\xff")
+        expected = (await TextParser().parse(path)).raw_text
+
+        with patch("app.layers.layer1_parsing.parsers.text_parser.LARGE_FILE_BYTES", 0):
+            result = await TextParser().parse(path)
+        assert result.raw_text == expected == "# 로그인\n이메일\n로그인\n"
+
+    @pytest.mark.asyncio
+    async def test_large_file_path_handles_empty_file(self, tmp_path):
+        path = tmp_path / "empty.txt"
+        path.write_bytes(b"")
+        with patch("app.layers.layer1_parsing.parsers.text_parser.LARGE_FILE_BYTES", -1):
+            result = await TextParser().parse(path)
+        assert result.raw_text == ""
+
+
+# ===================================================================
+# ClaudeAnalysisMixin tests
+# ===================================================================
+
+class _Analyzer(ClaudeAnalysisMixin):
+    def __init__(self):
+        self.claude_client = SimpleNamespace(complete_json=AsyncMock(return_value=[]))
+
+
+class TestClaudeAnalysisMixin:
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_call_limit(self):
+        import asyncio
+        from app.layers.layer1_parsing import mixins
+
+        running = peak = 0
+
+        async def slow_complete_json(**kwargs):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return {}
+
+        analyzers = [_Analyzer() for _ in range(6)]
+        for analyzer in analyzers:
+            analyzer.claude_client.complete_json = slow_complete_json
+
+        settings = SimpleNamespace(parser_claude_concurrency=2, parser_result_cache=False)
+        with patch.object(mixins, "get_settings", return_value=settings), \
+                patch.object(mixins, "_claude_semaphores", {}):
+            await asyncio.gather(*[a.request_claude_json("시스템", "내용") for a in analyzers])
+
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_content_truncated_by_token_budget(self):
+        analyzer = _Analyzer()
+        await analyzer.analyze_with_claude("가" * 100, "문서: {content}", max_content_tokens=10)
+        prompt = analyzer.claude_client.complete_json.call_args.kwargs["user_prompt"]
+        assert prompt == "문서: " + "가" * 10
+
+    @pytest.mark.asyncio
+    async def test_extract_requirements_fills_content_and_context(self):
+        analyzer = _Analyzer()
+        await analyzer.extract_requirements_with_claude("로그인 기능", "{중요} 고객 요청")
+        prompt = analyzer.claude_client.complete_json.call_args.kwargs["user_prompt"]
+        assert "로그인 기능" in prompt
+        assert "추가 컨텍스트: {중요} 고객 요청" in prompt
+        assert '"title"' in prompt
+
+    @pytest.mark.asyncio
+    async def test_repeated_request_served_from_cache(self):
+        analyzer = _Analyzer()
+        analyzer.claude_client.complete_json.return_value = {"topics": ["로그인"]}
+        first = await analyzer.request_claude_json("시스템", "같은 문서")
+        second = await analyzer.request_claude_json("시스템", "같은 문서")
+        assert first == second == {"topics": ["로그인"]}
+        analyzer.claude_client.complete_json.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_empty_result_is_not_cached(self):
+        analyzer = _Analyzer()
+        await analyzer.request_claude_json("시스템", "문서")
+        await analyzer.request_claude_json("시스템", "문서")
+        assert analyzer.claude_client.complete_json.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_file_cache_shared_across_parsers(self, tmp_path):
+        """With parser_result_cache on, a new parser instance reuses the stored result."""
+        from app.layers.layer1_parsing import mixins
+        from app.services import FileCache
+
+        settings = SimpleNamespace(parser_claude_concurrency=2, parser_result_cache=True)
+        file_cache = FileCache(cache_dir=tmp_path)
+        first, second = _Analyzer(), _Analyzer()
+        first.claude_client.complete_json.return_value = {"topics": ["로그인"]}
+        with patch.object(mixins, "get_settings", return_value=settings), \
+                patch.object(mixins, "get_file_cache", return_value=file_cache):
+            await first.request_claude_json("시스템", "같은 문서")
+            result = await second.request_claude_json("시스템", "같은 문서")
+
+        assert result == {"topics": ["로그인"]}
+        second.claude_client.complete_json.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_file_cache_unused_by_default(self):
+        from app.layers.layer1_parsing import mixins
+
+        analyzer = _Analyzer()
+        with patch.object(mixins, "get_file_cache") as get_cache:
+            await analyzer.request_claude_json("시스템", "문서")
+        get_cache.assert_not_called()
+
+    def test_short_content_is_not_worth_analyzing(self):
+        analyzer = _Analyzer()
+        assert not analyzer.should_analyze_with_claude("제목 슬라이드" + " " * 500)
+        assert analyzer.should_analyze_with_claude("요구사항 " * 100)
+
+    @pytest.mark.asyncio
+    async def test_title_only_deck_skips_claude(self, tmp_path):
+        from pptx import Presentation
+
+        prs = Presentation()
+        prs.slides.add_slide(prs.slide_layouts[0]).shapes.title.text = "킥오프"
+        path = tmp_path / "title.pptx"
+        prs.save(str(path))
+
+        client = SimpleNamespace(complete_json=AsyncMock(return_value={"topics": []}))
+        result = await PPTParser(claude_client=client).parse(path)
+        client.complete_json.assert_not_awaited()
+        assert result.structured_data["ai_analysis"]["analysis_source"] == "슬라이드 내용 직접 분석"
@@ -0,0 +1,62 @@
+"""Unit tests for prompt token budget utilities.
+
+Tests the local token estimate and token-budgeted truncation used
+when building Claude prompts. Pure unit tests, no AI dependencies.
+"""
+
+from app.utils.tokens import TRUNCATE_SCAN_CHUNK_CHARS, estimate_tokens, truncate_to_tokens
+
+
+class TestEstimateTokens:
+    def test_empty_text_is_zero(self):
+        assert estimate_tokens("") == 0
+
+    def test_ascii_text_counts_four_chars_per_token(self):
+        assert estimate_tokens("abcd" * 10) == 10
+
+    def test_partial_ascii_token_rounds_up(self):
+        assert estimate_tokens("abcde") == 2
+
+    def test_korean_counts_one_token_per_char(self):
+        assert estimate_tokens("요구사항") == 4
+
+    def test_mixed_text(self):
+        assert estimate_tokens("로그인 login") == 3 + 2
+
+
+class TestTruncateToTokens:
+    def test_short_text_returned_unchanged(self):
+        text = "짧은 문서"
+        assert truncate_to_tokens(text, 100) is text
+
+    def test_ascii_text_keeps_more_chars_than_budget(self):
+        text = "a" * 1000
+        result = truncate_to_tokens(text, 100)
+        assert len(result) == 400
+        assert estimate_tokens(result) <= 100
+
+    def test_korean_text_cut_at_budget(self):
+        text = "가" * 1000
+        result = truncate_to_tokens(text, 100)
+        assert result == "가" * 100
+
+    def test_mixed_text_stays_within_budget(self):
+        text = ("요구사항 requirement " * 200)
+        result = truncate_to_tokens(text, 150)
+        assert text.startswith(result)
+        assert estimate_tokens(result) <= 150
+        assert estimate_tokens(text[:len(result) + 1]) > 150
+
+    def test_non_positive_budget_returns_empty(self):
+        assert truncate_to_tokens("abc", 0) == ""
+
+    def test_very_long_text_cut_without_counting_everything(self):
+        text = "a" * 1000 + "가" * 100000
+        result = truncate_to_tokens(text, 300)
+        assert result == "a" * 1000 + "가" * 50
+
+    def test_cut_inside_later_chunk_matches_budget(self):
+        text = "a" * (TRUNCATE_SCAN_CHUNK_CHARS + 3) + "가" * 5000
+        result = truncate_to_tokens(text, 1000)
+        assert estimate_tokens(result) <= 1000
+        assert estimate_tokens(text[:len(result) + 1]) > 1000
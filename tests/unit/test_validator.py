@@ -6,12 +6,16 @@ Tests the pure/synchronous validation logic without AI calls:
 - _check_traceability: scores source tracing quality (0.0-1.0)
 - _needs_pm_review: decides whether PM review is needed
 - _create_review_item: creates a ReviewItem with correct issue_type
+- validate: skips per-requirement scoring when PM review is disabled,
+  and starts conflict detection before the local checks
+- _detect_conflicts: reuses cached conflict results (AI client mocked)
 """
 
 import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
 
 from app.layers.layer3_validation.validator import Validator
+from app.services import FileCache
 from app.models import (
     NormalizedRequirement,
     RequirementType,
@@ -29,6 +33,7 @@ def mock_settings():
     settings.enable_pm_review = True
     settings.auto_approve_threshold = 0.8
     settings.enable_conflict_detection = False
+    settings.conflict_result_cache = False
     return settings
 
 
@@ -167,6 +172,16 @@ class TestCheckConsistency:
         issues = validator._check_consistency(req)
         assert len(issues) >= 2  # at least one vague + one missing
 
+    def test_overlapping_vague_terms_reported_in_order(self, validator):
+        """'등등' also contains '등', so both terms are reported, in list order."""
+        req = _make_requirement(description="Excel, CSV 등등 ETC 형식 지원")
+        issues = validator._check_consistency(req)
+        assert issues == [
+            "모호한 표현 사용: '등'",
+            "모호한 표현 사용: 'etc'",
+            "모호한 표현 사용: '등등'",
+        ]
+
 
 # ===================================================================
 # _check_traceability tests
@@ -366,3 +381,134 @@ class TestCreateReviewItem:
         item = validator._create_review_item(req, validation, "job-6")
 
         assert item.suggested_resolution == "Needs clarification from stakeholder"
+
+
+# ===================================================================
+# validate tests
+# ===================================================================
+
+class TestValidate:
+    @pytest.mark.asyncio
+    async def test_pm_review_disabled_approves_without_scoring(self, validator, mock_settings):
+        mock_settings.enable_pm_review = False
+        reqs = [_make_requirement(id="REQ-001"), _make_requirement(id="REQ-002", confidence_score=0.1)]
+
+        with patch.object(validator, "_validate_requirement") as validate_one:
+            validated, review_items = await validator.validate(reqs, job_id="job-1")
+
+        validate_one.assert_not_called()
+        assert validated == reqs
+        assert review_items == []
+
+    @pytest.mark.asyncio
+    async def test_pm_review_enabled_splits_by_review_need(self, validator, mock_settings):
+        mock_settings.enable_pm_review = True
+        good = _make_requirement(id="REQ-001")
+        weak = _make_requirement(id="REQ-002", confidence_score=0.3)
+
+        validated, review_items = await validator.validate([good, weak], job_id="job-2")
+
+        assert validated == [good]
+        assert [item.requirement_id for item in review_items] == ["REQ-002"]
+        assert review_items[0].job_id == "job-2"
+
+    @pytest.mark.asyncio
+    async def test_conflict_detection_overlaps_local_checks(self, validator, mock_settings):
+        """The conflict call is already waiting on Claude while requirements are scored."""
+        import asyncio
+
+        mock_settings.enable_pm_review = True
+        events = []
+        conflict = validator._create_review_item(
+            _make_requirement(id="REQ-002", confidence_score=0.3),
+            ValidationResult(requirement_id="REQ-002", is_valid=False, completeness_score=1.0,
+                             traceability_score=1.0, needs_pm_review=True),
+            "",
+        )
+
+        async def detect_conflicts(requirements):
+            events.append("conflicts-start")
+            await asyncio.sleep(0)
+            events.append("conflicts-end")
+            return [conflict]
+
+        original = validator._validate_requirement
+
+        def validate_one(req, all_requirements):
+            events.append("local")
+            return original(req, all_requirements)
+
+        with patch.object(validator, "_detect_conflicts", detect_conflicts), \
+                patch.object(validator, "_validate_requirement", validate_one):
+            _, review_items = await validator.validate([_make_requirement()], job_id="job-3")
+
+        assert events == ["conflicts-start", "local", "conflicts-end"]
+        assert review_items == [conflict]
+        assert conflict.job_id == "job-3"
+
+
+# ===================================================================
+# _detect_conflicts result cache tests
+# ===================================================================
+
+class TestConflictResultCache:
+    def _make_validator(self, mock_settings, client, cache):
+        mock_settings.enable_conflict_detection = True
+        with patch("app.layers.layer3_validation.validator.get_settings", return_value=mock_settings):
+            return Validator(claude_client=client, result_cache=cache)
+
+    def _requirements(self):
+        return [
+            _make_requirement(id="REQ-001"),
+            _make_requirement(id="REQ-002", title="Guest checkout", description="Orders without an account"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_same_requirements_reuse_result_across_validators(self, mock_settings, tmp_path):
+        """A second validator with the same cache does not call Claude again."""
+        client = AsyncMock()
+        client.complete_json.return_value = {"conflicts": [
+            {"req1_id": "REQ-001", "req2_id": "REQ-002", "conflict_type": "자원 충돌", "description": "충돌"}
+        ]}
+
+        first = self._make_validator(mock_settings, client, FileCache(cache_dir=tmp_path))
+        second = self._make_validator(mock_settings, client, FileCache(cache_dir=tmp_path))
+        items1 = await first._detect_conflicts(self._requirements())
+        items2 = await second._detect_conflicts(self._requirements())
+
+        assert client.complete_json.await_count == 1
+        assert [item.original_text for item in items2] == [item.original_text for item in items1]
+        assert items2[0].issue_type == ReviewItemType.CONFLICT
+
+    @pytest.mark.asyncio
+    async def test_empty_conflict_list_is_cached(self, mock_settings, tmp_path):
+        client = AsyncMock()
+        client.complete_json.return_value = {"conflicts": []}
+        v = self._make_validator(mock_settings, client, FileCache(cache_dir=tmp_path))
+
+        assert await v._detect_conflicts(self._requirements()) == []
+        assert await v._detect_conflicts(self._requirements()) == []
+        assert client.complete_json.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_unparsed_response_not_cached(self, mock_settings, tmp_path):
+        """An empty response (no JSON) is retried on the next run."""
+        client = AsyncMock()
+        client.complete_json.return_value = {}
+        v = self._make_validator(mock_settings, client, FileCache(cache_dir=tmp_path))
+
+        await v._detect_conflicts(self._requirements())
+        await v._detect_conflicts(self._requirements())
+        assert client.complete_json.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_changed_requirements_call_claude_again(self, mock_settings, tmp_path):
+        client = AsyncMock()
+        client.complete_json.return_value = {"conflicts": []}
+        v = self._make_validator(mock_settings, client, FileCache(cache_dir=tmp_path))
+
+        await v._detect_conflicts(self._requirements())
+        changed = self._requirements()
+        changed[1] = _make_requirement(id="REQ-002", title="Guest checkout", description="Orders need phone auth")
+        await v._detect_conflicts(changed)
+        assert client.complete_json.await_count == 2